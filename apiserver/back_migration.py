@@ -83,22 +83,6 @@ def update_user_empty_password():
         print("Failed")
 
 
-def updated_issue_sort_order():
-    try:
-        issues = Issue.objects.all()
-        updated_issues = []
-
-        for issue in issues:
-            issue.sort_order = issue.sequence_id * random.randint(100, 500)
-            updated_issues.append(issue)
-
-        Issue.objects.bulk_update(updated_issues, ["sort_order"], batch_size=100)
-        print("Success")
-    except Exception as e:
-        print(e)
-        print("Failed")
-
-
 def update_project_cover_images():
     try:
         project_cover_images = [
@@ -1,8 +1,12 @@
 # 引入第三方库：DRF的BasePermission类和SAFE_METHODS常量
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
-# 从应用的模型文件中导入WorkspaceMember和ProjectMember类
-from plane.db.models import WorkspaceMember, ProjectMember
+# 成员角色按请求解析一次并缓存，权限检查与查询集范围共享同一份结果
+from plane.utils.membership import (
+    workspace_role,
+    project_role,
+    is_project_member_in_workspace,
+)
 
 # 定义角色对应的权限等级，这有助于在权限逻辑中进行比较和判断
 Admin = 20
@@ -19,25 +23,14 @@ class ProjectBasePermission(BasePermission):
         # 允许安全方法（GET, HEAD, OPTIONS等）的请求，
         # 这些请求通常不会修改资源，因此被认为是"安全"的。
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user
-            ).exists()
+            return workspace_role(request, view.workspace_slug) is not None
 
         # 只允许工作空间的所有者或管理员创建项目。
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         # 只有项目管理员可以更新项目属性。
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) == Admin
 
 # 控制对项目成员操作的访问，定义项目成员权限类
 class ProjectMemberPermission(BasePermission):
@@ -48,24 +41,16 @@ class ProjectMemberPermission(BasePermission):
 
         # 对于安全方法，检查用户是否为项目成员。
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user
-            ).exists()
+            return is_project_member_in_workspace(request, view.workspace_slug)
         # 创建项目的权限控制与ProjectBasePermission相同。
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         # 更新项目属性时，允许管理员和成员操作。
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 # 定义对特定项目实体（如任务、文档等）的操作权限
 class ProjectEntityPermission(BasePermission):
@@ -76,19 +61,16 @@ class ProjectEntityPermission(BasePermission):
 
         # 对于安全方法，检查用户是否有权访问该项目实体。
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-            ).exists()
+            return (
+                project_role(request, view.workspace_slug, view.project_id)
+                is not None
+            )
 
         # 创建或编辑项目实体时，只允许项目成员或管理员操作。
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 # 每个方法都通过查询数据库来决定当前请求是否应该被授权。
 # 这涉及到检查请求者是否为特定工作空间或项目的成员、他们在其中担任什么角色（如管理员、普通成员等），
@@ -3,8 +3,8 @@
 # 第三方导入：从DRF导入BasePermission类和SAFE_METHODS常量
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
-# 模块导入：从当前项目的数据库模型中导入WorkspaceMember模型
-from plane.db.models import WorkspaceMember
+# 模块导入：按请求缓存的成员角色解析
+from plane.utils.membership import workspace_role
 
 # 权限映射：定义不同角色对应的权限等级
 Owner = 20
@@ -28,19 +28,13 @@ class WorkSpaceBasePermission(BasePermission):
             return True
 
         # 只允许管理员和所有者使用PUT或PATCH方法更新工作空间设置。
-        # 这里通过查询WorkspaceMember模型来检查用户是否具有相应角色和权限。
+        # 这里通过缓存的WorkspaceMember角色来检查用户是否具有相应角色和权限。
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Owner, Admin],
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [Owner, Admin]
 
         # 只允许所有者使用DELETE方法删除工作空间。
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user, workspace__slug=view.workspace_slug, role=Owner
-            ).exists()
+            return workspace_role(request, view.workspace_slug) == Owner
 
 # 定义工作空间管理员权限类
 class WorkSpaceAdminPermission(BasePermission):
@@ -51,9 +45,5 @@ class WorkSpaceAdminPermission(BasePermission):
             return False
 
         # 检查请求的用户是否为指定工作空间的管理员或所有者。
-        # 这一检查通过在WorkspaceMember模型中查询用户角色来实现。
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-        ).exists()
+        # 这一检查通过缓存的WorkspaceMember用户角色来实现。
+        return workspace_role(request, view.workspace_slug) in [Owner, Admin]
@@ -0,0 +1,16 @@
+# Third party imports
+from rest_framework.renderers import JSONRenderer
+
+
+class NormalizedJSONRenderer(JSONRenderer):
+    """Accept ?format=normalized on the issue lists
+
+    DRF reads the format query parameter to pick the renderer, the view
+    itself switches to the normalized payload.
+    """
+
+    format = "normalized"
+
+
+def is_normalized(request):
+    return request.query_params.get("format") == NormalizedJSONRenderer.format
@@ -27,6 +27,7 @@ from plane.db.models import (
     ModuleIssue,
     IssueLink,
 )
+from plane.utils.relations import sync_relation
 
 
 class IssueFlatSerializer(BaseSerializer):
@@ -94,6 +95,7 @@ class IssueCreateSerializer(BaseSerializer):
              "updated_by",
              "created_at",
              "updated_at",
+             "sub_issues_count",
          ]
 
 # 自定义创建方法。从validated_data中提取相关联对象列表，
@@ -197,77 +199,53 @@ class IssueCreateSerializer(BaseSerializer):
         labels = validated_data.pop("labels_list", None)
         blocks = validated_data.pop("blocks_list", None)
 
-        # 如果存在blockers列表，则首先删除所有当前问题(instance)作为阻塞对象的旧记录，
-        # 然后根据新列表创建新的IssueBlocker记录。
+        # 关联表只写入差异：仅插入新增的 id、删除移除的 id，未变化的记录保持不动。
+        # 每个列表实际新增和移除的 id 记录在 relation_diffs 中，供活动记录直接使用。
+        self.relation_diffs = {}
+
+        def relation_row(model, **fields):
+            return model(
+                project=instance.project,
+                workspace=instance.project.workspace,
+                created_by=instance.created_by,
+                updated_by=instance.updated_by,
+                **fields,
+            )
+
+        # 当前问题(instance)被哪些问题阻塞（blockers）。
         if blockers is not None:
-            IssueBlocker.objects.filter(block=instance).delete()  # 删除旧记录
-            IssueBlocker.objects.bulk_create(
-                [
-                    IssueBlocker(
-                        block=instance,  # 当前问题
-                        blocked_by=blocker,  # 阻碍当前问题解决的其他问题
-                        project=instance.project,
-                        workspace=instance.project.workspace,  # 从项目获取工作区信息
-                        created_by=instance.created_by,
-                        updated_by=instance.updated_by,
-                    )
-                    for blocker in blockers
-                ],
-                batch_size=10,  # 指定每次数据库操作批量处理的记录数量
+            self.relation_diffs["blockers_list"] = sync_relation(
+                IssueBlocker.objects.filter(block=instance),
+                "blocked_by_id",
+                [blocker.id for blocker in blockers],
+                lambda pk: relation_row(IssueBlocker, block=instance, blocked_by_id=pk),
             )
 
-        # 类似地，如果存在assignees列表，则更新当前问题(instance)的分配用户（assignees）。
+        # 当前问题(instance)的分配用户（assignees）。
         if assignees is not None:
-            IssueAssignee.objects.filter(issue=instance).delete()  # 删除旧记录
-            IssueAssignee.objects.bulk_create(
-                [
-                    IssueAssignee(
-                        assignee=user,
-                        issue=instance,
-                        project=instance.project,
-                        workspace=instance.project.workspace,
-                        created_by=instance.created_by,
-                        updated_by=instance.updated_by,
-                    )
-                    for user in assignees
-                ],
-                batch_size=10,
+            self.relation_diffs["assignees_list"] = sync_relation(
+                IssueAssignee.objects.filter(issue=instance),
+                "assignee_id",
+                [user.id for user in assignees],
+                lambda pk: relation_row(IssueAssignee, issue=instance, assignee_id=pk),
             )
 
-        # 如果存在labels列表，则更新当前问题(instance)关联的标签（labels）。
+        # 当前问题(instance)关联的标签（labels）。
         if labels is not None:
-            IssueLabel.objects.filter(issue=instance).delete()  # 删除旧记录
-            IssueLabel.objects.bulk_create(
-                [
-                    IssueLabel(
-                        label=label,
-                        issue=instance,
-                        project=instance.project,
-                        workspace=instance.project.workspace,
-                        created_by=instance.created_by,
-                        updated_by=instance.updated_by,
-                    )
-                    for label in labels
-                ],
-                batch_size=10,
+            self.relation_diffs["labels_list"] = sync_relation(
+                IssueLabel.objects.filter(issue=instance),
+                "label_id",
+                [label.id for label in labels],
+                lambda pk: relation_row(IssueLabel, issue=instance, label_id=pk),
             )
 
-        # 如果存在blocks列表，则更新由当前问题(instance)阻碍解决的其他问题（blocks）。
+        # 由当前问题(instance)阻碍解决的其他问题（blocks）。
         if blocks is not None:
-            IssueBlocker.objects.filter(blocked_by=instance).delete()  # 删除旧记录
-            IssueBlocker.objects.bulk_create(
-                [
-                    IssueBlocker(
-                        block=block,  # 被当前问题阻碍解决的其他问题
-                        blocked_by=instance,  # 当前问题作为阻碍者
-                        project=instance.project,
-                        workspace=instance.project.workspace,
-                        created_by=instance.created_by,
-                        updated_by=instance.updated_by,
-                    )
-                    for block in blocks
-                ],
-                batch_size=10,
+            self.relation_diffs["blocks_list"] = sync_relation(
+                IssueBlocker.objects.filter(blocked_by=instance),
+                "block_id",
+                [block.id for block in blocks],
+                lambda pk: relation_row(IssueBlocker, block_id=pk, blocked_by=instance),
             )
 
         # 调用父类的update方法来处理validated_data中剩余的字段，
@@ -40,6 +40,12 @@ class ModuleWriteSerializer(BaseSerializer):
             "updated_by",
             "created_at",
             "updated_at",
+            "total_issues",
+            "backlog_issues",
+            "unstarted_issues",
+            "started_issues",
+            "completed_issues",
+            "cancelled_issues",
         ]
 
     def create(self, validated_data):
@@ -107,6 +113,12 @@ class ModuleFlatSerializer(BaseSerializer):
             "updated_by",  # 更新者字段
             "created_at",  # 创建时间字段
             "updated_at",  # 更新时间字段
+            "total_issues",  # 问题计数字段，由系统维护
+            "backlog_issues",
+            "unstarted_issues",
+            "started_issues",
+            "completed_issues",
+            "cancelled_issues",
         ]
 
 # ModuleIssueSerializer: 序列化模块问题信息，包括问题详情和所关联的模块信息
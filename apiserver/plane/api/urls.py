@@ -66,12 +66,16 @@ from plane.api.views import (
     IssueCommentViewSet,
     UserWorkSpaceIssues,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     BulkImportIssuesEndpoint,
     ProjectUserViewsEndpoint,
     TimeLineIssueViewSet,
     IssuePropertyViewSet,
     LabelViewSet,
     SubIssuesEndpoint,
+    SubIssueTreeEndpoint,
+    IssueMoveEndpoint,
+    IssueSyncEndpoint,
     IssueLinkViewSet,
     BulkCreateIssueLabelsEndpoint,
     ## End Issues
@@ -655,6 +659,11 @@ urlpatterns = [
         ),
         name="project-issue",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/sync/",
+        IssueSyncEndpoint.as_view(),
+        name="project-issue-sync",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueViewSet.as_view(
@@ -704,6 +713,11 @@ urlpatterns = [
         BulkDeleteIssuesEndpoint.as_view(),
         name="project-issues-bulk",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-update-issues/",
+        BulkUpdateIssuesEndpoint.as_view(),
+        name="project-issues-bulk-update",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-import-issues/<str:service>/",
         BulkImportIssuesEndpoint.as_view(),
@@ -719,6 +733,16 @@ urlpatterns = [
         SubIssuesEndpoint.as_view(),
         name="sub-issues",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/sub-issues/tree/",
+        SubIssueTreeEndpoint.as_view(),
+        name="sub-issue-tree",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/move/",
+        IssueMoveEndpoint.as_view(),
+        name="issue-move",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/issue-links/",
         IssueLinkViewSet.as_view(
@@ -65,8 +65,12 @@ from .issue import (
     IssuePropertyViewSet,
     LabelViewSet,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     UserWorkSpaceIssues,
     SubIssuesEndpoint,
+    SubIssueTreeEndpoint,
+    IssueMoveEndpoint,
+    IssueSyncEndpoint,
     IssueLinkViewSet,
     BulkCreateIssueLabelsEndpoint,
 )
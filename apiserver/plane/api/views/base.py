@@ -1,6 +1,10 @@
+# Python imports
+import pytz
+
 # Django imports
 from django.urls import resolve
 from django.conf import settings
+from django.utils import timezone
 
 # Third part imports
 from rest_framework import status
@@ -48,6 +52,15 @@ class BaseViewSet(ModelViewSet, BasePaginator):
             # 如果出现异常，则抛出 API 异常
             raise APIException("Please check the view", status.HTTP_400_BAD_REQUEST)
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # 认证完成后直接使用已加载的用户激活其时区，无需再次查询用户
+        if request.user.is_authenticated:
+            try:
+                timezone.activate(pytz.timezone(request.user.user_timezone))
+            except pytz.UnknownTimeZoneError:
+                pass
+
     def dispatch(self, request, *args, **kwargs):
         # 调用父类的 dispatch 方法处理请求
         response = super().dispatch(request, *args, **kwargs)
@@ -102,6 +115,15 @@ class BaseAPIView(APIView, BasePaginator):
             queryset = backend().filter_queryset(self.request, queryset, self)
         return queryset
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # 认证完成后直接使用已加载的用户激活其时区，无需再次查询用户
+        if request.user.is_authenticated:
+            try:
+                timezone.activate(pytz.timezone(request.user.user_timezone))
+            except pytz.UnknownTimeZoneError:
+                pass
+
     def dispatch(self, request, *args, **kwargs):
         # 调用父类方法处理请求，并记录调试信息（如果处于 DEBUG 模式）
         response = super().dispatch(request, *args, **kwargs)
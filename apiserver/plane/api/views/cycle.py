@@ -5,7 +5,7 @@ import json
 
 # Django imports
 from django.db import IntegrityError
-from django.db.models import OuterRef, Func, F, Q, Exists, OuterRef, Count, Prefetch
+from django.db.models import F, Q, Exists, OuterRef, Count, Prefetch
 from django.core import serializers
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -13,6 +13,7 @@ from django.views.decorators.gzip import gzip_page
 
 # Third party imports
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework import status
 from sentry_sdk import capture_exception
 
@@ -25,6 +26,7 @@ from plane.api.serializers import (
     IssueStateSerializer,
 )
 from plane.api.permissions import ProjectEntityPermission
+from plane.api.renderers import NormalizedJSONRenderer, is_normalized
 from plane.db.models import (
     Cycle,
     CycleIssue,
@@ -34,6 +36,12 @@ from plane.db.models import (
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import member_project_ids
+from plane.utils.issue_stats import schedule_issue_stats
+from plane.utils.issue_assignment import assign_issues
+from plane.utils.sync import schedule_issue_touch
+from plane.utils.etag import collection_etag, bump_project_collections
+from plane.utils.issue_serializer import normalize_issues
 
 # CycleViewSet 继承了 BaseViewSet，并指定了一些属性和方法来处理 Cycle 相关的操作。
 class CycleViewSet(BaseViewSet):
@@ -68,47 +76,20 @@ class CycleViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("owned_by")
             .annotate(is_favorite=Exists(subquery))  # 注释 Cycle 对象是否被收藏
-            # 注释各种状态的 Issue 数量
-            .annotate(total_issues=Count("issue_cycle"))
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="completed"),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="cancelled"),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="started"),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="unstarted"),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="backlog"),
-                )
-            )
             .order_by("-is_favorite", "name")  # 按是否收藏和名称排序
             .distinct()  # 确保结果集中不包含重复项
         )
 
+    # 周期列表未变化时直接返回 304，不执行查询
+    @collection_etag("cycles")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     # 处理创建 Cycle 对象的请求。
     def create(self, request, slug, project_id):
         try:
@@ -193,6 +174,7 @@ class CycleIssueViewSet(BaseViewSet):
     """
     serializer_class = CycleIssueSerializer
     model = CycleIssue
+    renderer_classes = (JSONRenderer, NormalizedJSONRenderer)
 
     permission_classes = [
         ProjectEntityPermission,
@@ -228,15 +210,10 @@ class CycleIssueViewSet(BaseViewSet):
         return self.filter_queryset(
             super()
             .get_queryset()
-            .annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .filter(cycle_id=self.kwargs.get("cycle_id"))
             .select_related("project")
             .select_related("workspace")
@@ -266,12 +243,6 @@ class CycleIssueViewSet(BaseViewSet):
             filters = issue_filters(request.query_params, "GET")
             issues = (
                 Issue.objects.filter(issue_cycle__cycle_id=cycle_id)
-                .annotate(
-                    sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .annotate(bridge_id=F("issue_cycle__id"))
                 .filter(project_id=project_id)
                 .filter(workspace__slug=slug)
@@ -285,6 +256,11 @@ class CycleIssueViewSet(BaseViewSet):
                 .filter(**filters)
             )
 
+            if is_normalized(request):
+                return Response(
+                    normalize_issues(issues, group_by), status=status.HTTP_200_OK
+                )
+
             issues_data = IssueStateSerializer(issues, many=True).data
 
             if group_by:
@@ -337,75 +313,57 @@ class CycleIssueViewSet(BaseViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Get all CycleIssues already created
-            cycle_issues = list(CycleIssue.objects.filter(issue_id__in=issues))
-            records_to_update = []
-            update_cycle_issue_activity = []
-            record_to_create = []
-
-            for issue in issues:
-                cycle_issue = [
-                    cycle_issue
-                    for cycle_issue in cycle_issues
-                    if str(cycle_issue.issue_id) in issues
-                ]
-                # Update only when cycle changes
-                if len(cycle_issue):
-                    if cycle_issue[0].cycle_id != cycle_id:
-                        update_cycle_issue_activity.append(
-                            {
-                                "old_cycle_id": str(cycle_issue[0].cycle_id),
-                                "new_cycle_id": str(cycle_id),
-                                "issue_id": str(cycle_issue[0].issue_id),
-                            }
-                        )
-                        cycle_issue[0].cycle_id = cycle_id
-                        records_to_update.append(cycle_issue[0])
-                else:
-                    record_to_create.append(
-                        CycleIssue(
-                            project_id=project_id,
-                            workspace=cycle.workspace,
-                            created_by=request.user,
-                            updated_by=request.user,
-                            cycle=cycle,
-                            issue_id=issue,
-                        )
-                    )
-
-            CycleIssue.objects.bulk_create(
-                record_to_create,
-                batch_size=10,
-                ignore_conflicts=True,
+            # Issues already in the cycle are left alone, the others are
+            # inserted or moved over from their cycle in one upsert
+            created, moved = assign_issues(
+                CycleIssue, "cycle", cycle, issues, request.user
             )
-            CycleIssue.objects.bulk_update(
-                records_to_update,
-                ["cycle"],
-                batch_size=10,
+            update_cycle_issue_activity = [
+                {
+                    "old_cycle_id": old_cycle_id,
+                    "new_cycle_id": str(cycle_id),
+                    "issue_id": issue_id,
+                }
+                for issue_id, old_cycle_id in moved.items()
+            ]
+
+            # bulk writes skip the signals, recount the affected cycles here
+            schedule_issue_stats(
+                Cycle, CycleIssue, "cycle", [cycle_id, *moved.values()]
             )
+            bump_project_collections(CycleIssue, project_id)
 
             # Capture Issue Activity
-            issue_activity.delay(
-                {
-                    "type": "issue.activity",
-                    "requested_data": json.dumps({"cycles_list": issues}),
-                    "actor_id": str(self.request.user.id),
-                    "issue_id": str(self.kwargs.get("pk", None)),
-                    "project_id": str(self.kwargs.get("project_id", None)),
-                    "current_instance": json.dumps(
-                        {
-                            "updated_cycle_issues": update_cycle_issue_activity,
-                            "created_cycle_issues": serializers.serialize(
-                                "json", record_to_create
-                            ),
-                        }
-                    ),
-                },
-            )
+            if created or moved:
+                issue_activity.delay(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps({"cycles_list": issues}),
+                        "actor_id": str(self.request.user.id),
+                        "issue_id": None,
+                        "project_id": str(self.kwargs.get("project_id", None)),
+                        "current_instance": json.dumps(
+                            {
+                                "updated_cycle_issues": update_cycle_issue_activity,
+                                "created_cycle_issues": serializers.serialize(
+                                    "json", created
+                                ),
+                            }
+                        ),
+                    },
+                )
 
-            # Return all Cycle Issues
+            # Return only the Cycle Issues written by this request
             return Response(
-                CycleIssueSerializer(self.get_queryset(), many=True).data,
+                CycleIssueSerializer(
+                    self.get_queryset().filter(
+                        issue_id__in=[
+                            *[str(row.issue_id) for row in created],
+                            *moved.keys(),
+                        ]
+                    ),
+                    many=True,
+                ).data,
                 status=status.HTTP_200_OK,
             )
 
@@ -486,37 +444,6 @@ class CurrentUpcomingCyclesEndpoint(BaseAPIView):
                 .select_related("workspace")
                 .select_related("owned_by")
                 .annotate(is_favorite=Exists(subquery))
-                .annotate(total_issues=Count("issue_cycle"))
-                .annotate(
-                    completed_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="completed"),
-                    )
-                )
-                .annotate(
-                    cancelled_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="cancelled"),
-                    )
-                )
-                .annotate(
-                    started_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="started"),
-                    )
-                )
-                .annotate(
-                    unstarted_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="unstarted"),
-                    )
-                )
-                .annotate(
-                    backlog_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="backlog"),
-                    )
-                )
                 .order_by("name", "-is_favorite")
             )
 
@@ -530,37 +457,6 @@ class CurrentUpcomingCyclesEndpoint(BaseAPIView):
                 .select_related("workspace")
                 .select_related("owned_by")
                 .annotate(is_favorite=Exists(subquery))
-                .annotate(total_issues=Count("issue_cycle"))
-                .annotate(
-                    completed_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="completed"),
-                    )
-                )
-                .annotate(
-                    cancelled_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="cancelled"),
-                    )
-                )
-                .annotate(
-                    started_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="started"),
-                    )
-                )
-                .annotate(
-                    unstarted_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="unstarted"),
-                    )
-                )
-                .annotate(
-                    backlog_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="backlog"),
-                    )
-                )
                 .order_by("name", "-is_favorite")
             )
 
@@ -603,37 +499,6 @@ class CompletedCyclesEndpoint(BaseAPIView):
                 .select_related("workspace")
                 .select_related("owned_by")
                 .annotate(is_favorite=Exists(subquery))
-                .annotate(total_issues=Count("issue_cycle"))
-                .annotate(
-                    completed_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="completed"),
-                    )
-                )
-                .annotate(
-                    cancelled_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="cancelled"),
-                    )
-                )
-                .annotate(
-                    started_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="started"),
-                    )
-                )
-                .annotate(
-                    unstarted_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="unstarted"),
-                    )
-                )
-                .annotate(
-                    backlog_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="backlog"),
-                    )
-                )
                 .order_by("name", "-is_favorite")
             )
 
@@ -678,37 +543,6 @@ class DraftCyclesEndpoint(BaseAPIView):
                 .select_related("workspace")
                 .select_related("owned_by")
                 .annotate(is_favorite=Exists(subquery))
-                .annotate(total_issues=Count("issue_cycle"))
-                .annotate(
-                    completed_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="completed"),
-                    )
-                )
-                .annotate(
-                    cancelled_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="cancelled"),
-                    )
-                )
-                .annotate(
-                    started_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="started"),
-                    )
-                )
-                .annotate(
-                    unstarted_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="unstarted"),
-                    )
-                )
-                .annotate(
-                    backlog_issues=Count(
-                        "issue_cycle__issue__state__group",
-                        filter=Q(issue_cycle__issue__state__group="backlog"),
-                    )
-                )
                 .order_by("name", "-is_favorite")
             )
 
@@ -835,6 +669,10 @@ class TransferCycleIssueEndpoint(BaseAPIView):
             cycle_issues = CycleIssue.objects.bulk_update(
                 updated_cycles, ["cycle_id"], batch_size=100
             )
+            bump_project_collections(CycleIssue, project_id)
+            schedule_issue_touch(cycle_issue.issue_id for cycle_issue in updated_cycles)
+            # bulk_update skips the signals recounting both cycles
+            schedule_issue_stats(Cycle, CycleIssue, "cycle", [cycle_id, new_cycle_id])
 
             return Response({"message": "Success"}, status=status.HTTP_200_OK)
         except Cycle.DoesNotExist:
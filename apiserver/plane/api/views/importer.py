@@ -1,13 +1,19 @@
 # Python imports
+import json
+import shutil
+import tempfile
 import uuid
 
 # Third party imports
 from rest_framework import status
+from rest_framework.parsers import BaseParser, JSONParser, MultiPartParser, FormParser
 from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 # Django imports
-from django.db.models import Max
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import transaction
 
 # Module imports
 from plane.api.views import BaseAPIView
@@ -16,15 +22,7 @@ from plane.db.models import (
     Importer,
     APIToken,
     Project,
-    State,
-    IssueSequence,
-    Issue,
-    IssueActivity,
-    IssueComment,
-    IssueLink,
-    IssueLabel,
     Workspace,
-    IssueAssignee,
     Module,
     ModuleLink,
     ModuleIssue,
@@ -36,8 +34,16 @@ from plane.api.serializers import (
 )
 from plane.utils.integrations.github import get_github_repo_details
 from plane.utils.importers.jira import jira_project_issue_summary
-from plane.bgtasks.importer_task import service_importer
-from plane.utils.html_processor import strip_tags
+from plane.bgtasks.importer_task import service_importer, bulk_import_issues
+from plane.utils.dashboard import refresh_user_issue_rollups
+from plane.utils.etag import bump_project_collections
+from plane.utils.issue_stats import schedule_issue_stats
+from plane.utils.sync import schedule_issue_touch
+from plane.utils.importers.issues import (
+    BULK_IMPORT_CHUNK_SIZE,
+    default_import_state,
+    import_issues,
+)
 
 
 class ServiceIssueImportSummaryEndpoint(BaseAPIView):
@@ -52,7 +58,7 @@ class ServiceIssueImportSummaryEndpoint(BaseAPIView):
                 owner = request.GET.get("owner")
                 repo = request.GET.get("repo")
 
-                issue_count, labels, collaborators = get_github_repo_details(
+                issue_count, labels, collaborators, partial = get_github_repo_details(
                     access_tokens_url, owner, repo
                 )
                 return Response(
@@ -60,6 +66,7 @@ class ServiceIssueImportSummaryEndpoint(BaseAPIView):
                         "issue_count": issue_count,
                         "labels": labels,
                         "collaborators": collaborators,
+                        "partial": partial,
                     },
                     status=status.HTTP_200_OK,
                 )
@@ -244,190 +251,132 @@ class UpdateServiceImportStatusEndpoint(BaseAPIView):
             )
 
 
-class BulkImportIssuesEndpoint(BaseAPIView):
-    def post(self, request, slug, project_id, service):
-        try:
-            # Get the project
-            project = Project.objects.get(pk=project_id, workspace__slug=slug)
+class NDJSONParser(BaseParser):
+    """Spool a newline delimited json body to a temporary file"""
 
-            # Get the default state
-            default_state = State.objects.filter(
-                project_id=project_id, default=True
-            ).first()
-            # if there is no default state assign any random state
-            if default_state is None:
-                default_state = State.objects.filter(project_id=project_id).first()
+    media_type = "application/x-ndjson"
 
-            # Get the maximum sequence_id
-            last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
-                largest=Max("sequence")
-            )["largest"]
+    def parse(self, stream, media_type=None, parser_context=None):
+        file = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        if stream is not None:
+            shutil.copyfileobj(stream, file, 64 * 1024)
+        file.seek(0)
+        return File(file, name="issues.ndjson")
 
-            last_id = 1 if last_id is None else last_id + 1
 
-            # Get the maximum sort order
-            largest_sort_order = Issue.objects.filter(
-                project_id=project_id, state=default_state
-            ).aggregate(largest=Max("sort_order"))["largest"]
+class BulkImportIssuesEndpoint(BaseAPIView):
+    parser_classes = (JSONParser, NDJSONParser, MultiPartParser, FormParser)
 
-            largest_sort_order = (
-                65535 if largest_sort_order is None else largest_sort_order + 10000
+    def post(self, request, slug, project_id, service):
+        try:
+            # Get the project
+            project = Project.objects.select_related("workspace").get(
+                pk=project_id, workspace__slug=slug
             )
 
+            # Newline delimited json, either as the body or as an uploaded file
+            if isinstance(request.data, File):
+                issues_file = request.data
+            else:
+                issues_file = request.FILES.get("file", None)
+
             # Get the issues_data
-            issues_data = request.data.get("issues_data", [])
+            issues_data = (
+                request.data.get("issues_data", [])
+                if issues_file is None
+                else []
+            )
 
-            if not len(issues_data):
+            if issues_file is None and not len(issues_data):
                 return Response(
                     {"error": "Issue data is required"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Issues
-            bulk_issues = []
-            for issue_data in issues_data:
-                bulk_issues.append(
-                    Issue(
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        state_id=issue_data.get("state")
-                        if issue_data.get("state", False)
-                        else default_state.id,
-                        name=issue_data.get("name", "Issue Created through Bulk"),
-                        description_html=issue_data.get("description_html", "<p></p>"),
-                        description_stripped=(
-                            None
-                            if (
-                                issue_data.get("description_html") == ""
-                                or issue_data.get("description_html") is None
-                            )
-                            else strip_tags(issue_data.get("description_html"))
-                        ),
-                        sequence_id=last_id,
-                        sort_order=largest_sort_order,
-                        start_date=issue_data.get("start_date", None),
-                        target_date=issue_data.get("target_date", None),
-                        priority=issue_data.get("priority", None),
+            # Small payloads are imported right away and return the issues
+            if issues_file is None and len(issues_data) <= BULK_IMPORT_CHUNK_SIZE:
+                with transaction.atomic():
+                    issues, assignee_ids = import_issues(
+                        project,
+                        issues_data,
+                        request.user,
+                        service,
+                        default_import_state(project_id),
                     )
-                )
+                refresh_user_issue_rollups(project.workspace, assignee_ids)
 
-                largest_sort_order = largest_sort_order + 10000
-                last_id = last_id + 1
+                return Response(
+                    {"issues": IssueFlatSerializer(issues, many=True).data},
+                    status=status.HTTP_201_CREATED,
+                )
 
-            issues = Issue.objects.bulk_create(
-                bulk_issues,
-                batch_size=100,
-                ignore_conflicts=True,
+            importer_id = request.GET.get("importer_id", None) or (
+                request.data.get("importer_id", None)
+                if not isinstance(request.data, File)
+                else None
             )
-
-            # Sequences
-            _ = IssueSequence.objects.bulk_create(
-                [
-                    IssueSequence(
-                        issue=issue,
-                        sequence=issue.sequence_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                    )
-                    for issue in issues
-                ],
-                batch_size=100,
+            importer = Importer.objects.filter(
+                project_id=project_id, workspace__slug=slug, service=service
             )
-
-            # Attach Labels
-            bulk_issue_labels = []
-            for issue, issue_data in zip(issues, issues_data):
-                labels_list = issue_data.get("labels_list", [])
-                bulk_issue_labels = bulk_issue_labels + [
-                    IssueLabel(
-                        issue=issue,
-                        label_id=label_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
-                    for label_id in labels_list
-                ]
-
-            _ = IssueLabel.objects.bulk_create(
-                bulk_issue_labels, batch_size=100, ignore_conflicts=True
-            )
-
-            # Attach Assignees
-            bulk_issue_assignees = []
-            for issue, issue_data in zip(issues, issues_data):
-                assignees_list = issue_data.get("assignees_list", [])
-                bulk_issue_assignees = bulk_issue_assignees + [
-                    IssueAssignee(
-                        issue=issue,
-                        assignee_id=assignee_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
-                    for assignee_id in assignees_list
-                ]
-
-            _ = IssueAssignee.objects.bulk_create(
-                bulk_issue_assignees, batch_size=100, ignore_conflicts=True
+            importer = (
+                importer.filter(pk=importer_id).first()
+                if importer_id
+                else importer.order_by("-created_at").first()
             )
+            if importer is None and importer_id:
+                return Response(
+                    {"error": "Importer does not exist"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
 
-            # Track the issue activities
-            IssueActivity.objects.bulk_create(
-                [
-                    IssueActivity(
-                        issue=issue,
-                        actor=request.user,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        comment=f"{request.user.email} importer the issue from {service}",
-                        verb="created",
+            # Callers posting the issues directly have no importer yet, it
+            # tracks the progress of the background job
+            if importer is None:
+                api_token = APIToken.objects.filter(
+                    user=request.user, workspace=project.workspace
+                ).first()
+                if api_token is None:
+                    api_token = APIToken.objects.create(
+                        user=request.user,
+                        label="Importer",
+                        workspace=project.workspace,
                     )
-                    for issue in issues
-                ],
-                batch_size=100,
-            )
 
-            # Create Comments
-            bulk_issue_comments = []
-            for issue, issue_data in zip(issues, issues_data):
-                comments_list = issue_data.get("comments_list", [])
-                bulk_issue_comments = bulk_issue_comments + [
-                    IssueComment(
-                        issue=issue,
-                        comment_html=comment.get("comment_html", "<p></p>"),
-                        actor=request.user,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
-                    for comment in comments_list
-                ]
+                importer = Importer.objects.create(
+                    service=service,
+                    project_id=project_id,
+                    status="queued",
+                    initiated_by=request.user,
+                    token=api_token,
+                    created_by=request.user,
+                    updated_by=request.user,
+                )
 
-            _ = IssueComment.objects.bulk_create(bulk_issue_comments, batch_size=100)
+            if issues_file is None:
+                issues_file = ContentFile(
+                    "\n".join(json.dumps(issue_data) for issue_data in issues_data)
+                )
 
-            # Attach Links
-            _ = IssueLink.objects.bulk_create(
-                [
-                    IssueLink(
-                        issue=issue,
-                        url=issue_data.get("link", {}).get("url", "https://github.com"),
-                        title=issue_data.get("link", {}).get("title", "Original Issue"),
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
-                    for issue, issue_data in zip(issues, issues_data)
+            # Larger imports are processed in chunks by a background job
+            importer.issues_file.save(
+                f"{uuid.uuid4().hex}.ndjson", issues_file, save=False
+            )
+            importer.total_issues = 0
+            importer.imported_issues = 0
+            importer.status = "queued"
+            importer.save(
+                update_fields=[
+                    "issues_file",
+                    "total_issues",
+                    "imported_issues",
+                    "status",
+                    "updated_at",
                 ]
             )
+            bulk_import_issues.delay(importer.id, request.user.id)
 
             return Response(
-                {"issues": IssueFlatSerializer(issues, many=True).data},
-                status=status.HTTP_201_CREATED,
+                ImporterSerializer(importer).data, status=status.HTTP_202_ACCEPTED
             )
         except Project.DoesNotExist:
             return Response(
@@ -484,24 +433,30 @@ class BulkImportModulesEndpoint(BaseAPIView):
                 ignore_conflicts=True,
             )
 
-            bulk_module_issues = []
-            for module, module_data in zip(modules, modules_data):
-                module_issues_list = module_data.get("module_issues_list", [])
-                bulk_module_issues = bulk_module_issues + [
-                    ModuleIssue(
-                        issue_id=issue,
-                        module=module,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
-                    for issue in module_issues_list
-                ]
+            bulk_module_issues = [
+                ModuleIssue(
+                    issue_id=issue,
+                    module=module,
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    created_by=request.user,
+                    updated_by=request.user,
+                )
+                for module, module_data in zip(modules, modules_data)
+                for issue in module_data.get("module_issues_list", [])
+            ]
 
             _ = ModuleIssue.objects.bulk_create(
                 bulk_module_issues, batch_size=100, ignore_conflicts=True
             )
+            # bulk writes skip the signals, recount the imported modules here
+            schedule_issue_stats(
+                Module, ModuleIssue, "module", [module.id for module in modules]
+            )
+            bump_project_collections(ModuleIssue, project_id)
+            schedule_issue_touch(
+                module_issue.issue_id for module_issue in bulk_module_issues
+            )
 
             serializer = ModuleSerializer(modules, many=True)
             return Response(
@@ -20,7 +20,7 @@ from plane.api.serializers import (
     GithubRepositorySyncSerializer,
     GithubCommentSyncSerializer,
 )
-from plane.utils.integrations.github import get_github_repos
+from plane.utils.integrations.github import get_github_repos, get_all_github_repos
 from plane.api.permissions import ProjectBasePermission, ProjectEntityPermission
 
 
@@ -34,8 +34,6 @@ class GithubRepositoriesEndpoint(BaseAPIView):
     # 处理 GET 请求，用于获取指定工作空间集成的 GitHub 仓库列表
     def get(self, request, slug, workspace_integration_id):
         try:
-            # 从请求的查询参数中获取页码，默认为第一页
-            page = request.GET.get("page", 1)
             # 根据工作空间的 slug 和集成的 ID 获取对应的 WorkspaceIntegration 对象
             workspace_integration = WorkspaceIntegration.objects.get(
                 workspace__slug=slug, pk=workspace_integration_id
@@ -50,14 +48,18 @@ class GithubRepositoriesEndpoint(BaseAPIView):
 
             # 从集成元数据中获取访问令牌 URL 和仓库 URL
             access_tokens_url = workspace_integration.metadata["access_tokens_url"]
-            repositories_url = (
-                workspace_integration.metadata["repositories_url"]
-                + f"?per_page=100&page={page}"  # 查询参数中指定每页100个项目并设置当前页码
-            )
-            
-            # 调用函数 get_github_repos() 获取 GitHub 仓库列表，并传入访问令牌 URL 和仓库 URL
-            repositories = get_github_repos(access_tokens_url, repositories_url)
-            
+            repositories_url = workspace_integration.metadata["repositories_url"]
+
+            # 指定页码时只返回该页，否则返回安装下的全部仓库（按安装缓存）
+            page = request.GET.get("page", None)
+            if page is not None:
+                repositories = get_github_repos(
+                    access_tokens_url,
+                    repositories_url + f"?per_page=100&page={page}",
+                )
+            else:
+                repositories = get_all_github_repos(access_tokens_url, repositories_url)
+
             # 返回仓库列表和状态码200 OK
             return Response(repositories, status=status.HTTP_200_OK)
         except WorkspaceIntegration.DoesNotExist:
@@ -66,6 +68,12 @@ class GithubRepositoriesEndpoint(BaseAPIView):
                 {"error": "Workspace Integration Does not exists"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
 
 # GithubRepositorySyncViewSet 继承自 BaseViewSet，用于处理 GitHub 仓库同步相关的 API 请求
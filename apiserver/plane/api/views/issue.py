@@ -1,17 +1,23 @@
 # Python imports
 import json
 import random
-from itertools import groupby, chain
+from itertools import groupby
 
 # Django imports
-from django.db.models import Prefetch, OuterRef, Func, F, Q
+from django.core import serializers
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Prefetch, F, Q
+from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 
 # Third Party imports
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework import status
+from rest_framework.exceptions import ParseError
 from sentry_sdk import capture_exception
 
 # Module imports
@@ -34,6 +40,7 @@ from plane.api.permissions import (
     WorkSpaceAdminPermission,
     ProjectMemberPermission,
 )
+from plane.api.renderers import NormalizedJSONRenderer, is_normalized
 from plane.db.models import (
     Project,
     Issue,
@@ -43,10 +50,48 @@ from plane.db.models import (
     IssueProperty,
     Label,
     IssueLink,
+    DeletedIssue,
+    State,
+    PageBlock,
+    Cycle,
+    CycleIssue,
+    Module,
+    ModuleIssue,
+    IssueLabel,
+    IssueAssignee,
+    ProjectMember,
+)
+from plane.bgtasks.issue_activites_task import (
+    issue_activity,
+    bulk_issue_activity,
+    coalesce_issue_activity,
+)
+from plane.utils.grouper import (
+    group_cursor,
+    group_results,
+    group_queryset,
+    GROUP_BY_FIELDS,
 )
-from plane.bgtasks.issue_activites_task import issue_activity
-from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
+from plane.utils.paginator import (
+    KeysetPaginator,
+    KeysetCursor,
+    UnionKeysetPaginator,
+)
+from plane.utils.membership import member_project_ids
+from plane.utils.rank import move_rank
+from plane.utils.etag import collection_etag, bump_project_collections
+from plane.utils.issue_stats import schedule_issue_stats, schedule_sub_issues_count
+from plane.utils.relations import sync_relations
+from plane.utils.issue_assignment import assign_issues
+from plane.utils.issue_tree import MAX_TREE_DEPTH, issue_subtree, subtree_rollups
+from plane.utils.sync import SyncToken, sync_changes
+from plane.utils.dashboard import schedule_user_issue_rollups
+from plane.utils.issue_serializer import (
+    serialize_issues,
+    normalize_issues,
+    normalize_groups,
+)
 
 
 class IssueViewSet(BaseViewSet):
@@ -61,6 +106,7 @@ class IssueViewSet(BaseViewSet):
     permission_classes = [
         ProjectEntityPermission,
     ]
+    renderer_classes = (JSONRenderer, NormalizedJSONRenderer)
 
     search_fields = [
         "name",
@@ -76,25 +122,25 @@ class IssueViewSet(BaseViewSet):
         serializer.save(project_id=self.kwargs.get("project_id"))
 
     def perform_update(self, serializer):
-        requested_data = json.dumps(self.request.data, cls=DjangoJSONEncoder)
-        current_instance = (
-            self.get_queryset().filter(pk=self.kwargs.get("pk", None)).first()
+        # Rapid successive edits of the issue are merged into one activity job
+        coalesce_issue_activity(
+            issue_id=self.kwargs.get("pk", None),
+            project_id=self.kwargs.get("project_id", None),
+            actor_id=self.request.user.id,
+            requested_data=self.request.data,
         )
-        if current_instance is not None:
-            issue_activity.delay(
-                {
-                    "type": "issue.activity.updated",
-                    "requested_data": requested_data,
-                    "actor_id": str(self.request.user.id),
-                    "issue_id": str(self.kwargs.get("pk", None)),
-                    "project_id": str(self.kwargs.get("project_id", None)),
-                    "current_instance": json.dumps(
-                        IssueSerializer(current_instance).data, cls=DjangoJSONEncoder
-                    ),
-                },
-            )
 
-        return super().perform_update(serializer)
+        super().perform_update(serializer)
+
+        # The relation rows actually written, so the trackers need not diff
+        # the lists against the snapshot again
+        if getattr(serializer, "relation_diffs", None):
+            coalesce_issue_activity(
+                issue_id=self.kwargs.get("pk", None),
+                project_id=self.kwargs.get("project_id", None),
+                actor_id=self.request.user.id,
+                requested_data={"relation_diffs": serializer.relation_diffs},
+            )
 
     def perform_destroy(self, instance):
         current_instance = (
@@ -121,12 +167,6 @@ class IssueViewSet(BaseViewSet):
         return (
             super()
             .get_queryset()
-            .annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -138,14 +178,16 @@ class IssueViewSet(BaseViewSet):
         )
 
     @method_decorator(gzip_page)
+    @collection_etag("issues")
     def list(self, request, slug, project_id):
         try:
             filters = issue_filters(request.query_params, "GET")
             show_sub_issues = request.GET.get("show_sub_issues", "true")
+            order_by = request.GET.get("order_by", "created_at")
 
             issue_queryset = (
                 self.get_queryset()
-                .order_by(request.GET.get("order_by", "created_at"))
+                .order_by(order_by)
                 .filter(**filters)
                 .annotate(cycle_id=F("issue_cycle__id"))
                 .annotate(module_id=F("issue_module__id"))
@@ -156,11 +198,62 @@ class IssueViewSet(BaseViewSet):
                 if show_sub_issues == "true"
                 else issue_queryset.filter(parent__isnull=True)
             )
+            # serialize_issues loads the related rows itself
+            issue_queryset = issue_queryset.select_related(None).prefetch_related(None)
+
+            group_by = request.GET.get("group_by", False)
+            cursor = request.GET.get("cursor", None)
+            normalized = is_normalized(request)
+
+            # Group in the database and page through every group
+            if group_by in GROUP_BY_FIELDS and (cursor or request.GET.get("per_page")):
+                groups = group_queryset(
+                    issue_queryset,
+                    group_by,
+                    order_by,
+                    limit=self.get_per_page(request),
+                    on_results=None if normalized else serialize_issues,
+                    group=request.GET.get("group", None),
+                    cursor=group_cursor(request),
+                )
+                return Response(
+                    normalize_groups(groups) if normalized else groups,
+                    status=status.HTTP_200_OK,
+                )
+
+            # Page through the issues only when the client asks for it
+            if cursor or request.GET.get("per_page"):
+                if normalized:
+                    on_results = lambda issues: normalize_issues(issues, group_by)
+                    controller = None
+                else:
+                    on_results = serialize_issues
+                    controller = (
+                        (lambda issues: group_results(issues, group_by))
+                        if group_by
+                        else None
+                    )
+                return self.paginate(
+                    request=request,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    queryset=issue_queryset,
+                    order_by=order_by,
+                    count_estimate=request.GET.get("count_estimate", "false")
+                    == "true",
+                    on_results=on_results,
+                    controller=controller,
+                )
+
+            if normalized:
+                return Response(
+                    normalize_issues(issue_queryset, group_by),
+                    status=status.HTTP_200_OK,
+                )
 
-            issues = IssueLiteSerializer(issue_queryset, many=True).data
+            issues = serialize_issues(issue_queryset)
 
             ## Grouping the results
-            group_by = request.GET.get("group_by", False)
             if group_by:
                 return Response(
                     group_results(issues, group_by), status=status.HTTP_200_OK
@@ -168,6 +261,8 @@ class IssueViewSet(BaseViewSet):
 
             return Response(issues, status=status.HTTP_200_OK)
 
+        except ParseError as e:
+            return Response({"error": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -224,22 +319,22 @@ class UserWorkSpaceIssues(BaseAPIView):
         try:
             issues = (
                 Issue.objects.filter(assignees__in=[request.user], workspace__slug=slug)
-                .annotate(
-                    sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .select_related("project")
-                .select_related("workspace")
-                .select_related("state")
-                .select_related("parent")
-                .prefetch_related("assignees")
-                .prefetch_related("labels")
                 .order_by("-created_at")
             )
-            serializer = IssueLiteSerializer(issues, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+
+            if request.GET.get("cursor") or request.GET.get("per_page"):
+                return self.paginate(
+                    request=request,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    queryset=issues,
+                    order_by="-created_at",
+                    count_estimate=request.GET.get("count_estimate", "false")
+                    == "true",
+                    on_results=serialize_issues,
+                )
+
+            return Response(serialize_issues(issues), status=status.HTTP_200_OK)
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -258,9 +353,22 @@ class WorkSpaceIssuesEndpoint(BaseAPIView):
         try:
             issues = (
                 Issue.objects.filter(workspace__slug=slug)
-                .filter(project__project_projectmember__member=self.request.user)
+                .filter(project_id__in=member_project_ids(self.request))
                 .order_by("-created_at")
             )
+
+            if request.GET.get("cursor") or request.GET.get("per_page"):
+                return self.paginate(
+                    request=request,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    queryset=issues,
+                    order_by="-created_at",
+                    count_estimate=request.GET.get("count_estimate", "false")
+                    == "true",
+                    on_results=lambda issues: IssueSerializer(issues, many=True).data,
+                )
+
             serializer = IssueSerializer(issues, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
@@ -283,24 +391,52 @@ class IssueActivityEndpoint(BaseAPIView):
                 IssueActivity.objects.filter(issue_id=issue_id)
                 .filter(
                     ~Q(field="comment"),
-                    project__project_projectmember__member=self.request.user,
+                    project_id__in=member_project_ids(self.request),
                 )
                 .select_related("actor", "workspace")
-            ).order_by("created_at")
+            )
             issue_comments = (
                 IssueComment.objects.filter(issue_id=issue_id)
-                .filter(project__project_projectmember__member=self.request.user)
-                .order_by("created_at")
+                .filter(project_id__in=member_project_ids(self.request))
+                .select_related("actor", "issue", "project")
             )
-            issue_activities = IssueActivitySerializer(issue_activities, many=True).data
-            issue_comments = IssueCommentSerializer(issue_comments, many=True).data
 
-            result_list = sorted(
-                chain(issue_activities, issue_comments),
-                key=lambda instance: instance["created_at"],
+            # Activities and comments are merged by created_at in the database
+            paginator = UnionKeysetPaginator(
+                {"activity": issue_activities, "comment": issue_comments},
+                order_by=(
+                    "created_at"
+                    if request.GET.get("order_by") == "created_at"
+                    else "-created_at"
+                ),
             )
 
-            return Response(result_list, status=status.HTTP_200_OK)
+            def serialize(results):
+                activities = IssueActivitySerializer(
+                    [instance for kind, instance in results if kind == "activity"],
+                    many=True,
+                ).data
+                comments = IssueCommentSerializer(
+                    [instance for kind, instance in results if kind == "comment"],
+                    many=True,
+                ).data
+                serialized = {"activity": iter(activities), "comment": iter(comments)}
+                return [next(serialized[kind]) for kind, _ in results]
+
+            # Newest first pages, older pages follow the next cursor
+            if request.GET.get("cursor") or request.GET.get("per_page"):
+                return self.paginate(
+                    request=request,
+                    paginator=paginator,
+                    cursor_cls=KeysetCursor,
+                    on_results=serialize,
+                )
+
+            # The whole history oldest first, as before
+            return Response(
+                serialize(paginator.load(paginator.get_rows(None, desc=False))),
+                status=status.HTTP_200_OK,
+            )
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -389,7 +525,7 @@ class IssueCommentViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("issue")
@@ -422,7 +558,7 @@ class TimeLineIssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("issue")
@@ -451,7 +587,7 @@ class IssuePropertyViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(user=self.request.user)
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
         )
@@ -509,7 +645,7 @@ class LabelViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("parent")
@@ -517,6 +653,10 @@ class LabelViewSet(BaseViewSet):
             .distinct()
         )
 
+    @collection_etag("labels")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
 
 class BulkDeleteIssuesEndpoint(BaseAPIView):
     permission_classes = [
@@ -538,8 +678,20 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             )
 
             total_issues = len(issues)
+            # The delete emits no activity, recount the assignees here
+            assignee_ids = list(
+                IssueAssignee.objects.filter(issue__in=issues)
+                .values_list("assignee_id", flat=True)
+                .distinct()
+            )
 
             issues.delete()
+            schedule_user_issue_rollups(
+                Project.objects.select_related("workspace")
+                .get(pk=project_id)
+                .workspace,
+                assignee_ids,
+            )
 
             return Response(
                 {"message": f"{total_issues} issues were deleted"},
@@ -553,6 +705,289 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             )
 
 
+class BulkUpdateIssuesEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    # Fields of the change set, assignees and labels replace the current ones
+    # and cycle moves the issues into the cycle, or out of theirs when null
+    BULK_UPDATE_FIELDS = ["state", "priority", "assignees_list", "labels_list", "cycle"]
+
+    def patch(self, request, slug, project_id):
+        try:
+            issue_ids = request.data.get("issue_ids", [])
+
+            if not len(issue_ids):
+                return Response(
+                    {"error": "Issue IDs are required"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            fields = [
+                field for field in self.BULK_UPDATE_FIELDS if field in request.data
+            ]
+            if not len(fields):
+                return Response(
+                    {"error": "Nothing to update"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            issues = {
+                str(issue["id"]): issue
+                for issue in Issue.objects.filter(
+                    workspace__slug=slug, project_id=project_id, pk__in=issue_ids
+                ).values("id", "state_id", "priority")
+            }
+            if not issues:
+                return Response({"issues": []}, status=status.HTTP_200_OK)
+
+            # Validate the whole change set before writing anything
+            state = None
+            if "state" in fields:
+                state = State.objects.filter(
+                    pk=request.data.get("state"), project_id=project_id
+                ).first()
+                if state is None:
+                    return Response(
+                        {"error": "State does not exist"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+            priority = request.data.get("priority", None)
+            if "priority" in fields and priority not in [
+                None,
+                *[choice for choice, _ in Issue._meta.get_field("priority").choices],
+            ]:
+                return Response(
+                    {"error": "Invalid priority"}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            label_ids = list(dict.fromkeys(request.data.get("labels_list") or []))
+            if "labels_list" in fields and Label.objects.filter(
+                pk__in=label_ids, project_id=project_id
+            ).count() != len(label_ids):
+                return Response(
+                    {"error": "Labels do not belong to the project"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            assignee_ids = list(dict.fromkeys(request.data.get("assignees_list") or []))
+            if "assignees_list" in fields and ProjectMember.objects.filter(
+                member_id__in=assignee_ids, project_id=project_id
+            ).count() != len(assignee_ids):
+                return Response(
+                    {"error": "Assignees are not members of the project"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            cycle = None
+            if "cycle" in fields and request.data.get("cycle") is not None:
+                cycle = Cycle.objects.filter(
+                    pk=request.data.get("cycle"), project_id=project_id
+                ).first()
+                if cycle is None:
+                    return Response(
+                        {"error": "Cycle does not exist"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if (
+                    cycle.end_date is not None
+                    and cycle.end_date < timezone.now().date()
+                ):
+                    return Response(
+                        {
+                            "error": "The Cycle has already been completed so no new issues can be added"
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+            now = timezone.now()
+            project = Project.objects.get(pk=project_id)
+            # Changed fields per issue, the only thing returned
+            changes = {issue_id: {} for issue_id in issues}
+            current_instances = {
+                issue_id: {
+                    "state": str(issue["state_id"]),
+                    "priority": issue["priority"],
+                    "relation_diffs": {},
+                }
+                for issue_id, issue in issues.items()
+            }
+            requested_data = {}
+            cycle_records = {}
+
+            with transaction.atomic():
+                if state is not None:
+                    requested_data["state"] = str(state.id)
+                    changed_ids = [
+                        issue_id
+                        for issue_id, issue in issues.items()
+                        if str(issue["state_id"]) != str(state.id)
+                    ]
+                    if changed_ids:
+                        # Same completed_at bookkeeping as Issue.save
+                        completed_at = now if state.group == "completed" else None
+                        Issue.objects.filter(pk__in=changed_ids).update(
+                            state_id=state.id, completed_at=completed_at
+                        )
+                        PageBlock.objects.filter(issue_id__in=changed_ids).update(
+                            completed_at=completed_at
+                        )
+                        # update() skips the signal recounting the cycles and modules
+                        schedule_issue_stats(
+                            Cycle,
+                            CycleIssue,
+                            "cycle",
+                            CycleIssue.objects.filter(
+                                issue_id__in=changed_ids
+                            ).values_list("cycle_id", flat=True),
+                        )
+                        schedule_issue_stats(
+                            Module,
+                            ModuleIssue,
+                            "module",
+                            ModuleIssue.objects.filter(
+                                issue_id__in=changed_ids
+                            ).values_list("module_id", flat=True),
+                        )
+                        for issue_id in changed_ids:
+                            changes[issue_id]["state"] = str(state.id)
+
+                if "priority" in fields:
+                    requested_data["priority"] = priority
+                    changed_ids = [
+                        issue_id
+                        for issue_id, issue in issues.items()
+                        if issue["priority"] != priority
+                    ]
+                    if changed_ids:
+                        Issue.objects.filter(pk__in=changed_ids).update(
+                            priority=priority
+                        )
+                        for issue_id in changed_ids:
+                            changes[issue_id]["priority"] = priority
+
+                for field, model, column, ids in (
+                    ("labels_list", IssueLabel, "label_id", label_ids),
+                    ("assignees_list", IssueAssignee, "assignee_id", assignee_ids),
+                ):
+                    if field not in fields:
+                        continue
+                    requested_data[field] = [str(pk) for pk in ids]
+                    diffs = sync_relations(
+                        model.objects.filter(issue_id__in=list(issues.keys())),
+                        "issue_id",
+                        column,
+                        list(issues.keys()),
+                        ids,
+                        lambda issue_id, pk, model=model, column=column: model(
+                            issue_id=issue_id,
+                            project_id=project_id,
+                            workspace_id=project.workspace_id,
+                            created_by=request.user,
+                            updated_by=request.user,
+                            **{column: pk},
+                        ),
+                    )
+                    for issue_id, diff in diffs.items():
+                        current_instances[issue_id]["relation_diffs"][field] = diff
+                        if diff["added"] or diff["removed"]:
+                            changes[issue_id][field[: -len("_list")]] = [
+                                str(pk) for pk in ids
+                            ]
+
+                if "cycle" in fields:
+                    if cycle is None:
+                        cycle_issues = CycleIssue.objects.filter(
+                            issue_id__in=list(issues.keys())
+                        )
+                        removed = [
+                            {"cycle_id": str(cycle_id), "issue_id": str(issue_id)}
+                            for issue_id, cycle_id in cycle_issues.values_list(
+                                "issue_id", "cycle_id"
+                            )
+                        ]
+                        # Removing the rows one by one lets the signals recount
+                        cycle_issues.delete()
+                        for record in removed:
+                            changes[record["issue_id"]]["cycle_id"] = None
+                        cycle_records = {"removed_cycle_issues": removed}
+                    else:
+                        created, moved = assign_issues(
+                            CycleIssue,
+                            "cycle",
+                            cycle,
+                            list(issues.keys()),
+                            request.user,
+                        )
+                        schedule_issue_stats(
+                            Cycle, CycleIssue, "cycle", [cycle.id, *moved.values()]
+                        )
+                        for issue_id in [
+                            *moved.keys(),
+                            *[str(row.issue_id) for row in created],
+                        ]:
+                            changes[issue_id]["cycle_id"] = str(cycle.id)
+                        cycle_records = {
+                            "updated_cycle_issues": [
+                                {
+                                    "old_cycle_id": cycle_id,
+                                    "new_cycle_id": str(cycle.id),
+                                    "issue_id": issue_id,
+                                }
+                                for issue_id, cycle_id in moved.items()
+                            ],
+                            "created_cycle_issues": serializers.serialize(
+                                "json", created
+                            ),
+                        }
+
+                changes = {
+                    issue_id: changed
+                    for issue_id, changed in changes.items()
+                    if changed
+                }
+                # Picked up by the delta sync and the list ETags
+                Issue.objects.filter(pk__in=list(changes.keys())).update(
+                    updated_at=now, updated_by=request.user
+                )
+                bump_project_collections(Issue, project_id)
+
+            # One activity job for every issue of the change set
+            if changes:
+                bulk_issue_activity.delay(
+                    {
+                        "requested_data": json.dumps(requested_data),
+                        "current_instances": json.dumps(
+                            {
+                                issue_id: current_instances[issue_id]
+                                for issue_id in changes
+                            }
+                        ),
+                        "cycle_records": json.dumps(cycle_records),
+                        "actor_id": str(request.user.id),
+                        "project_id": str(project_id),
+                    }
+                )
+
+            return Response(
+                {
+                    "issues": [
+                        {"id": issue_id, **changed}
+                        for issue_id, changed in changes.items()
+                    ]
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class SubIssuesEndpoint(BaseAPIView):
     permission_classes = [
         ProjectEntityPermission,
@@ -596,10 +1031,20 @@ class SubIssuesEndpoint(BaseAPIView):
 
             sub_issues = Issue.objects.filter(id__in=sub_issue_ids)
 
+            # The previous parents lose the sub issues the new one gets
+            parent_ids = {sub_issue.parent_id for sub_issue in sub_issues}
+            parent_ids.add(parent_issue.id)
+
             for sub_issue in sub_issues:
                 sub_issue.parent = parent_issue
 
             _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+            schedule_sub_issues_count(parent_ids)
+            bump_project_collections(
+                Issue,
+                parent_issue.project_id,
+                *{sub_issue.project_id for sub_issue in sub_issues},
+            )
 
             updated_sub_issues = Issue.objects.filter(id__in=sub_issue_ids)
 
@@ -619,6 +1064,197 @@ class SubIssuesEndpoint(BaseAPIView):
             )
 
 
+class SubIssueTreeEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    # The whole subtree of an issue with one recursive query, every node with
+    # its depth, descendant count and the state groups of its descendants
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id, issue_id):
+        try:
+            if not Issue.objects.filter(
+                pk=issue_id, workspace__slug=slug, project_id=project_id
+            ).exists():
+                return Response(
+                    {"error": "Issue does not exist"}, status=status.HTTP_404_NOT_FOUND
+                )
+
+            try:
+                max_depth = min(
+                    int(request.GET.get("max_depth", MAX_TREE_DEPTH)), MAX_TREE_DEPTH
+                )
+            except ValueError:
+                return Response(
+                    {"error": "Invalid max_depth"}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            nodes = issue_subtree(issue_id, project_id, max_depth)
+            rollups = subtree_rollups(nodes)
+
+            issues = {
+                str(issue["id"]): issue
+                for issue in serialize_issues(
+                    Issue.objects.filter(
+                        pk__in=[pk for pk, _, _, _ in nodes],
+                        project_id=project_id,
+                        workspace__slug=slug,
+                    ).filter(project_id__in=member_project_ids(request))
+                )
+            }
+            results = []
+            for pk, _, depth, _ in nodes:
+                issue = issues.get(str(pk))
+                if issue is not None:
+                    results.append({**issue, "depth": depth, **rollups[str(pk)]})
+
+            return Response(
+                {"root": str(issue_id), "issues": results}, status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class IssueMoveEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    # Place the issue between two issues of a state for drag and drop
+    def post(self, request, slug, project_id, issue_id):
+        try:
+            issue = Issue.objects.get(
+                pk=issue_id, workspace__slug=slug, project_id=project_id
+            )
+
+            state_id = request.data.get("state", None)
+            moves_state = state_id is not None and str(state_id) != str(issue.state_id)
+            if (
+                moves_state
+                and not State.objects.filter(
+                    pk=state_id, project_id=project_id
+                ).exists()
+            ):
+                return Response(
+                    {"error": "State does not exist in the project"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # The neighbours must be issues of the state the issue lands in
+            before_id = request.data.get("before", None)
+            after_id = request.data.get("after", None)
+            neighbour_ids = {str(pk) for pk in (before_id, after_id) if pk is not None}
+            if neighbour_ids and Issue.objects.filter(
+                pk__in=neighbour_ids,
+                project_id=project_id,
+                state_id=state_id if moves_state else issue.state_id,
+            ).count() != len(neighbour_ids):
+                return Response(
+                    {"error": "Before and after must be issues of the state"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if moves_state:
+                coalesce_issue_activity(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    actor_id=request.user.id,
+                    requested_data={"state": state_id},
+                )
+                issue.state_id = state_id
+                issue.save()
+
+            sort_order = move_rank(
+                Issue,
+                "sort_order",
+                {"project_id": project_id, "state_id": issue.state_id},
+                issue.id,
+                before_id=before_id,
+                after_id=after_id,
+            )
+
+            return Response(
+                {"id": issue.id, "state": issue.state_id, "sort_order": sort_order},
+                status=status.HTTP_200_OK,
+            )
+        except Issue.DoesNotExist:
+            return Response(
+                {"error": "Issue does not exist"}, status=status.HTTP_404_NOT_FOUND
+            )
+        except (ValidationError, ValueError):
+            return Response(
+                {"error": "Invalid issue or state id"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class IssueSyncEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+    renderer_classes = (JSONRenderer, NormalizedJSONRenderer)
+
+    # Issues changed and deleted since the token of the previous sync
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id):
+        try:
+            token = request.GET.get("token", None)
+            # Without a token the client starts syncing from now
+            if token is None:
+                return Response(
+                    {"issues": [], "deleted": [], "token": str(SyncToken.now())},
+                    status=status.HTTP_200_OK,
+                )
+
+            try:
+                token = SyncToken.from_string(token)
+            except ValueError:
+                return Response(
+                    {"error": "Invalid sync token"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if token.is_expired():
+                return Response(
+                    {"error": "Sync token expired, fetch the issues again"},
+                    status=status.HTTP_410_GONE,
+                )
+
+            issues = (
+                Issue.objects.filter(project_id=project_id, workspace__slug=slug)
+                .annotate(cycle_id=F("issue_cycle__id"))
+                .annotate(module_id=F("issue_module__id"))
+            )
+            issues, deleted, next_token = sync_changes(
+                issues, DeletedIssue.objects.filter(project_id=project_id), token
+            )
+
+            if is_normalized(request):
+                response = normalize_issues(issues)
+            else:
+                response = {"issues": serialize_issues(issues)}
+            response["deleted"] = deleted
+            response["token"] = str(next_token)
+            response["has_more"] = next_token.exact
+            return Response(response, status=status.HTTP_200_OK)
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class IssueLinkViewSet(BaseViewSet):
     permission_classes = [
         ProjectEntityPermission,
@@ -640,7 +1276,7 @@ class IssueLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .order_by("-created_at")
             .distinct()
         )
@@ -668,6 +1304,7 @@ class BulkCreateIssueLabelsEndpoint(BaseAPIView):
                 batch_size=50,
                 ignore_conflicts=True,
             )
+            bump_project_collections(Label, project_id)
 
             return Response(
                 {"labels": LabelSerializer(labels, many=True).data},
@@ -3,13 +3,14 @@ import json
 
 # Django Imports
 from django.db import IntegrityError
-from django.db.models import Prefetch, F, OuterRef, Func, Exists, Count, Q
+from django.db.models import Prefetch, F, OuterRef, Exists, Count, Q
 from django.core import serializers
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 
 # Third party imports
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework import status
 from sentry_sdk import capture_exception
 
@@ -24,6 +25,7 @@ from plane.api.serializers import (
     IssueStateSerializer,
 )
 from plane.api.permissions import ProjectEntityPermission
+from plane.api.renderers import NormalizedJSONRenderer, is_normalized
 from plane.db.models import (
     Module,
     ModuleIssue,
@@ -35,6 +37,11 @@ from plane.db.models import (
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import member_project_ids
+from plane.utils.issue_stats import schedule_issue_stats
+from plane.utils.issue_assignment import assign_issues
+from plane.utils.etag import bump_project_collections
+from plane.utils.issue_serializer import normalize_issues
 
 
 class ModuleViewSet(BaseViewSet):
@@ -73,37 +80,6 @@ class ModuleViewSet(BaseViewSet):
                     queryset=ModuleLink.objects.select_related("module", "created_by"),
                 )
             )
-            .annotate(total_issues=Count("issue_module"))
-            .annotate(
-                completed_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="completed"),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="cancelled"),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="started"),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="unstarted"),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="backlog"),
-                )
-            )
             .order_by("-is_favorite", "name")
         )
 
@@ -140,6 +116,7 @@ class ModuleViewSet(BaseViewSet):
 class ModuleIssueViewSet(BaseViewSet):
     serializer_class = ModuleIssueSerializer
     model = ModuleIssue
+    renderer_classes = (JSONRenderer, NormalizedJSONRenderer)
 
     filterset_fields = [
         "issue__labels__id",
@@ -160,16 +137,11 @@ class ModuleIssueViewSet(BaseViewSet):
         return self.filter_queryset(
             super()
             .get_queryset()
-            .annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("issue"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("module")
@@ -187,12 +159,6 @@ class ModuleIssueViewSet(BaseViewSet):
             filters = issue_filters(request.query_params, "GET")
             issues = (
                 Issue.objects.filter(issue_module__module_id=module_id)
-                .annotate(
-                    sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .annotate(bridge_id=F("issue_module__id"))
                 .filter(project_id=project_id)
                 .filter(workspace__slug=slug)
@@ -206,6 +172,11 @@ class ModuleIssueViewSet(BaseViewSet):
                 .filter(**filters)
             )
 
+            if is_normalized(request):
+                return Response(
+                    normalize_issues(issues, group_by), status=status.HTTP_200_OK
+                )
+
             issues_data = IssueStateSerializer(issues, many=True).data
 
             if group_by:
@@ -236,75 +207,57 @@ class ModuleIssueViewSet(BaseViewSet):
                 workspace__slug=slug, project_id=project_id, pk=module_id
             )
 
-            module_issues = list(ModuleIssue.objects.filter(issue_id__in=issues))
-
-            update_module_issue_activity = []
-            records_to_update = []
-            record_to_create = []
-
-            for issue in issues:
-                module_issue = [
-                    module_issue
-                    for module_issue in module_issues
-                    if str(module_issue.issue_id) in issues
-                ]
-
-                if len(module_issue):
-                    if module_issue[0].module_id != module_id:
-                        update_module_issue_activity.append(
-                            {
-                                "old_module_id": str(module_issue[0].module_id),
-                                "new_module_id": str(module_id),
-                                "issue_id": str(module_issue[0].issue_id),
-                            }
-                        )
-                        module_issue[0].module_id = module_id
-                        records_to_update.append(module_issue[0])
-                else:
-                    record_to_create.append(
-                        ModuleIssue(
-                            module=module,
-                            issue_id=issue,
-                            project_id=project_id,
-                            workspace=module.workspace,
-                            created_by=request.user,
-                            updated_by=request.user,
-                        )
-                    )
-
-            ModuleIssue.objects.bulk_create(
-                record_to_create,
-                batch_size=10,
-                ignore_conflicts=True,
+            # Issues already in the module are left alone, the others are
+            # inserted or moved over from their module in one upsert
+            created, moved = assign_issues(
+                ModuleIssue, "module", module, issues, request.user
             )
-
-            ModuleIssue.objects.bulk_update(
-                records_to_update,
-                ["module"],
-                batch_size=10,
+            update_module_issue_activity = [
+                {
+                    "old_module_id": old_module_id,
+                    "new_module_id": str(module_id),
+                    "issue_id": issue_id,
+                }
+                for issue_id, old_module_id in moved.items()
+            ]
+
+            # bulk writes skip the signals, recount the affected modules here
+            schedule_issue_stats(
+                Module, ModuleIssue, "module", [module_id, *moved.values()]
             )
+            bump_project_collections(ModuleIssue, project_id)
 
             # Capture Issue Activity
-            issue_activity.delay(
-                {
-                    "type": "issue.activity",
-                    "requested_data": json.dumps({"modules_list": issues}),
-                    "actor_id": str(self.request.user.id),
-                    "issue_id": str(self.kwargs.get("pk", None)),
-                    "project_id": str(self.kwargs.get("project_id", None)),
-                    "current_instance": json.dumps(
-                        {
-                            "updated_module_issues": update_module_issue_activity,
-                            "created_module_issues": serializers.serialize(
-                                "json", record_to_create
-                            ),
-                        }
-                    ),
-                },
-            )
+            if created or moved:
+                issue_activity.delay(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps({"modules_list": issues}),
+                        "actor_id": str(self.request.user.id),
+                        "issue_id": None,
+                        "project_id": str(self.kwargs.get("project_id", None)),
+                        "current_instance": json.dumps(
+                            {
+                                "updated_module_issues": update_module_issue_activity,
+                                "created_module_issues": serializers.serialize(
+                                    "json", created
+                                ),
+                            }
+                        ),
+                    },
+                )
 
+            # Return only the Module Issues written by this request
             return Response(
-                ModuleIssueSerializer(self.get_queryset(), many=True).data,
+                ModuleIssueSerializer(
+                    self.get_queryset().filter(
+                        issue_id__in=[
+                            *[str(row.issue_id) for row in created],
+                            *moved.keys(),
+                        ]
+                    ),
+                    many=True,
+                ).data,
                 status=status.HTTP_200_OK,
             )
         except Module.DoesNotExist:
@@ -340,7 +293,7 @@ class ModuleLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .order_by("-created_at")
             .distinct()
         )
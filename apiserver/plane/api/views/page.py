@@ -28,6 +28,8 @@ from plane.api.serializers import (
     PageFavoriteSerializer,
     IssueLiteSerializer,
 )
+from plane.utils.membership import member_project_ids
+from plane.utils.dashboard import record_user_activity, refresh_user_issue_rollups
 
 
 class PageViewSet(BaseViewSet):
@@ -52,7 +54,7 @@ class PageViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .filter(Q(owned_by=self.request.user) | Q(access=0))
             .select_related("project")
             .select_related("workspace")
@@ -111,7 +113,7 @@ class PageBlockViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(page_id=self.kwargs.get("page_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("page")
@@ -217,7 +219,7 @@ class CreateIssueFromPageBlockEndpoint(BaseAPIView):
                 issue=issue, assignee=request.user, project_id=project_id
             )
 
-            _ = IssueActivity.objects.create(
+            issue_activity = IssueActivity.objects.create(
                 issue=issue,
                 actor=request.user,
                 project_id=project_id,
@@ -225,6 +227,9 @@ class CreateIssueFromPageBlockEndpoint(BaseAPIView):
                 verb="created",
             )
 
+            record_user_activity(issue.workspace, [issue_activity])
+            refresh_user_issue_rollups(issue.workspace, [request.user.id])
+
             page_block.issue = issue
             page_block.save()
 
@@ -263,7 +268,7 @@ class RecentPagesEndpoint(BaseAPIView):
                     workspace__slug=slug,
                     project_id=project_id,
                 )
-                .filter(project__project_projectmember__member=request.user)
+                .filter(project_id__in=member_project_ids(request))
                 .annotate(is_favorite=Exists(subquery))
                 .filter(Q(owned_by=self.request.user) | Q(access=0))
                 .select_related("project")
@@ -287,7 +292,7 @@ class RecentPagesEndpoint(BaseAPIView):
                     workspace__slug=slug,
                     project_id=project_id,
                 )
-                .filter(project__project_projectmember__member=request.user)
+                .filter(project_id__in=member_project_ids(request))
                 .annotate(is_favorite=Exists(subquery))
                 .filter(Q(owned_by=self.request.user) | Q(access=0))
                 .select_related("project")
@@ -316,7 +321,7 @@ class RecentPagesEndpoint(BaseAPIView):
                 )
                 .annotate(is_favorite=Exists(subquery))
                 .filter(Q(owned_by=self.request.user) | Q(access=0))
-                .filter(project__project_projectmember__member=request.user)
+                .filter(project_id__in=member_project_ids(request))
                 .annotate(is_favorite=Exists(subquery))
                 .select_related("project")
                 .select_related("workspace")
@@ -371,7 +376,7 @@ class FavoritePagesEndpoint(BaseAPIView):
                 )
                 .annotate(is_favorite=Exists(subquery))
                 .filter(Q(owned_by=self.request.user) | Q(access=0))
-                .filter(project__project_projectmember__member=request.user)
+                .filter(project_id__in=member_project_ids(request))
                 .filter(is_favorite=True)
                 .select_related("project")
                 .select_related("workspace")
@@ -421,7 +426,7 @@ class MyPagesEndpoint(BaseAPIView):
                 .prefetch_related("labels")
                 .annotate(is_favorite=Exists(subquery))
                 .filter(Q(owned_by=self.request.user) | Q(access=0))
-                .filter(project__project_projectmember__member=request.user)
+                .filter(project_id__in=member_project_ids(request))
                 .prefetch_related(
                     Prefetch(
                         "blocks",
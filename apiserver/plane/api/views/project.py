@@ -48,6 +48,8 @@ from plane.db.models import (
     ProjectIdentifier,
 )
 from plane.bgtasks.project_invitation_task import project_invitation
+from plane.utils.membership import invalidate_memberships, member_project_ids
+from plane.utils.etag import collection_etag, bump_workspace_collections
 
 
 class ProjectViewSet(BaseViewSet):
@@ -73,7 +75,7 @@ class ProjectViewSet(BaseViewSet):
             super()
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
-            .filter(Q(project_projectmember__member=self.request.user) | Q(network=2))
+            .filter(Q(pk__in=member_project_ids(self.request)) | Q(network=2))
             .select_related(
                 "workspace", "workspace__owner", "default_assignee", "project_lead"
             )
@@ -81,6 +83,7 @@ class ProjectViewSet(BaseViewSet):
             .distinct()
         )
 
+    @collection_etag("projects", scope="slug")
     def list(self, request, slug):
         try:
             subquery = ProjectFavorite.objects.filter(
@@ -348,6 +351,14 @@ class UserProjectInvitationsViewset(BaseViewSet):
                     for invitation in project_invitations
                 ]
             )
+            invalidate_memberships(request.user.id)
+            bump_workspace_collections(
+                ProjectMember,
+                *{
+                    invitation.project.workspace.slug
+                    for invitation in project_invitations
+                },
+            )
 
             ## Delete joined project invites
             project_invitations.delete()
@@ -471,6 +482,8 @@ class AddTeamToProjectEndpoint(BaseAPIView):
             ProjectMember.objects.bulk_create(
                 project_members, batch_size=10, ignore_conflicts=True
             )
+            invalidate_memberships(*team_members)
+            bump_workspace_collections(ProjectMember, slug)
 
             serializer = ProjectMemberSerializer(project_members, many=True)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -617,6 +630,8 @@ class ProjectJoinEndpoint(BaseAPIView):
                 ],
                 ignore_conflicts=True,
             )
+            invalidate_memberships(request.user.id)
+            bump_workspace_collections(ProjectMember, slug)
 
             return Response(
                 {"message": "Projects joined successfully"},
@@ -2,7 +2,8 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.db.models import Q, Case, When, Value, FloatField
+from django.contrib.postgres.search import TrigramSimilarity
 
 # Third party imports
 from rest_framework import status
@@ -12,6 +13,44 @@ from sentry_sdk import capture_exception
 # Module imports
 from .base import BaseAPIView
 from plane.db.models import Workspace, Project, Issue, Cycle, Module, Page, IssueView
+from plane.utils.membership import member_project_ids
+
+
+# Number of results returned per entity type
+SEARCH_RESULT_LIMIT = 10
+
+
+def ranked_search(queryset, query, fields, extra_q=None):
+    """filter the queryset on the searched fields and rank the matches
+
+    Args:
+        queryset (QuerySet): scoped queryset of the searched entity
+        query (string): search text
+        fields (list): searched fields, the first one is the title
+        extra_q (Q): other conditions that count as an exact match
+
+    Returns:
+        QuerySet: best matches first, limited to SEARCH_RESULT_LIMIT
+    """
+    # icontains is served by the UPPER(field) gin_trgm_ops indexes (0027)
+    q = Q()
+    for field in fields:
+        q |= Q(**{f"{field}__icontains": query})
+
+    # Exact matches first, then title matches, then by title similarity
+    boosts = [When(**{f"{fields[0]}__icontains": query}, then=Value(1.0))]
+    if extra_q is not None:
+        q |= extra_q
+        boosts.insert(0, When(extra_q, then=Value(2.0)))
+
+    return (
+        queryset.filter(q)
+        .annotate(
+            rank=Case(*boosts, default=Value(0.0), output_field=FloatField())
+            + TrigramSimilarity(fields[0], query)
+        )
+        .order_by("-rank")[:SEARCH_RESULT_LIMIT]
+    )
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -20,41 +59,34 @@ class GlobalSearchEndpoint(BaseAPIView):
     """
 
     def filter_workspaces(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return Workspace.objects.filter(
-            q, workspace_member__member=self.request.user
-        ).distinct().values("name", "id", "slug")
+        return ranked_search(
+            Workspace.objects.filter(workspace_member__member=self.request.user),
+            query,
+            ["name"],
+        ).values("name", "id", "slug")
 
     def filter_projects(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return Project.objects.filter(
-            q,
-            Q(project_projectmember__member=self.request.user) | Q(network=2),
-            workspace__slug=slug,
-        ).distinct().values("name", "id", "identifier", "workspace__slug")
+        return ranked_search(
+            Project.objects.filter(
+                Q(pk__in=member_project_ids(self.request)) | Q(network=2),
+                workspace__slug=slug,
+            ),
+            query,
+            ["name"],
+        ).values("name", "id", "identifier", "workspace__slug")
 
     def filter_issues(self, query, slug, project_id):
-        fields = ["name", "sequence_id"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                sequences = re.findall(r"\d+\.\d+|\d+", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-        return Issue.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).distinct().values(
+        sequences = re.findall(r"\d+\.\d+|\d+", query)
+        return ranked_search(
+            Issue.objects.filter(
+                project_id__in=member_project_ids(self.request),
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            query,
+            ["name", "description_stripped"],
+            extra_q=Q(sequence_id__in=sequences) if len(sequences) else None,
+        ).values(
             "name",
             "id",
             "sequence_id",
@@ -64,16 +96,15 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_cycles(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).distinct().values(
+        return ranked_search(
+            Cycle.objects.filter(
+                project_id__in=member_project_ids(self.request),
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            query,
+            ["name"],
+        ).values(
             "name",
             "id",
             "project_id",
@@ -81,16 +112,15 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_modules(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).distinct().values(
+        return ranked_search(
+            Module.objects.filter(
+                project_id__in=member_project_ids(self.request),
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            query,
+            ["name"],
+        ).values(
             "name",
             "id",
             "project_id",
@@ -98,16 +128,15 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_pages(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return Page.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).distinct().values(
+        return ranked_search(
+            Page.objects.filter(
+                project_id__in=member_project_ids(self.request),
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            query,
+            ["name", "description_stripped"],
+        ).values(
             "name",
             "id",
             "project_id",
@@ -115,16 +144,15 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_views(self, query, slug, project_id):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return IssueView.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-            project_id=project_id,
-        ).distinct().values(
+        return ranked_search(
+            IssueView.objects.filter(
+                project_id__in=member_project_ids(self.request),
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            query,
+            ["name"],
+        ).values(
             "name",
             "id",
             "project_id",
@@ -3,6 +3,7 @@ from . import BaseViewSet
 from plane.api.serializers import ShortCutSerializer
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import Shortcut
+from plane.utils.membership import member_project_ids
 
 
 class ShortCutViewSet(BaseViewSet):
@@ -22,7 +23,7 @@ class ShortCutViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .distinct()
@@ -12,6 +12,8 @@ from . import BaseViewSet
 from plane.api.serializers import StateSerializer
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import State
+from plane.utils.membership import member_project_ids
+from plane.utils.etag import collection_etag
 
 
 class StateViewSet(BaseViewSet):
@@ -30,12 +32,13 @@ class StateViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .distinct()
         )
 
+    @collection_etag("states")
     def list(self, request, slug, project_id):
         try:
             state_dict = dict()
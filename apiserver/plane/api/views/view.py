@@ -4,17 +4,19 @@ from django.db.models import Prefetch, OuterRef, Exists
 
 # Third party imports
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework import status
+from rest_framework.exceptions import ParseError
 from sentry_sdk import capture_exception
 
 # Module imports
 from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import (
     IssueViewSerializer,
-    IssueLiteSerializer,
     IssueViewFavoriteSerializer,
 )
 from plane.api.permissions import ProjectEntityPermission
+from plane.api.renderers import NormalizedJSONRenderer, is_normalized
 from plane.db.models import (
     IssueView,
     Issue,
@@ -25,6 +27,18 @@ from plane.db.models import (
     IssueViewFavorite,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.grouper import (
+    group_cursor,
+    group_results,
+    group_queryset,
+    GROUP_BY_FIELDS,
+)
+from plane.utils.membership import member_project_ids
+from plane.utils.issue_serializer import (
+    serialize_issues,
+    normalize_issues,
+    normalize_groups,
+)
 
 
 class IssueViewViewSet(BaseViewSet):
@@ -49,7 +63,7 @@ class IssueViewViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .annotate(is_favorite=Exists(subquery))
@@ -62,6 +76,7 @@ class ViewIssuesEndpoint(BaseAPIView):
     permission_classes = [
         ProjectEntityPermission,
     ]
+    renderer_classes = (JSONRenderer, NormalizedJSONRenderer)
 
     def get(self, request, slug, project_id, view_id):
         try:
@@ -69,26 +84,53 @@ class ViewIssuesEndpoint(BaseAPIView):
             queries = view.query
 
             filters = issue_filters(request.query_params, "GET")
+            order_by = request.GET.get("order_by", "-created_at")
 
             issues = (
                 Issue.objects.filter(
                     **queries, project_id=project_id, workspace__slug=slug
                 )
                 .filter(**filters)
-                .select_related("project")
-                .select_related("workspace")
-                .select_related("state")
-                .select_related("parent")
-                .prefetch_related("assignees")
-                .prefetch_related("labels")
+                .order_by(order_by)
             )
 
-            serializer = IssueLiteSerializer(issues, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            group_by = request.GET.get("group_by", False)
+            cursor = request.GET.get("cursor", None)
+            normalized = is_normalized(request)
+
+            # Group in the database and page through every group
+            if group_by in GROUP_BY_FIELDS and (cursor or request.GET.get("per_page")):
+                groups = group_queryset(
+                    issues,
+                    group_by,
+                    order_by,
+                    limit=self.get_per_page(request),
+                    on_results=None if normalized else serialize_issues,
+                    group=request.GET.get("group", None),
+                    cursor=group_cursor(request),
+                )
+                return Response(
+                    normalize_groups(groups) if normalized else groups,
+                    status=status.HTTP_200_OK,
+                )
+
+            if normalized:
+                return Response(
+                    normalize_issues(issues, group_by), status=status.HTTP_200_OK
+                )
+
+            issues = serialize_issues(issues)
+            if group_by:
+                return Response(
+                    group_results(issues, group_by), status=status.HTTP_200_OK
+                )
+            return Response(issues, status=status.HTTP_200_OK)
         except IssueView.DoesNotExist:
             return Response(
                 {"error": "Issue View does not exist"}, status=status.HTTP_404_NOT_FOUND
             )
+        except ParseError as e:
+            return Response({"error": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -7,6 +7,7 @@ from dateutil.relativedelta import relativedelta
 from django.db import IntegrityError
 from django.db.models import Prefetch
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
@@ -20,7 +21,6 @@ from django.db.models import (
     Q,
 )
 from django.db.models.functions import ExtractWeek, Cast, ExtractDay
-from django.db.models.fields import DateField
 
 # Third party modules
 from rest_framework import status
@@ -46,11 +46,19 @@ from plane.db.models import (
     WorkspaceMemberInvite,
     Team,
     ProjectMember,
-    IssueActivity,
     Issue,
+    UserActivityRollup,
+    UserIssueRollup,
 )
 from plane.api.permissions import WorkSpaceBasePermission, WorkSpaceAdminPermission
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
+from plane.utils.membership import invalidate_memberships
+from plane.utils.issue_stats import STATE_GROUP_COUNTERS, ISSUE_STAT_FIELDS
+from plane.utils.dashboard import (
+    DASHBOARD_CACHE_TIMEOUT,
+    DASHBOARD_MONTHS,
+    dashboard_cache_key,
+)
 
 
 class WorkSpaceViewSet(BaseViewSet):
@@ -386,6 +394,7 @@ class UserWorkspaceInvitationsEndpoint(BaseViewSet):
                 ],
                 ignore_conflicts=True,
             )
+            invalidate_memberships(request.user.id)
 
             # Delete joined workspace invites
             workspace_invitations.delete()
@@ -597,14 +606,13 @@ class UserActivityGraphEndpoint(BaseAPIView):
     def get(self, request, slug):
         try:
             issue_activities = (
-                IssueActivity.objects.filter(
-                    actor=request.user,
+                UserActivityRollup.objects.filter(
+                    user=request.user,
                     workspace__slug=slug,
-                    created_at__date__gte=date.today() + relativedelta(months=-6),
+                    date__gte=date.today() + relativedelta(months=-6),
                 )
-                .annotate(created_date=Cast("created_at", DateField()))
-                .values("created_date")
-                .annotate(activity_count=Count("created_date"))
+                .annotate(created_date=F("date"))
+                .values("created_date", "activity_count")
                 .order_by("created_date")
             )
 
@@ -651,100 +659,103 @@ class WeekInMonth(Func):
 
 
 class UserWorkspaceDashboardEndpoint(BaseAPIView):
-    def get(self, request, slug):
-        try:
-            issue_activities = (
-                IssueActivity.objects.filter(
-                    actor=request.user,
-                    workspace__slug=slug,
-                    created_at__date__gte=date.today() + relativedelta(months=-3),
-                )
-                .annotate(created_date=Cast("created_at", DateField()))
-                .values("created_date")
-                .annotate(activity_count=Count("created_date"))
-                .order_by("created_date")
-            )
-
-            month = request.GET.get("month", 1)
-
-            completed_issues = (
-                Issue.objects.filter(
-                    assignees__in=[request.user],
-                    workspace__slug=slug,
-                    completed_at__month=month,
-                    completed_at__isnull=False,
-                )
-                .annotate(day_of_month=ExtractDay("completed_at"))
-                .annotate(week_in_month=WeekInMonth(F("day_of_month")))
-                .values("week_in_month")
-                .annotate(completed_count=Count("id"))
-                .order_by("week_in_month")
+    def get_dashboard(self, request, slug, month):
+        issue_activities = (
+            UserActivityRollup.objects.filter(
+                user=request.user,
+                workspace__slug=slug,
+                date__gte=date.today() + relativedelta(months=-3),
             )
+            .annotate(created_date=F("date"))
+            .values("created_date", "activity_count")
+            .order_by("created_date")
+        )
 
-            assigned_issues = Issue.objects.filter(
-                workspace__slug=slug, assignees__in=[request.user]
-            ).count()
-
-            pending_issues_count = Issue.objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
-                workspace__slug=slug,
+        completed_issues = (
+            Issue.objects.filter(
                 assignees__in=[request.user],
-            ).count()
-
-            completed_issues_count = Issue.objects.filter(
                 workspace__slug=slug,
-                assignees__in=[request.user],
-                state__group="completed",
-            ).count()
+                completed_at__month=month,
+                completed_at__isnull=False,
+            )
+            .annotate(day_of_month=ExtractDay("completed_at"))
+            .annotate(week_in_month=WeekInMonth(F("day_of_month")))
+            .values("week_in_month")
+            .annotate(completed_count=Count("id"))
+            .order_by("week_in_month")
+        )
 
-            issues_due_week = (
-                Issue.objects.filter(
-                    workspace__slug=slug,
-                    assignees__in=[request.user],
-                )
-                .annotate(target_week=ExtractWeek("target_date"))
-                .filter(target_week=timezone.now().date().isocalendar()[1])
-                .count()
-            )
+        # State group counts of the assigned issues come from the rollup
+        issue_rollup = (
+            UserIssueRollup.objects.filter(workspace__slug=slug, user=request.user)
+            .values(*ISSUE_STAT_FIELDS)
+            .first()
+        ) or {counter: 0 for counter in ISSUE_STAT_FIELDS}
 
-            state_distribution = (
-                Issue.objects.filter(workspace__slug=slug, assignees__in=[request.user])
-                .annotate(state_group=F("state__group"))
-                .values("state_group")
-                .annotate(state_count=Count("state_group"))
-                .order_by("state_group")
+        state_distribution = [
+            {"state_group": group, "state_count": issue_rollup[counter]}
+            for counter, group in sorted(
+                STATE_GROUP_COUNTERS.items(), key=lambda item: item[1]
             )
+            if issue_rollup[counter]
+        ]
 
-            overdue_issues = Issue.objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
+        issues_due_week = (
+            Issue.objects.filter(
                 workspace__slug=slug,
                 assignees__in=[request.user],
-                target_date__lt=timezone.now(),
-                completed_at__isnull=True,
-            ).values("id", "name", "workspace__slug", "project_id", "target_date")
+            )
+            .annotate(target_week=ExtractWeek("target_date"))
+            .filter(target_week=timezone.now().date().isocalendar()[1])
+            .count()
+        )
 
-            upcoming_issues = Issue.objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
-                target_date__gte=timezone.now(),
-                workspace__slug=slug,
-                assignees__in=[request.user],
-                completed_at__isnull=True,
-            ).values("id", "name", "workspace__slug", "project_id", "target_date")
+        # Overdue and upcoming issues are split from one query on target date
+        today = timezone.now().astimezone(timezone.get_default_timezone()).date()
+        open_issues = Issue.objects.filter(
+            ~Q(state__group__in=["completed", "cancelled"]),
+            workspace__slug=slug,
+            assignees__in=[request.user],
+            target_date__isnull=False,
+            completed_at__isnull=True,
+        ).values("id", "name", "workspace__slug", "project_id", "target_date")
+
+        overdue_issues = []
+        upcoming_issues = []
+        for issue in open_issues:
+            if issue["target_date"] < today:
+                overdue_issues.append(issue)
+            else:
+                upcoming_issues.append(issue)
+
+        return {
+            "issue_activities": list(issue_activities),
+            "completed_issues": list(completed_issues),
+            "assigned_issues_count": issue_rollup["total_issues"],
+            "pending_issues_count": issue_rollup["total_issues"]
+            - issue_rollup["completed_issues"]
+            - issue_rollup["cancelled_issues"],
+            "completed_issues_count": issue_rollup["completed_issues"],
+            "issues_due_week_count": issues_due_week,
+            "state_distribution": state_distribution,
+            "overdue_issues": overdue_issues,
+            "upcoming_issues": upcoming_issues,
+        }
 
-            return Response(
-                {
-                    "issue_activities": issue_activities,
-                    "completed_issues": completed_issues,
-                    "assigned_issues_count": assigned_issues,
-                    "pending_issues_count": pending_issues_count,
-                    "completed_issues_count": completed_issues_count,
-                    "issues_due_week_count": issues_due_week,
-                    "state_distribution": state_distribution,
-                    "overdue_issues": overdue_issues,
-                    "upcoming_issues": upcoming_issues,
-                },
-                status=status.HTTP_200_OK,
-            )
+    def get(self, request, slug):
+        try:
+            month = str(request.GET.get("month", 1))
+
+            # Served from the cache, dropped whenever the activity pipeline
+            # updates the rollups of the user
+            cache_key = dashboard_cache_key(slug, request.user.id, month)
+            dashboard = cache.get(cache_key) if month in DASHBOARD_MONTHS else None
+            if dashboard is None:
+                dashboard = self.get_dashboard(request, slug, month)
+                if month in DASHBOARD_MONTHS:
+                    cache.set(cache_key, dashboard, DASHBOARD_CACHE_TIMEOUT)
+
+            return Response(dashboard, status=status.HTTP_200_OK)
 
         except Exception as e:
             capture_exception(e)
@@ -7,6 +7,8 @@ from datetime import datetime
 
 # Django imports
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.auth.hashers import make_password
 
@@ -26,6 +28,15 @@ from plane.db.models import (
     Label,
     User,
 )
+from plane.utils.membership import invalidate_memberships
+from plane.utils.etag import bump_workspace_collections
+from plane.utils.dashboard import refresh_user_issue_rollups
+from plane.utils.importers.issues import (
+    read_issues_data,
+    chunked,
+    default_import_state,
+    import_issues,
+)
 from .workspace_invitation_task import workspace_invitation
 
 
@@ -86,6 +97,8 @@ def service_importer(service, importer_id):
             batch_size=100,
             ignore_conflicts=True,
         )
+        invalidate_memberships(*[user.id for user in workspace_users])
+        bump_workspace_collections(ProjectMember, importer.workspace.slug)
 
         # Check if sync config is on for github importers
         if service == "github" and importer.config.get("sync", False):
@@ -161,3 +174,50 @@ def service_importer(service, importer_id):
         importer.save()
         capture_exception(e)
         return
+
+
+@job("default")
+def bulk_import_issues(importer_id, user_id):
+    try:
+        importer = Importer.objects.select_related("project__workspace").get(
+            pk=importer_id
+        )
+        actor = User.objects.get(pk=user_id)
+        project = importer.project
+
+        with importer.issues_file.open("rb") as file:
+            total_issues = sum(1 for _ in read_issues_data(file))
+        Importer.objects.filter(pk=importer_id).update(
+            total_issues=total_issues, status="processing"
+        )
+
+        default_state = default_import_state(project.id)
+
+        # A retried job continues after the chunks already committed
+        imported_issues = importer.imported_issues
+        assignee_ids = set()
+        with importer.issues_file.open("rb") as file:
+            issues_data = read_issues_data(file)
+            for _ in range(imported_issues):
+                next(issues_data, None)
+
+            for chunk in chunked(issues_data):
+                with transaction.atomic():
+                    _, chunk_assignee_ids = import_issues(
+                        project, chunk, actor, importer.service, default_state
+                    )
+                    Importer.objects.filter(pk=importer_id).update(
+                        imported_issues=F("imported_issues") + len(chunk)
+                    )
+                assignee_ids.update(chunk_assignee_ids)
+
+        refresh_user_issue_rollups(project.workspace, assignee_ids)
+        importer.issues_file.delete(save=False)
+        Importer.objects.filter(pk=importer_id).update(
+            issues_file=None, status="completed"
+        )
+        return
+    except Exception as e:
+        Importer.objects.filter(pk=importer_id).update(status="failed")
+        capture_exception(e)
+        return
@@ -1,12 +1,15 @@
 # Python imports
 import json
-import requests
+from datetime import timedelta
 
 # Django imports
 from django.conf import settings
+from django.db.models import Q
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Third Party imports
+import django_rq
 from django_rq import job
 from sentry_sdk import capture_exception
 
@@ -20,8 +23,34 @@ from plane.db.models import (
     State,
     Cycle,
     Module,
+    IssueBlocker,
+    IssueAssignee,
 )
-from plane.api.serializers import IssueActivitySerializer
+from plane.settings.redis import shared_redis_instance
+from plane.utils.dashboard import record_user_activity, refresh_user_issue_rollups
+from plane.utils.relations import diff_ids, merge_diffs
+from .webhook_task import issue_activity_webhook
+
+# Seconds during which updates to the same issue by the same actor are merged
+ISSUE_ACTIVITY_COALESCE_WINDOW = 5
+
+# Appends an update to the open window of the issue, or opens it with the
+# given snapshot. Atomic with the flush, an update never lands in a window
+# that is already flushed. Returns 1 when it opened the window, 0 when it
+# joined it and -1 when there is none and no snapshot was given
+COALESCE_ISSUE_ACTIVITY_SCRIPT = """
+local opened = 0
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    if ARGV[3] == "" then
+        return -1
+    end
+    redis.call("SET", KEYS[1], ARGV[3], "EX", ARGV[2])
+    opened = 1
+end
+redis.call("RPUSH", KEYS[2], ARGV[1])
+redis.call("EXPIRE", KEYS[2], ARGV[2])
+return opened
+"""
 
 
 # Track Chnages in name
@@ -32,6 +61,7 @@ def track_name(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("name") != requested_data.get("name"):
         issue_activities.append(
@@ -57,10 +87,11 @@ def track_parent(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("parent") != requested_data.get("parent"):
         if requested_data.get("parent") == None:
-            old_parent = Issue.objects.get(pk=current_instance.get("parent"))
+            old_parent = objects["issues"][str(current_instance.get("parent"))]
             issue_activities.append(
                 IssueActivity(
                     issue_id=issue_id,
@@ -77,8 +108,8 @@ def track_parent(
                 )
             )
         else:
-            new_parent = Issue.objects.get(pk=requested_data.get("parent"))
-            old_parent = Issue.objects.filter(pk=current_instance.get("parent")).first()
+            new_parent = objects["issues"][str(requested_data.get("parent"))]
+            old_parent = objects["issues"].get(str(current_instance.get("parent")))
             issue_activities.append(
                 IssueActivity(
                     issue_id=issue_id,
@@ -106,6 +137,7 @@ def track_priority(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("priority") != requested_data.get("priority"):
         if requested_data.get("priority") == None:
@@ -146,10 +178,11 @@ def track_state(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("state") != requested_data.get("state"):
-        new_state = State.objects.get(pk=requested_data.get("state", None))
-        old_state = State.objects.get(pk=current_instance.get("state", None))
+        new_state = objects["states"][str(requested_data.get("state", None))]
+        old_state = objects["states"][str(current_instance.get("state", None))]
 
         issue_activities.append(
             IssueActivity(
@@ -176,6 +209,7 @@ def track_description(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("description_html") != requested_data.get(
         "description_html"
@@ -203,6 +237,7 @@ def track_target_date(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("target_date") != requested_data.get("target_date"):
         if requested_data.get("target_date") == None:
@@ -243,6 +278,7 @@ def track_start_date(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     if current_instance.get("start_date") != requested_data.get("start_date"):
         if requested_data.get("start_date") == None:
@@ -275,6 +311,15 @@ def track_start_date(
             )
 
 
+def relation_changes(requested_data, field, current_ids):
+    """ids added to and removed from a relation list, taken from the diff
+    the serializer wrote when the event carries one"""
+    diff = (requested_data.get("relation_diffs") or {}).get(field)
+    if diff is None:
+        diff = diff_ids(requested_data.get(field) or [], current_ids)
+    return diff["added"], diff["removed"]
+
+
 # Track changes in issue labels
 def track_labels(
     requested_data,
@@ -283,48 +328,53 @@ def track_labels(
     project,
     actor,
     issue_activities,
+    objects,
 ):
+    added, removed = relation_changes(
+        requested_data, "labels_list", current_instance.get("labels") or []
+    )
+
     # Label Addition
-    if len(requested_data.get("labels_list")) > len(current_instance.get("labels")):
-        for label in requested_data.get("labels_list"):
-            if label not in current_instance.get("labels"):
-                label = Label.objects.get(pk=label)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value="",
-                        new_value=label.name,
-                        field="labels",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} added label {label.name}",
-                        new_identifier=label.id,
-                        old_identifier=None,
-                    )
-                )
+    for label_id in added:
+        label = objects["labels"].get(label_id)
+        if label is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value="",
+                new_value=label.name,
+                field="labels",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} added label {label.name}",
+                new_identifier=label.id,
+                old_identifier=None,
+            )
+        )
 
     # Label Removal
-    if len(requested_data.get("labels_list")) < len(current_instance.get("labels")):
-        for label in current_instance.get("labels"):
-            if label not in requested_data.get("labels_list"):
-                label = Label.objects.get(pk=label)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value=label.name,
-                        new_value="",
-                        field="labels",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} removed label {label.name}",
-                        old_identifier=label.id,
-                        new_identifier=None,
-                    )
-                )
+    for label_id in removed:
+        label = objects["labels"].get(label_id)
+        if label is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value=label.name,
+                new_value="",
+                field="labels",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} removed label {label.name}",
+                old_identifier=label.id,
+                new_identifier=None,
+            )
+        )
 
 
 # Track changes in issue assignees
@@ -335,50 +385,51 @@ def track_assignees(
     project,
     actor,
     issue_activities,
+    objects,
 ):
+    added, removed = relation_changes(
+        requested_data, "assignees_list", current_instance.get("assignees") or []
+    )
+
     # Assignee Addition
-    if len(requested_data.get("assignees_list")) > len(
-        current_instance.get("assignees")
-    ):
-        for assignee in requested_data.get("assignees_list"):
-            if assignee not in current_instance.get("assignees"):
-                assignee = User.objects.get(pk=assignee)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value="",
-                        new_value=assignee.email,
-                        field="assignees",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} added assignee {assignee.email}",
-                        new_identifier=actor.id,
-                    )
-                )
+    for assignee_id in added:
+        assignee = objects["users"].get(assignee_id)
+        if assignee is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value="",
+                new_value=assignee.email,
+                field="assignees",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} added assignee {assignee.email}",
+                new_identifier=actor.id,
+            )
+        )
 
     # Assignee Removal
-    if len(requested_data.get("assignees_list")) < len(
-        current_instance.get("assignees")
-    ):
-        for assignee in current_instance.get("assignees"):
-            if assignee not in requested_data.get("assignees_list"):
-                assignee = User.objects.get(pk=assignee)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value=assignee.email,
-                        new_value="",
-                        field="assignee",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} removed assignee {assignee.email}",
-                        old_identifier=actor.id,
-                    )
-                )
+    for assignee_id in removed:
+        assignee = objects["users"].get(assignee_id)
+        if assignee is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value=assignee.email,
+                new_value="",
+                field="assignee",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} removed assignee {assignee.email}",
+                old_identifier=actor.id,
+            )
+        )
 
 
 # Track changes in blocking issues
@@ -389,58 +440,55 @@ def track_blocks(
     project,
     actor,
     issue_activities,
+    objects,
 ):
-    if len(requested_data.get("blocks_list")) > len(
-        current_instance.get("blocked_issues")
-    ):
-        for block in requested_data.get("blocks_list"):
-            if (
-                len(
-                    [
-                        blocked
-                        for blocked in current_instance.get("blocked_issues")
-                        if blocked.get("block") == block
-                    ]
-                )
-                == 0
-            ):
-                issue = Issue.objects.get(pk=block)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value="",
-                        new_value=f"{project.identifier}-{issue.sequence_id}",
-                        field="blocks",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} added blocking issue {project.identifier}-{issue.sequence_id}",
-                        new_identifier=issue.id,
-                    )
-                )
+    added, removed = relation_changes(
+        requested_data,
+        "blocks_list",
+        [
+            blocked.get("block")
+            for blocked in current_instance.get("blocked_issues") or []
+        ],
+    )
+
+    for block_id in added:
+        issue = objects["issues"].get(block_id)
+        if issue is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value="",
+                new_value=f"{project.identifier}-{issue.sequence_id}",
+                field="blocks",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} added blocking issue {project.identifier}-{issue.sequence_id}",
+                new_identifier=issue.id,
+            )
+        )
 
     # Blocked Issue Removal
-    if len(requested_data.get("blocks_list")) < len(
-        current_instance.get("blocked_issues")
-    ):
-        for blocked in current_instance.get("blocked_issues"):
-            if blocked.get("block") not in requested_data.get("blocks_list"):
-                issue = Issue.objects.get(pk=blocked.get("block"))
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value=f"{project.identifier}-{issue.sequence_id}",
-                        new_value="",
-                        field="blocks",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} removed blocking issue {project.identifier}-{issue.sequence_id}",
-                        old_identifier=issue.id,
-                    )
-                )
+    for block_id in removed:
+        issue = objects["issues"].get(block_id)
+        if issue is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value=f"{project.identifier}-{issue.sequence_id}",
+                new_value="",
+                field="blocks",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} removed blocking issue {project.identifier}-{issue.sequence_id}",
+                old_identifier=issue.id,
+            )
+        )
 
 
 # Track changes in blocked_by issues
@@ -451,58 +499,55 @@ def track_blockings(
     project,
     actor,
     issue_activities,
+    objects,
 ):
-    if len(requested_data.get("blockers_list")) > len(
-        current_instance.get("blocker_issues")
-    ):
-        for block in requested_data.get("blockers_list"):
-            if (
-                len(
-                    [
-                        blocked
-                        for blocked in current_instance.get("blocker_issues")
-                        if blocked.get("blocked_by") == block
-                    ]
-                )
-                == 0
-            ):
-                issue = Issue.objects.get(pk=block)
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value="",
-                        new_value=f"{project.identifier}-{issue.sequence_id}",
-                        field="blocking",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} added blocked by issue {project.identifier}-{issue.sequence_id}",
-                        new_identifier=issue.id,
-                    )
-                )
+    added, removed = relation_changes(
+        requested_data,
+        "blockers_list",
+        [
+            blocked.get("blocked_by")
+            for blocked in current_instance.get("blocker_issues") or []
+        ],
+    )
+
+    for blocker_id in added:
+        issue = objects["issues"].get(blocker_id)
+        if issue is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value="",
+                new_value=f"{project.identifier}-{issue.sequence_id}",
+                field="blocking",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} added blocked by issue {project.identifier}-{issue.sequence_id}",
+                new_identifier=issue.id,
+            )
+        )
 
     # Blocked Issue Removal
-    if len(requested_data.get("blockers_list")) < len(
-        current_instance.get("blocker_issues")
-    ):
-        for blocked in current_instance.get("blocker_issues"):
-            if blocked.get("blocked_by") not in requested_data.get("blockers_list"):
-                issue = Issue.objects.get(pk=blocked.get("blocked_by"))
-                issue_activities.append(
-                    IssueActivity(
-                        issue_id=issue_id,
-                        actor=actor,
-                        verb="updated",
-                        old_value=f"{project.identifier}-{issue.sequence_id}",
-                        new_value="",
-                        field="blocking",
-                        project=project,
-                        workspace=project.workspace,
-                        comment=f"{actor.email} removed blocked by issue {project.identifier}-{issue.sequence_id}",
-                        old_identifier=issue.id,
-                    )
-                )
+    for blocker_id in removed:
+        issue = objects["issues"].get(blocker_id)
+        if issue is None:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor=actor,
+                verb="updated",
+                old_value=f"{project.identifier}-{issue.sequence_id}",
+                new_value="",
+                field="blocking",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} removed blocked by issue {project.identifier}-{issue.sequence_id}",
+                old_identifier=issue.id,
+            )
+        )
 
 
 def track_cycles(
@@ -512,18 +557,20 @@ def track_cycles(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     # Updated Records:
     updated_records = current_instance.get("updated_cycle_issues", [])
-    created_records = json.loads(current_instance.get("created_cycle_issues", []))
+    created_records = json.loads(current_instance.get("created_cycle_issues", "[]"))
+    removed_records = current_instance.get("removed_cycle_issues", [])
 
     for updated_record in updated_records:
-        old_cycle = Cycle.objects.filter(
-            pk=updated_record.get("old_cycle_id", None)
-        ).first()
-        new_cycle = Cycle.objects.filter(
-            pk=updated_record.get("new_cycle_id", None)
-        ).first()
+        old_cycle = objects["cycles"].get(
+            str(updated_record.get("old_cycle_id", None))
+        )
+        new_cycle = objects["cycles"].get(
+            str(updated_record.get("new_cycle_id", None))
+        )
 
         issue_activities.append(
             IssueActivity(
@@ -542,9 +589,9 @@ def track_cycles(
         )
 
     for created_record in created_records:
-        cycle = Cycle.objects.filter(
-            pk=created_record.get("fields").get("cycle")
-        ).first()
+        cycle = objects["cycles"].get(
+            str(created_record.get("fields").get("cycle"))
+        )
 
         issue_activities.append(
             IssueActivity(
@@ -561,6 +608,27 @@ def track_cycles(
             )
         )
 
+    for removed_record in removed_records:
+        cycle = objects["cycles"].get(str(removed_record.get("cycle_id")))
+        if cycle is None:
+            continue
+
+        issue_activities.append(
+            IssueActivity(
+                issue_id=removed_record.get("issue_id"),
+                actor=actor,
+                verb="updated",
+                old_value=cycle.name,
+                new_value="",
+                field="cycles",
+                project=project,
+                workspace=project.workspace,
+                comment=f"{actor.email} removed cycle {cycle.name}",
+                old_identifier=cycle.id,
+                new_identifier=None,
+            )
+        )
+
 
 def track_modules(
     requested_data,
@@ -569,18 +637,19 @@ def track_modules(
     project,
     actor,
     issue_activities,
+    objects,
 ):
     # Updated Records:
     updated_records = current_instance.get("updated_module_issues", [])
     created_records = json.loads(current_instance.get("created_module_issues", []))
 
     for updated_record in updated_records:
-        old_module = Module.objects.filter(
-            pk=updated_record.get("old_module_id", None)
-        ).first()
-        new_module = Module.objects.filter(
-            pk=updated_record.get("new_module_id", None)
-        ).first()
+        old_module = objects["modules"].get(
+            str(updated_record.get("old_module_id", None))
+        )
+        new_module = objects["modules"].get(
+            str(updated_record.get("new_module_id", None))
+        )
 
         issue_activities.append(
             IssueActivity(
@@ -599,9 +668,9 @@ def track_modules(
         )
 
     for created_record in created_records:
-        module = Module.objects.filter(
-            pk=created_record.get("fields").get("module")
-        ).first()
+        module = objects["modules"].get(
+            str(created_record.get("fields").get("module"))
+        )
         issue_activities.append(
             IssueActivity(
                 issue_id=created_record.get("fields").get("issue"),
@@ -618,6 +687,82 @@ def track_modules(
         )
 
 
+# Collect every id an update event refers to and load each model once
+def prefetch_activity_objects(requested_data, current_instance):
+    issue_ids, state_ids, label_ids = set(), set(), set()
+    user_ids, cycle_ids, module_ids = set(), set(), set()
+
+    if "parent" in requested_data:
+        issue_ids.update([requested_data.get("parent"), current_instance.get("parent")])
+    if "state" in requested_data:
+        state_ids.update([requested_data.get("state"), current_instance.get("state")])
+    if "labels_list" in requested_data:
+        label_ids.update(requested_data.get("labels_list") or [])
+        label_ids.update(current_instance.get("labels") or [])
+    if "assignees_list" in requested_data:
+        user_ids.update(requested_data.get("assignees_list") or [])
+        user_ids.update(current_instance.get("assignees") or [])
+    if "blocks_list" in requested_data:
+        issue_ids.update(requested_data.get("blocks_list") or [])
+        issue_ids.update(
+            blocked.get("block")
+            for blocked in current_instance.get("blocked_issues") or []
+        )
+    if "blockers_list" in requested_data:
+        issue_ids.update(requested_data.get("blockers_list") or [])
+        issue_ids.update(
+            blocked.get("blocked_by")
+            for blocked in current_instance.get("blocker_issues") or []
+        )
+    # The written diffs may name rows changed since the snapshot
+    relation_ids = {
+        "labels_list": label_ids,
+        "assignees_list": user_ids,
+        "blocks_list": issue_ids,
+        "blockers_list": issue_ids,
+    }
+    for field, diff in (requested_data.get("relation_diffs") or {}).items():
+        if field in requested_data and field in relation_ids:
+            relation_ids[field].update(diff.get("added", []) + diff.get("removed", []))
+    if "cycles_list" in requested_data:
+        for record in current_instance.get("updated_cycle_issues", []):
+            cycle_ids.update([record.get("old_cycle_id"), record.get("new_cycle_id")])
+        for record in json.loads(current_instance.get("created_cycle_issues", "[]")):
+            cycle_ids.add(record.get("fields").get("cycle"))
+        for record in current_instance.get("removed_cycle_issues", []):
+            cycle_ids.add(record.get("cycle_id"))
+    if "modules_list" in requested_data:
+        for record in current_instance.get("updated_module_issues", []):
+            module_ids.update(
+                [record.get("old_module_id"), record.get("new_module_id")]
+            )
+        for record in json.loads(current_instance.get("created_module_issues", "[]")):
+            module_ids.add(record.get("fields").get("module"))
+
+    return load_activity_objects(
+        issue_ids, state_ids, label_ids, user_ids, cycle_ids, module_ids
+    )
+
+
+def load_activity_objects(
+    issue_ids=(), state_ids=(), label_ids=(), user_ids=(), cycle_ids=(), module_ids=()
+):
+    def load(queryset, ids):
+        ids = [str(pk) for pk in ids if pk is not None]
+        if not ids:
+            return {}
+        return {str(pk): obj for pk, obj in queryset.in_bulk(ids).items()}
+
+    return {
+        "issues": load(Issue.objects.only("id", "name", "sequence_id"), issue_ids),
+        "states": load(State.objects.only("id", "name"), state_ids),
+        "labels": load(Label.objects.only("id", "name"), label_ids),
+        "users": load(User.objects.only("id", "email"), user_ids),
+        "cycles": load(Cycle.objects.only("id", "name"), cycle_ids),
+        "modules": load(Module.objects.only("id", "name"), module_ids),
+    }
+
+
 def create_issue_activity(
     requested_data, current_instance, issue_id, project, actor, issue_activities
 ):
@@ -634,7 +779,13 @@ def create_issue_activity(
 
 
 def update_issue_activity(
-    requested_data, current_instance, issue_id, project, actor, issue_activities
+    requested_data,
+    current_instance,
+    issue_id,
+    project,
+    actor,
+    issue_activities,
+    objects=None,
 ):
     ISSUE_ACTIVITY_MAPPER = {
         "name": track_name,
@@ -651,6 +802,8 @@ def update_issue_activity(
         "cycles_list": track_cycles,
         "modules_list": track_modules,
     }
+    if objects is None:
+        objects = prefetch_activity_objects(requested_data, current_instance)
     for key in requested_data:
         func = ISSUE_ACTIVITY_MAPPER.get(key, None)
         if func is not None:
@@ -661,6 +814,7 @@ def update_issue_activity(
                 project,
                 actor,
                 issue_activities,
+                objects,
             )
 
 
@@ -758,7 +912,7 @@ def issue_activity(event):
 
         actor = User.objects.get(pk=actor_id)
 
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("workspace").get(pk=project_id)
 
         ACTIVITY_MAPPER = {
             "issue.activity.created": create_issue_activity,
@@ -782,21 +936,259 @@ def issue_activity(event):
 
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
+
+        # Keep the dashboard rollups of the actor and the assignees current
+        record_user_activity(project.workspace, issue_activities_created)
+        if type.startswith("issue.activity"):
+            assignee_ids = set(
+                IssueAssignee.objects.filter(issue_id=issue_id).values_list(
+                    "assignee_id", flat=True
+                )
+            )
+            assignee_ids.update((current_instance or {}).get("assignees", []))
+            assignee_ids.update((requested_data or {}).get("assignees_list", []))
+            refresh_user_issue_rollups(project.workspace, assignee_ids)
+
         # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            # Don't send activities if the actor is a bot
-            if settings.PROXY_BASE_URL:
-                for issue_activity in issue_activities_created:
-                    headers = {"Content-Type": "application/json"}
-                    issue_activity_json = json.dumps(
-                        IssueActivitySerializer(issue_activity).data,
-                        cls=DjangoJSONEncoder,
-                    )
-                    _ = requests.post(
-                        f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
-                        json=issue_activity_json,
-                        headers=headers,
-                    )
+        if len(issue_activities_created) and settings.PROXY_BASE_URL:
+            issue_activity_webhook.delay(
+                [str(issue_activity.id) for issue_activity in issue_activities_created]
+            )
+        return
+    except Exception as e:
+        capture_exception(e)
+        return
+
+
+@job("default")
+def bulk_issue_activity(event):
+    """activities of one change set applied to many issues, written at once
+
+    The event holds the change set as requested_data, the issue id ->
+    snapshot before the change as current_instances, each snapshot with the
+    relation diffs written for its issue, and the cycle records of the move
+    or of the removal from the cycles
+    """
+    try:
+        requested_data = json.loads(event.get("requested_data"))
+        current_instances = json.loads(event.get("current_instances"))
+        cycle_records = json.loads(event.get("cycle_records") or "{}")
+
+        actor = User.objects.get(pk=event.get("actor_id"))
+        project = Project.objects.select_related("workspace").get(
+            pk=event.get("project_id")
+        )
+
+        relation_diffs = {
+            issue_id: current_instance.pop("relation_diffs", {})
+            for issue_id, current_instance in current_instances.items()
+        }
+        label_ids, user_ids = set(), set()
+        for diffs in relation_diffs.values():
+            for field, ids in (
+                ("labels_list", label_ids),
+                ("assignees_list", user_ids),
+            ):
+                diff = diffs.get(field) or {}
+                ids.update(diff.get("added", []) + diff.get("removed", []))
+        cycle_ids = {
+            pk
+            for record in cycle_records.get("updated_cycle_issues", [])
+            for pk in (record.get("old_cycle_id"), record.get("new_cycle_id"))
+        }
+        cycle_ids.update(
+            record.get("fields").get("cycle")
+            for record in json.loads(cycle_records.get("created_cycle_issues", "[]"))
+        )
+        cycle_ids.update(
+            record.get("cycle_id")
+            for record in cycle_records.get("removed_cycle_issues", [])
+        )
+        # Every model the trackers look up is loaded once for all the issues
+        objects = load_activity_objects(
+            state_ids={requested_data.get("state")}
+            | {
+                current_instance.get("state")
+                for current_instance in current_instances.values()
+            },
+            label_ids=label_ids,
+            user_ids=user_ids,
+            cycle_ids=cycle_ids,
+        )
+
+        issue_activities = []
+        for issue_id, current_instance in current_instances.items():
+            update_issue_activity(
+                {**requested_data, "relation_diffs": relation_diffs[issue_id]},
+                current_instance,
+                issue_id,
+                project,
+                actor,
+                issue_activities,
+                objects,
+            )
+        if cycle_records:
+            track_cycles(
+                {"cycles_list": list(current_instances.keys())},
+                cycle_records,
+                None,
+                project,
+                actor,
+                issue_activities,
+                objects,
+            )
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=100
+        )
+
+        record_user_activity(project.workspace, issue_activities_created)
+        assignee_ids = set(
+            IssueAssignee.objects.filter(
+                issue_id__in=list(current_instances.keys())
+            ).values_list("assignee_id", flat=True)
+        )
+        assignee_ids.update(user_ids)
+        refresh_user_issue_rollups(project.workspace, assignee_ids)
+
+        if len(issue_activities_created) and settings.PROXY_BASE_URL:
+            issue_activity_webhook.delay(
+                [str(issue_activity.id) for issue_activity in issue_activities_created]
+            )
+        return
+    except Exception as e:
+        capture_exception(e)
+        return
+
+
+# Only the fields the update trackers compare against
+def issue_activity_snapshot(issue_id):
+    issue = (
+        Issue.objects.filter(pk=issue_id)
+        .annotate(
+            label_ids=ArrayAgg(
+                "labels__id", distinct=True, filter=Q(labels__isnull=False)
+            ),
+            assignee_ids=ArrayAgg(
+                "assignees__id", distinct=True, filter=Q(assignees__isnull=False)
+            ),
+        )
+        .values(
+            "id",
+            "name",
+            "parent",
+            "priority",
+            "state",
+            "description_html",
+            "target_date",
+            "start_date",
+            "label_ids",
+            "assignee_ids",
+        )
+        .first()
+    )
+    if issue is None:
+        return None
+
+    issue["labels"] = issue.pop("label_ids") or []
+    issue["assignees"] = issue.pop("assignee_ids") or []
+    blockers = IssueBlocker.objects.filter(
+        Q(block_id=issue_id) | Q(blocked_by_id=issue_id)
+    ).values("block", "blocked_by")
+    issue["blocked_issues"] = [
+        {"block": blocker["block"]}
+        for blocker in blockers
+        if str(blocker["blocked_by"]) == str(issue_id)
+    ]
+    issue["blocker_issues"] = [
+        {"blocked_by": blocker["blocked_by"]}
+        for blocker in blockers
+        if str(blocker["block"]) == str(issue_id)
+    ]
+    return json.loads(json.dumps(issue, cls=DjangoJSONEncoder))
+
+
+def coalesce_issue_activity(issue_id, project_id, actor_id, requested_data):
+    """Merge rapid updates to an issue into a single activity job
+
+    The snapshot taken before the first update of the window is kept and
+    the requested data of every following update is appended, the flush
+    job then diffs the first snapshot against the merged requested data
+    """
+    snapshot_key = f"issue_activity:{issue_id}:{actor_id}:snapshot"
+    updates_key = f"issue_activity:{issue_id}:{actor_id}:updates"
+    expiry = ISSUE_ACTIVITY_COALESCE_WINDOW * 10
+
+    ri = shared_redis_instance()
+    coalesce = ri.register_script(COALESCE_ISSUE_ACTIVITY_SCRIPT)
+    update = json.dumps(requested_data, cls=DjangoJSONEncoder)
+
+    # Only snapshot the issue when no window is open for it yet, and again
+    # when the window is flushed before the update is appended
+    snapshot = ""
+    if not ri.exists(snapshot_key):
+        current_instance = issue_activity_snapshot(issue_id)
+        if current_instance is None:
+            return
+        snapshot = json.dumps(current_instance)
+
+    opened = coalesce(keys=[snapshot_key, updates_key], args=[update, expiry, snapshot])
+    if opened == -1:
+        current_instance = issue_activity_snapshot(issue_id)
+        if current_instance is None:
+            return
+        opened = coalesce(
+            keys=[snapshot_key, updates_key],
+            args=[update, expiry, json.dumps(current_instance)],
+        )
+
+    # The update that opened the window schedules its flush
+    if opened == 1:
+        django_rq.get_queue("default").enqueue_in(
+            timedelta(seconds=ISSUE_ACTIVITY_COALESCE_WINDOW),
+            flush_issue_activity,
+            str(issue_id),
+            str(project_id),
+            str(actor_id),
+        )
+
+
+@job("default")
+def flush_issue_activity(issue_id, project_id, actor_id):
+    try:
+        snapshot_key = f"issue_activity:{issue_id}:{actor_id}:snapshot"
+        updates_key = f"issue_activity:{issue_id}:{actor_id}:updates"
+
+        pipe = shared_redis_instance().pipeline()
+        pipe.get(snapshot_key)
+        pipe.lrange(updates_key, 0, -1)
+        pipe.delete(snapshot_key, updates_key)
+        current_instance, updates, _ = pipe.execute()
+
+        if current_instance is None or not len(updates):
+            return
+
+        # Later updates of the window win over earlier ones, the written
+        # relation diffs add up to one diff from the snapshot
+        requested_data, relation_diffs = {}, {}
+        for update in updates:
+            update = json.loads(update)
+            for field, diff in (update.pop("relation_diffs", None) or {}).items():
+                merge_diffs(relation_diffs.setdefault(field, {}), diff)
+            requested_data.update(update)
+        if relation_diffs:
+            requested_data["relation_diffs"] = relation_diffs
+
+        issue_activity(
+            {
+                "type": "issue.activity.updated",
+                "requested_data": json.dumps(requested_data),
+                "actor_id": actor_id,
+                "issue_id": issue_id,
+                "project_id": project_id,
+                "current_instance": current_instance.decode(),
+            }
+        )
         return
     except Exception as e:
         capture_exception(e)
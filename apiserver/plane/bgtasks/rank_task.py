@@ -0,0 +1,19 @@
+# Django imports
+from django.apps import apps
+
+# Third Party imports
+from django_rq import job
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.utils.rank import rebalance_ranks
+
+
+@job("default")
+def rebalance_ranks_task(model_label, field, scope):
+    try:
+        rebalance_ranks(apps.get_model(model_label), field, scope)
+        return
+    except Exception as e:
+        capture_exception(e)
+        return
@@ -0,0 +1,61 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Third Party imports
+import django_rq
+from django_rq import job
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import User
+from plane.settings.redis import shared_redis_instance
+
+# A user's last_active is recorded at most once per interval
+LAST_ACTIVE_THROTTLE = 60
+# Seconds between two flushes of the buffered timestamps to the database
+LAST_ACTIVE_FLUSH_INTERVAL = 60
+
+LAST_ACTIVE_PENDING_KEY = "users:last_active:pending"
+LAST_ACTIVE_FLUSH_KEY = "users:last_active:flush"
+
+
+def mark_user_active(user_id):
+    ri = shared_redis_instance()
+    if not ri.set(
+        f"users:last_active:{str(user_id)}", 1, nx=True, ex=LAST_ACTIVE_THROTTLE
+    ):
+        return
+
+    ri.hset(LAST_ACTIVE_PENDING_KEY, str(user_id), timezone.now().isoformat())
+
+    # The first timestamp buffered after a flush schedules the next one
+    if ri.set(LAST_ACTIVE_FLUSH_KEY, 1, nx=True, ex=LAST_ACTIVE_FLUSH_INTERVAL):
+        django_rq.get_queue("default").enqueue_in(
+            timedelta(seconds=LAST_ACTIVE_FLUSH_INTERVAL), flush_last_active
+        )
+
+
+@job("default")
+def flush_last_active():
+    try:
+        pipe = shared_redis_instance().pipeline()
+        pipe.hgetall(LAST_ACTIVE_PENDING_KEY)
+        pipe.delete(LAST_ACTIVE_PENDING_KEY)
+        pending, _ = pipe.execute()
+
+        User.objects.bulk_update(
+            [
+                User(id=user_id.decode(), last_active=parse_datetime(value.decode()))
+                for user_id, value in pending.items()
+            ],
+            ["last_active"],
+            batch_size=500,
+        )
+        return
+    except Exception as e:
+        capture_exception(e)
+        return
@@ -0,0 +1,130 @@
+# Python imports
+import json
+import time
+import logging
+import requests
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Django imports
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Third Party imports
+import django_rq
+from django_rq import job
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import IssueActivity
+from plane.api.serializers import IssueActivitySerializer
+from plane.settings.redis import shared_redis_instance
+
+logger = logging.getLogger("plane.webhooks")
+
+WEBHOOK_QUEUE = "webhooks"
+# Parallel deliveries per job, also the size of the connection pool
+WEBHOOK_MAX_WORKERS = 8
+# (connect, read) timeout in seconds
+WEBHOOK_TIMEOUT = (3, 10)
+# Seconds to wait before each retry of the failed deliveries
+WEBHOOK_RETRY_DELAYS = [10, 60, 300]
+# Number of latency samples kept for the delivery metrics
+WEBHOOK_LATENCY_SAMPLES = 1000
+
+# One pooled session per worker process so connections are kept alive
+session = requests.Session()
+session.mount(
+    "http://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=WEBHOOK_MAX_WORKERS),
+)
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=WEBHOOK_MAX_WORKERS),
+)
+
+
+def record_delivery(latency, delivered):
+    try:
+        pipe = shared_redis_instance().pipeline()
+        pipe.incr(
+            "webhooks:issue_activity:delivered"
+            if delivered
+            else "webhooks:issue_activity:failed"
+        )
+        pipe.incrbyfloat("webhooks:issue_activity:latency_ms_total", latency)
+        pipe.lpush("webhooks:issue_activity:latency_ms", latency)
+        pipe.ltrim(
+            "webhooks:issue_activity:latency_ms", 0, WEBHOOK_LATENCY_SAMPLES - 1
+        )
+        pipe.execute()
+    except Exception as e:
+        capture_exception(e)
+
+
+def deliver(issue_activity):
+    url = f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/"
+    issue_activity_json = json.dumps(
+        IssueActivitySerializer(issue_activity).data,
+        cls=DjangoJSONEncoder,
+    )
+
+    start = time.monotonic()
+    try:
+        response = session.post(
+            url,
+            json=issue_activity_json,
+            headers={"Content-Type": "application/json"},
+            timeout=WEBHOOK_TIMEOUT,
+        )
+        delivered = response.ok
+    except requests.RequestException as e:
+        logger.warning("Issue activity %s delivery failed: %s", issue_activity.id, e)
+        delivered = False
+    latency = (time.monotonic() - start) * 1000
+
+    record_delivery(latency, delivered)
+    logger.info(
+        "Issue activity %s delivered=%s in %.1fms",
+        issue_activity.id,
+        delivered,
+        latency,
+    )
+    return delivered
+
+
+@job(WEBHOOK_QUEUE)
+def issue_activity_webhook(activity_ids, attempt=0):
+    try:
+        if not settings.PROXY_BASE_URL:
+            return
+
+        issue_activities = list(
+            IssueActivity.objects.filter(pk__in=activity_ids).select_related(
+                "actor", "workspace"
+            )
+        )
+
+        # Fan out the activities of the job over the pooled session
+        with ThreadPoolExecutor(max_workers=WEBHOOK_MAX_WORKERS) as executor:
+            results = list(executor.map(deliver, issue_activities))
+
+        failed_ids = [
+            str(issue_activity.id)
+            for issue_activity, delivered in zip(issue_activities, results)
+            if not delivered
+        ]
+
+        # Retry only the failed deliveries with backoff
+        if len(failed_ids) and attempt < len(WEBHOOK_RETRY_DELAYS):
+            django_rq.get_queue(WEBHOOK_QUEUE).enqueue_in(
+                timedelta(seconds=WEBHOOK_RETRY_DELAYS[attempt]),
+                issue_activity_webhook,
+                failed_ids,
+                attempt + 1,
+            )
+        return
+    except Exception as e:
+        capture_exception(e)
+        return
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class DbConfig(AppConfig):
     name = "plane.db"
+
+    def ready(self):
+        from plane.utils.etag import connect_collection_signals
+
+        connect_collection_signals()
@@ -0,0 +1,103 @@
+# Python imports
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Third party imports
+import requests
+
+# Module imports
+from plane.utils.importers.jira import jira_project_issue_summary
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    """Jira api answering every summary call after a fixed delay"""
+
+    protocol_version = "HTTP/1.1"
+    latency = 0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        if "/search" in self.path and "/users/" not in self.path:
+            body = {"total": 120}
+        elif "/label/" in self.path:
+            body = {"total": 12}
+        elif "/status/" in self.path:
+            body = [{"id": str(index)} for index in range(5)]
+        else:
+            body = [{"accountType": "atlassian"}, {"accountType": "app"}]
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def sequential_summary(hostname):
+    # The calls as they were made before the pooled client, one at a time
+    # on a new connection each
+    base_url = f"http://{hostname}/rest/api/3"
+    for url in [
+        f"{base_url}/search?jql=project=BENCH AND issuetype=Story",
+        f"{base_url}/search?jql=project=BENCH AND issuetype=Epic",
+        f"{base_url}/status/?jql=project=BENCH",
+        f"{base_url}/label/?jql=project=BENCH",
+        f"{base_url}/users/search?jql=project=BENCH",
+    ]:
+        requests.request("GET", url, headers={"Accept": "application/json"}).json()
+
+
+class Command(BaseCommand):
+    """Compare the Jira import summary made with sequential calls against the
+    pooled concurrent client, on a local fake Jira with a fixed latency"""
+
+    help = "Benchmark the Jira import summary against a fake server"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--latency", type=int, default=100)
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        FakeJiraHandler.latency = options["latency"] / 1000
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeJiraHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        hostname = f"127.0.0.1:{server.server_address[1]}"
+
+        try:
+            timings = {"sequential": [], "pooled": []}
+            for _ in range(options["runs"]):
+                start = time.perf_counter()
+                sequential_summary(hostname)
+                timings["sequential"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                summary = jira_project_issue_summary(
+                    "bench@plane.so", "token", "BENCH", hostname, scheme="http"
+                )
+                timings["pooled"].append(time.perf_counter() - start)
+                if "error" in summary:
+                    raise CommandError("The import summary failed")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.stdout.write(
+            f"{options['latency']} ms latency, best of {options['runs']} runs"
+        )
+        for name, timing in timings.items():
+            self.stdout.write(f"{name}: {min(timing) * 1000:.0f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Speedup: {min(timings['sequential']) / min(timings['pooled']):.1f}x"
+            )
+        )
@@ -0,0 +1,160 @@
+# Python imports
+import json
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F
+
+# Third party imports
+from rest_framework.renderers import JSONRenderer
+
+# Module imports
+from plane.api.serializers import IssueLiteSerializer
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequenceCounter,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.utils.issue_serializer import serialize_issues
+
+
+class Command(BaseCommand):
+    """Compare IssueLiteSerializer with serialize_issues on a project issue list
+
+    Missing issues are created inside a transaction that is rolled back, so
+    the project is left untouched.
+    """
+
+    help = "Benchmark the issue list serializers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=str)
+        parser.add_argument("--count", type=int, default=10000)
+        parser.add_argument("--runs", type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.get(pk=options["project_id"])
+        except Project.DoesNotExist:
+            raise CommandError("Project does not exist")
+
+        with transaction.atomic():
+            self.seed_issues(project, options["count"])
+            self.benchmark(project, options["count"], options["runs"])
+            transaction.set_rollback(True)
+
+    def seed_issues(self, project, count):
+        missing = count - Issue.objects.filter(project=project).count()
+        if missing <= 0:
+            return
+
+        state = State.objects.filter(project=project).first()
+        if state is None:
+            raise CommandError("Project has no states")
+        label_ids = list(
+            Label.objects.filter(project=project).values_list("id", flat=True)[:5]
+        )
+        member_ids = list(
+            ProjectMember.objects.filter(project=project).values_list(
+                "member_id", flat=True
+            )[:5]
+        )
+
+        self.stdout.write(f"Creating {missing} issues...")
+        sequence_id = IssueSequenceCounter.allocate(project.id, missing)
+        sort_order = IssueSequenceCounter.allocate_ranks(project.id, missing)
+        issues = Issue.objects.bulk_create(
+            [
+                Issue(
+                    project=project,
+                    workspace_id=project.workspace_id,
+                    state=state,
+                    name=f"Benchmark issue {index}",
+                    description_html="<p>Benchmark</p>",
+                    description_stripped="Benchmark",
+                    priority="medium",
+                    sequence_id=sequence_id + index,
+                    sort_order=sort_order + index,
+                )
+                for index in range(missing)
+            ],
+            batch_size=1000,
+        )
+        IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(
+                    issue=issue,
+                    label_id=label_id,
+                    project=project,
+                    workspace_id=project.workspace_id,
+                )
+                for index, issue in enumerate(issues)
+                for label_id in label_ids[: index % 3]
+            ],
+            batch_size=1000,
+        )
+        IssueAssignee.objects.bulk_create(
+            [
+                IssueAssignee(
+                    issue=issue,
+                    assignee_id=member_id,
+                    project=project,
+                    workspace_id=project.workspace_id,
+                )
+                for index, issue in enumerate(issues)
+                for member_id in member_ids[: index % 3]
+            ],
+            batch_size=1000,
+        )
+
+    def benchmark(self, project, count, runs):
+        # Same queryset as the issue list endpoint
+        queryset = (
+            Issue.objects.filter(project=project)
+            .annotate(cycle_id=F("issue_cycle__id"))
+            .annotate(module_id=F("issue_module__id"))
+            .order_by("-created_at")
+        )
+        drf_queryset = (
+            queryset.select_related("project")
+            .select_related("workspace")
+            .select_related("state")
+            .select_related("parent")
+            .prefetch_related("assignees")
+            .prefetch_related("labels")
+        )[:count]
+        fast_queryset = queryset[:count]
+
+        def render(data):
+            return json.loads(JSONRenderer().render(data))
+
+        timings = {"IssueLiteSerializer": [], "serialize_issues": []}
+        for _ in range(runs):
+            start = time.perf_counter()
+            drf_data = render(IssueLiteSerializer(drf_queryset.all(), many=True).data)
+            timings["IssueLiteSerializer"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            fast_data = render(serialize_issues(fast_queryset.all()))
+            timings["serialize_issues"].append(time.perf_counter() - start)
+
+        drf_issues = {issue["id"]: issue for issue in drf_data}
+        fast_issues = {issue["id"]: issue for issue in fast_data}
+        if drf_issues != fast_issues:
+            raise CommandError("serialize_issues output differs from the serializer")
+
+        self.stdout.write(f"{len(fast_data)} issues, best of {runs} runs")
+        for name, timing in timings.items():
+            self.stdout.write(f"{name}: {min(timing) * 1000:.0f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Speedup: {min(timings['IssueLiteSerializer']) / min(timings['serialize_issues']):.1f}x"
+            )
+        )
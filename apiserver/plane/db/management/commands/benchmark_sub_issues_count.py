@@ -0,0 +1,105 @@
+# Python imports
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+# Module imports
+from plane.db.models import Issue, IssueSequenceCounter, Project, State
+from plane.utils.issue_serializer import ISSUE_FIELDS
+from plane.utils.issue_stats import refresh_sub_issues_count, sub_issues_count_subquery
+
+
+class Command(BaseCommand):
+    """Compare the issue list query counting the sub issues of every row with
+    a correlated subquery against reading the sub_issues_count column
+
+    Missing issues are created inside a transaction that is rolled back, so
+    the project is left untouched.
+    """
+
+    help = "Benchmark the sub issue count of the issue list"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=str)
+        parser.add_argument("--count", type=int, default=10000)
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.get(pk=options["project_id"])
+        except Project.DoesNotExist:
+            raise CommandError("Project does not exist")
+
+        with transaction.atomic():
+            self.seed_issues(project, options["count"])
+            self.benchmark(project, options["count"], options["runs"])
+            transaction.set_rollback(True)
+
+    def seed_issues(self, project, count):
+        missing = count - Issue.objects.filter(project=project).count()
+        if missing > 0:
+            state = State.objects.filter(project=project).first()
+            if state is None:
+                raise CommandError("Project has no states")
+
+            self.stdout.write(f"Creating {missing} issues...")
+            sequence_id = IssueSequenceCounter.allocate(project.id, missing)
+            sort_order = IssueSequenceCounter.allocate_ranks(project.id, missing)
+            Issue.objects.bulk_create(
+                [
+                    Issue(
+                        project=project,
+                        workspace_id=project.workspace_id,
+                        state=state,
+                        name=f"Benchmark issue {index}",
+                        priority="medium",
+                        sequence_id=sequence_id + index,
+                        sort_order=sort_order + index,
+                    )
+                    for index in range(missing)
+                ],
+                batch_size=1000,
+            )
+
+        # One issue in ten is a parent of the nine after it
+        issues = list(Issue.objects.filter(project=project).order_by("created_at"))
+        for index, issue in enumerate(issues):
+            if index % 10:
+                issue.parent_id = issues[index - index % 10].id
+        Issue.objects.bulk_update(issues, ["parent"], batch_size=1000)
+        refresh_sub_issues_count(issue.id for issue in issues[::10])
+
+    def benchmark(self, project, count, runs):
+        # Same columns as the issue list endpoint reads
+        queryset = Issue.objects.filter(project=project).order_by("-created_at")
+        fields = [field for field in ISSUE_FIELDS if field != "sub_issues_count"]
+        subquery_queryset = queryset.annotate(
+            subquery_count=sub_issues_count_subquery(Issue)
+        ).values(*fields, "subquery_count")[:count]
+        column_queryset = queryset.values(*ISSUE_FIELDS)[:count]
+
+        timings = {"subquery": [], "column": []}
+        for _ in range(runs):
+            start = time.perf_counter()
+            subquery_rows = list(subquery_queryset.all())
+            timings["subquery"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            column_rows = list(column_queryset.all())
+            timings["column"].append(time.perf_counter() - start)
+
+        subquery_counts = {row["id"]: row["subquery_count"] for row in subquery_rows}
+        column_counts = {row["id"]: row["sub_issues_count"] for row in column_rows}
+        if subquery_counts != column_counts:
+            raise CommandError("sub_issues_count differs from the sub issues")
+
+        self.stdout.write(f"{len(column_rows)} issues, best of {runs} runs")
+        for name, timing in timings.items():
+            self.stdout.write(f"{name}: {min(timing) * 1000:.0f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Speedup: {min(timings['subquery']) / min(timings['column']):.1f}x"
+            )
+        )
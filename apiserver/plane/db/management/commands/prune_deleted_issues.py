@@ -0,0 +1,19 @@
+# Django imports
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import DeletedIssue
+from plane.utils.sync import SYNC_RETENTION
+
+
+class Command(BaseCommand):
+    """Drop the deleted issue log entries no sync token can reach anymore"""
+
+    help = "Prune the deleted issues older than the sync retention"
+
+    def handle(self, *args, **options):
+        deleted, _ = DeletedIssue.objects.filter(
+            created_at__lt=timezone.now() - SYNC_RETENTION
+        ).delete()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} deleted issues"))
@@ -0,0 +1,38 @@
+# Django imports
+from django.core.management import BaseCommand
+from django.db.models import F
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.issue_stats import refresh_sub_issues_count, sub_issues_count_subquery
+
+
+class Command(BaseCommand):
+    """Recount the sub_issues_count column where it drifted from the sub
+    issues, e.g. after writes that skipped the model signals"""
+
+    help = "Reconcile the sub issue counts of the issues"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", type=str, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        issues = Issue.objects.all()
+        if options["project"]:
+            issues = issues.filter(project_id=options["project"])
+
+        drifted = list(
+            issues.annotate(actual_count=sub_issues_count_subquery(Issue))
+            .exclude(sub_issues_count=F("actual_count"))
+            .values_list("id", flat=True)
+        )
+
+        if not options["dry_run"]:
+            batch_size = options["batch_size"]
+            for start in range(0, len(drifted), batch_size):
+                refresh_sub_issues_count(drifted[start : start + batch_size])
+
+        verb = "to reconcile" if options["dry_run"] else "reconciled"
+        self.stdout.write(self.style.SUCCESS(f"{len(drifted)} issues {verb}"))
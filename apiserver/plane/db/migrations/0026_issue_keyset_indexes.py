@@ -0,0 +1,21 @@
+# Generated by Django 3.2.18 on 2023-04-03 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0025_auto_20230331_0203'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'created_at', 'id'], name='issue_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['workspace', 'created_at', 'id'], name='issue_workspace_created_idx'),
+        ),
+    ]
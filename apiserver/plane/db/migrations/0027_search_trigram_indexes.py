@@ -0,0 +1,53 @@
+# Generated by Django 3.2.18 on 2023-04-04 09:41
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0026_issue_keyset_indexes'),
+    ]
+
+    # icontains compiles to UPPER(column) LIKE UPPER(%s), so the trigram
+    # indexes are built on UPPER(column) to serve the search lookups
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS workspace_name_trgm_idx ON workspaces USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS workspace_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS project_name_trgm_idx ON projects USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS project_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS issue_name_trgm_idx ON issues USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS issue_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS issue_description_trgm_idx ON issues USING gin (UPPER(description_stripped) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS issue_description_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS cycle_name_trgm_idx ON cycles USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS cycle_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS module_name_trgm_idx ON modules USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS module_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS page_name_trgm_idx ON pages USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS page_name_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS page_description_trgm_idx ON pages USING gin (UPPER(description_stripped) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS page_description_trgm_idx;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS issue_view_name_trgm_idx ON issue_views USING gin (UPPER(name) gin_trgm_ops);',
+            reverse_sql='DROP INDEX IF EXISTS issue_view_name_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 3.2.18 on 2023-04-06 09:41
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+STATE_GROUP_COUNTERS = {
+    "backlog_issues": "backlog",
+    "unstarted_issues": "unstarted",
+    "started_issues": "started",
+    "completed_issues": "completed",
+    "cancelled_issues": "cancelled",
+}
+
+
+def backfill(model, through, field):
+    annotations = {"total_issues": Count("id")}
+    for counter, group in STATE_GROUP_COUNTERS.items():
+        annotations[counter] = Count("id", filter=Q(issue__state__group=group))
+
+    for row in through.objects.order_by().values(f"{field}_id").annotate(
+        **annotations
+    ):
+        model.objects.filter(pk=row[f"{field}_id"]).update(
+            **{counter: row[counter] for counter in annotations}
+        )
+
+
+def backfill_issue_stats(apps, schema_editor):
+    backfill(apps.get_model("db", "Cycle"), apps.get_model("db", "CycleIssue"), "cycle")
+    backfill(
+        apps.get_model("db", "Module"), apps.get_model("db", "ModuleIssue"), "module"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0027_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cycle',
+            name='total_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='backlog_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='unstarted_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='started_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='completed_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='cancelled_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='total_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='backlog_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='unstarted_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='started_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='completed_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='cancelled_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_issue_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 3.2.18 on 2023-04-07 11:26
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+import django.db.models.deletion
+import uuid
+
+
+STATE_GROUP_COUNTERS = {
+    "backlog_issues": "backlog",
+    "unstarted_issues": "unstarted",
+    "started_issues": "started",
+    "completed_issues": "completed",
+    "cancelled_issues": "cancelled",
+}
+
+
+def backfill_dashboard_rollups(apps, schema_editor):
+    IssueActivity = apps.get_model("db", "IssueActivity")
+    IssueAssignee = apps.get_model("db", "IssueAssignee")
+    UserActivityRollup = apps.get_model("db", "UserActivityRollup")
+    UserIssueRollup = apps.get_model("db", "UserIssueRollup")
+
+    UserActivityRollup.objects.bulk_create(
+        [
+            UserActivityRollup(
+                workspace_id=row["workspace_id"],
+                user_id=row["actor_id"],
+                date=row["created_date"],
+                activity_count=row["activity_count"],
+            )
+            for row in IssueActivity.objects.filter(actor__isnull=False)
+            # UTC days, the same as record_user_activity
+            .annotate(created_date=TruncDate("created_at", tzinfo=timezone.utc))
+            .order_by()
+            .values("workspace_id", "actor_id", "created_date")
+            .annotate(activity_count=Count("id"))
+        ],
+        batch_size=1000,
+    )
+
+    annotations = {"total_issues": Count("id")}
+    for counter, group in STATE_GROUP_COUNTERS.items():
+        annotations[counter] = Count("id", filter=Q(issue__state__group=group))
+
+    UserIssueRollup.objects.bulk_create(
+        [
+            UserIssueRollup(
+                workspace_id=row.pop("workspace_id"),
+                user_id=row.pop("assignee_id"),
+                **row,
+            )
+            for row in IssueAssignee.objects.order_by()
+            .values("workspace_id", "assignee_id")
+            .annotate(**annotations)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('db', '0028_cycle_module_issue_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('activity_count', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='useractivityrollup_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='useractivityrollup_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to=settings.AUTH_USER_MODEL)),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'User Activity Rollup',
+                'verbose_name_plural': 'User Activity Rollups',
+                'db_table': 'user_activity_rollups',
+                'ordering': ('date',),
+                'unique_together': {('workspace', 'user', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='UserIssueRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_issues', models.PositiveIntegerField(default=0)),
+                ('backlog_issues', models.PositiveIntegerField(default=0)),
+                ('unstarted_issues', models.PositiveIntegerField(default=0)),
+                ('started_issues', models.PositiveIntegerField(default=0)),
+                ('completed_issues', models.PositiveIntegerField(default=0)),
+                ('cancelled_issues', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='userissuerollup_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='userissuerollup_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_rollups', to=settings.AUTH_USER_MODEL)),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_rollups', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'User Issue Rollup',
+                'verbose_name_plural': 'User Issue Rollups',
+                'db_table': 'user_issue_rollups',
+                'ordering': ('-created_at',),
+                'unique_together': {('workspace', 'user')},
+            },
+        ),
+        migrations.RunPython(backfill_dashboard_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.18 on 2023-04-10 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+import django.db.models.deletion
+import uuid
+
+
+def backfill_issue_sequence_counters(apps, schema_editor):
+    IssueSequence = apps.get_model("db", "IssueSequence")
+    IssueSequenceCounter = apps.get_model("db", "IssueSequenceCounter")
+
+    IssueSequenceCounter.objects.bulk_create(
+        [
+            IssueSequenceCounter(
+                project_id=row["project_id"],
+                last_sequence=row["largest"],
+            )
+            for row in IssueSequence.objects.order_by()
+            .values("project_id")
+            .annotate(largest=Max("sequence"))
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('db', '0029_user_dashboard_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueSequenceCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issuesequencecounter_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='issue_sequence_counter', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issuesequencecounter_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+            ],
+            options={
+                'verbose_name': 'Issue Sequence Counter',
+                'verbose_name_plural': 'Issue Sequence Counters',
+                'db_table': 'issue_sequence_counters',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.RunPython(backfill_issue_sequence_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.18 on 2023-04-11 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0030_issue_sequence_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importer',
+            name='issues_file',
+            field=models.FileField(blank=True, null=True, upload_to='importers/'),
+        ),
+        migrations.AddField(
+            model_name='importer',
+            name='total_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='importer',
+            name='imported_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
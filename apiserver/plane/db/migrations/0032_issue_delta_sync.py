@@ -0,0 +1,44 @@
+# Generated by Django 3.2.18 on 2023-04-12 10:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('db', '0031_importer_issue_progress'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='issue_project_updated_idx'),
+        ),
+        migrations.CreateModel(
+            name='DeletedIssue',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('issue_id', models.UUIDField()),
+                ('project_id', models.UUIDField()),
+                ('workspace_id', models.UUIDField()),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='deletedissue_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='deletedissue_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+            ],
+            options={
+                'verbose_name': 'Deleted Issue',
+                'verbose_name_plural': 'Deleted Issues',
+                'db_table': 'deleted_issues',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='deletedissue',
+            index=models.Index(fields=['project_id', 'created_at'], name='deleted_issue_project_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.18 on 2023-04-14 08:20
+
+from django.db import migrations, models
+
+
+def backfill_sub_issues_count(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {Issue._meta.db_table} AS issue
+            SET sub_issues_count = children.count
+            FROM (
+                SELECT parent_id, COUNT(*) AS count
+                FROM {Issue._meta.db_table}
+                WHERE parent_id IS NOT NULL
+                GROUP BY parent_id
+            ) AS children
+            WHERE issue.id = children.parent_id
+            """
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0032_issue_delta_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='sub_issues_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_sub_issues_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.18 on 2023-04-17 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0033_issue_sub_issues_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issuesequencecounter',
+            name='last_rank',
+            field=models.FloatField(default=0),
+        ),
+    ]
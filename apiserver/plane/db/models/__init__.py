@@ -32,6 +32,8 @@ from .issue import (
     IssueBlocker,
     IssueLink,
     IssueSequence,
+    IssueSequenceCounter,
+    DeletedIssue,
 )
 
 from .asset import FileAsset
@@ -61,4 +63,6 @@ from .integration import (
 
 from .importer import Importer
 
-from .page import Page, PageBlock, PageFavorite, PageLabel
\ No newline at end of file
+from .page import Page, PageBlock, PageFavorite, PageLabel
+
+from .dashboard import UserActivityRollup, UserIssueRollup
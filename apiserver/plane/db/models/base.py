@@ -17,12 +17,35 @@ class BaseModel(AuditModel):
         default=uuid.uuid4, unique=True, editable=False, db_index=True, primary_key=True
     )
 
+    # 由数据库重新计数维护的字段（如计数器），普通保存时不写回，
+    # 避免内存中的旧值覆盖刚刚重新计算的结果；显式传入update_fields时照常写入
+    maintained_fields = ()
+
     # Django的内部类，用于定义一些Django模型类的行为特性
     class Meta:
         abstract = True  # 声明这是一个抽象类
 
+    def exclude_maintained_fields(self, args, kwargs):
+        if (
+            not self.maintained_fields
+            or self._state.adding
+            or args
+            or kwargs.get("force_insert")
+            or kwargs.get("update_fields") is not None
+        ):
+            return
+        deferred = self.get_deferred_fields()
+        kwargs["update_fields"] = [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in self.maintained_fields
+            and field.attname not in deferred
+        ]
+
     # 重写save方法
     def save(self, *args, **kwargs):
+        self.exclude_maintained_fields(args, kwargs)
         user = get_current_user()  # 获取当前用户
 
         # 如果当前用户是匿名用户或者没有获取到用户
@@ -1,9 +1,13 @@
 # Django imports
 from django.db import models  # 导入Django的模型类
 from django.conf import settings  # 导入Django的设置模块
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import ProjectBaseModel  # 从当前目录导入ProjectBaseModel类
+from plane.utils.issue_stats import ISSUE_STAT_FIELDS, schedule_issue_stats
+from plane.utils.sync import schedule_issue_touch
 
 
 # 定义Cycle类，它继承自ProjectBaseModel
@@ -22,6 +26,15 @@ class Cycle(ProjectBaseModel):
         on_delete=models.CASCADE,
         related_name="owned_by_cycle",
     )
+    # 按状态分组维护的问题计数，由 plane.utils.issue_stats 增量刷新
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    # 计数器只由重新计数写入，普通保存不写回
+    maintained_fields = ISSUE_STAT_FIELDS
 
     # 内部Meta类用于定义模型的一些额外信息
     class Meta:
@@ -54,11 +67,32 @@ class CycleIssue(ProjectBaseModel):
         db_table = "cycle_issues"  # 数据库中的表名
         ordering = ("-created_at",)  # 默认排序字段
 
+    # 记录加载时的 cycle，保存时用于刷新原 cycle 的计数
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_cycle_id = instance.__dict__.get("cycle_id")
+        return instance
+
     # __str__方法返回对象的字符串表示
     def __str__(self):
         return f"{self.cycle}"
 
 
+@receiver(post_save, sender=CycleIssue)
+@receiver(post_delete, sender=CycleIssue)
+def refresh_cycle_issue_stats(sender, instance, **kwargs):
+    schedule_issue_stats(
+        Cycle,
+        CycleIssue,
+        "cycle",
+        [instance.cycle_id, getattr(instance, "_loaded_cycle_id", None)],
+    )
+    instance._loaded_cycle_id = instance.cycle_id
+    # The cycle of an issue is synced with the issue
+    schedule_issue_touch([instance.issue_id])
+
+
 # 定义CycleFavorite类，它继承自ProjectBaseModel
 class CycleFavorite(ProjectBaseModel):
 
@@ -0,0 +1,59 @@
+# Django imports
+from django.db import models
+from django.conf import settings
+
+# Module imports
+from . import BaseModel
+
+
+class UserActivityRollup(BaseModel):
+    workspace = models.ForeignKey(
+        "db.Workspace", on_delete=models.CASCADE, related_name="activity_rollups"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="activity_rollups",
+    )
+    date = models.DateField()
+    activity_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["workspace", "user", "date"]
+        verbose_name = "User Activity Rollup"
+        verbose_name_plural = "User Activity Rollups"
+        db_table = "user_activity_rollups"
+        ordering = ("date",)
+
+    def __str__(self):
+        """Return the user and the day of the rollup"""
+        return f"{self.user_id} <{self.date}>"
+
+
+class UserIssueRollup(BaseModel):
+    workspace = models.ForeignKey(
+        "db.Workspace", on_delete=models.CASCADE, related_name="issue_rollups"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="issue_rollups",
+    )
+    # Issues assigned to the user in the workspace by state group
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["workspace", "user"]
+        verbose_name = "User Issue Rollup"
+        verbose_name_plural = "User Issue Rollups"
+        db_table = "user_issue_rollups"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        """Return the user and the workspace of the rollup"""
+        return f"{self.user_id} <{self.workspace_id}>"
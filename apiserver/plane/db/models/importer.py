@@ -43,6 +43,10 @@ class Importer(ProjectBaseModel):
     config = models.JSONField(default=dict)
     # 定义数据字段，为JSON类型，默认值为字典
     data = models.JSONField(default=dict)
+    # 批量导入的问题文件（每行一个JSON），以及导入进度
+    issues_file = models.FileField(upload_to="importers/", null=True, blank=True)
+    total_issues = models.PositiveIntegerField(default=0)
+    imported_issues = models.PositiveIntegerField(default=0)
     # 定义令牌字段，为外键类型，关联到APIToken模型，当APIToken被删除时，这个字段也会被删除
     token = models.ForeignKey(
         "db.APIToken", on_delete=models.CASCADE, related_name="importer"
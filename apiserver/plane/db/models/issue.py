@@ -1,14 +1,16 @@
 # Django imports
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import models, connection, transaction, IntegrityError
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 
 # Module imports
-from . import ProjectBaseModel
+from . import ProjectBaseModel, BaseModel
 from plane.utils.html_processor import strip_tags
+from plane.utils.issue_stats import schedule_issue_stats, schedule_sub_issues_count
+from plane.utils.rank import append_rank
 
 
 # TODO: Handle identifiers for Bulk Inserts - nk
@@ -60,12 +62,30 @@ class Issue(ProjectBaseModel):
     )
     sort_order = models.FloatField(default=65535)
     completed_at = models.DateTimeField(null=True)
+    # Kept up to date on create, delete and parent change of the sub issues
+    sub_issues_count = models.PositiveIntegerField(default=0)
+    # Only the recount writes the count, regular saves leave it alone
+    maintained_fields = ("sub_issues_count",)
 
     class Meta:
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["project", "created_at", "id"],
+                name="issue_project_created_idx",
+            ),
+            models.Index(
+                fields=["workspace", "created_at", "id"],
+                name="issue_workspace_created_idx",
+            ),
+            models.Index(
+                fields=["project", "updated_at", "id"],
+                name="issue_project_updated_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         # This means that the model isn't saved to the database yet
@@ -108,21 +128,10 @@ class Issue(ProjectBaseModel):
             except ImportError:
                 pass
         if self._state.adding:
-            # Get the maximum display_id value from the database
-
-            last_id = IssueSequence.objects.filter(project=self.project).aggregate(
-                largest=models.Max("sequence")
-            )["largest"]
-            # aggregate can return None! Check it first.
-            # If it isn't none, just use the last ID specified (which should be the greatest) and add one to it
-            if last_id is not None:
-                self.sequence_id = last_id + 1
-
-            largest_sort_order = Issue.objects.filter(
-                project=self.project, state=self.state
-            ).aggregate(largest=models.Max("sort_order"))["largest"]
-            if largest_sort_order is not None:
-                self.sort_order = largest_sort_order + 10000
+            # Take the next sequence id from the project counter
+            self.sequence_id = IssueSequenceCounter.allocate(self.project_id)
+            # Append after every issue of the project without scanning them
+            self.sort_order = IssueSequenceCounter.allocate_ranks(self.project_id)
 
         # Strip the html tags using html parser
         self.description_stripped = (
@@ -132,6 +141,14 @@ class Issue(ProjectBaseModel):
         )
         super(Issue, self).save(*args, **kwargs)
 
+    # Keep the loaded state to recount cycle and module stats on state changes
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_state_id = instance.__dict__.get("state_id")
+        instance._loaded_parent_id = instance.__dict__.get("parent_id")
+        return instance
+
     def __str__(self):
         """Return name of the issue"""
         return f"{self.name} <{self.project.name}>"
@@ -357,6 +374,113 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(BaseModel):
+    project = models.OneToOneField(
+        "db.Project", on_delete=models.CASCADE, related_name="issue_sequence_counter"
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+    # Largest sort_order handed out to a new issue of the project
+    last_rank = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+        ordering = ("-created_at",)
+
+    @classmethod
+    def allocate(cls, project_id, count=1):
+        """reserve a contiguous block of sequence ids for the project
+
+        Args:
+            project_id (uuid): project to allocate the sequence ids in
+            count (int): number of sequence ids to reserve
+
+        Returns:
+            int: the first sequence id of the block
+        """
+        # The row lock of the update serializes concurrent allocations in
+        # a project until the surrounding transaction ends
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} SET last_sequence = last_sequence + %s "
+                "WHERE project_id = %s RETURNING last_sequence",
+                [count, project_id],
+            )
+            row = cursor.fetchone()
+        if row is not None:
+            return row[0] - count + 1
+
+        # First allocation in the project, continue from the sequences in use
+        last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
+            largest=models.Max("sequence")
+        )["largest"]
+        last_id = 0 if last_id is None else last_id
+        try:
+            with transaction.atomic():
+                cls.objects.create(project_id=project_id, last_sequence=last_id + count)
+            return last_id + 1
+        except IntegrityError:
+            # Created by a concurrent allocation in the meantime
+            return cls.allocate(project_id, count)
+
+    @classmethod
+    def allocate_ranks(cls, project_id, count=1):
+        """reserve a block of sort orders after every issue created in the
+        project, one apart
+
+        Args:
+            project_id (uuid): project to allocate the sort orders in
+            count (int): number of sort orders to reserve
+
+        Returns:
+            float: the first sort order of the block
+        """
+        # Same row lock as the sequence ids, concurrent blocks never overlap
+        # and the clock keeps them above the legacy and rebalanced ranks
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} "
+                "SET last_rank = GREATEST(last_rank, %s) + %s "
+                "WHERE project_id = %s RETURNING last_rank",
+                [append_rank(), count, project_id],
+            )
+            row = cursor.fetchone()
+        if row is not None:
+            return row[0] - count + 1
+
+        # Create the counter row of the project first
+        cls.allocate(project_id, 0)
+        return cls.allocate_ranks(project_id, count)
+
+    def __str__(self):
+        """Return the project and the last allocated sequence id"""
+        return f"{self.project_id} <{self.last_sequence}>"
+
+
+class DeletedIssue(BaseModel):
+    # Plain ids, the log outlives the issue and may outlive its project
+    issue_id = models.UUIDField()
+    project_id = models.UUIDField()
+    workspace_id = models.UUIDField()
+
+    class Meta:
+        verbose_name = "Deleted Issue"
+        verbose_name_plural = "Deleted Issues"
+        db_table = "deleted_issues"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["project_id", "created_at"],
+                name="deleted_issue_project_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """Return the deleted issue and its project"""
+        return f"{self.issue_id} <{self.project_id}>"
+
+
 # TODO: Find a better method to save the model
 @receiver(post_save, sender=Issue)
 def create_issue_sequence(sender, instance, created, **kwargs):
@@ -364,3 +488,53 @@ def create_issue_sequence(sender, instance, created, **kwargs):
         IssueSequence.objects.create(
             issue=instance, sequence=instance.sequence_id, project=instance.project
         )
+
+
+@receiver(post_save, sender=Issue)
+def refresh_issue_state_stats(sender, instance, created, **kwargs):
+    if created or getattr(instance, "_loaded_state_id", None) == instance.state_id:
+        return
+    instance._loaded_state_id = instance.state_id
+
+    from plane.db.models import Cycle, CycleIssue, Module, ModuleIssue
+
+    schedule_issue_stats(
+        Cycle,
+        CycleIssue,
+        "cycle",
+        CycleIssue.objects.filter(issue_id=instance.id).values_list(
+            "cycle_id", flat=True
+        ),
+    )
+    schedule_issue_stats(
+        Module,
+        ModuleIssue,
+        "module",
+        ModuleIssue.objects.filter(issue_id=instance.id).values_list(
+            "module_id", flat=True
+        ),
+    )
+
+
+@receiver(post_save, sender=Issue)
+def refresh_parent_sub_issues_count(sender, instance, created, **kwargs):
+    loaded_parent_id = None if created else getattr(instance, "_loaded_parent_id", None)
+    if loaded_parent_id == instance.parent_id:
+        return
+    instance._loaded_parent_id = instance.parent_id
+    schedule_sub_issues_count([loaded_parent_id, instance.parent_id])
+
+
+@receiver(post_delete, sender=Issue)
+def refresh_deleted_parent_sub_issues_count(sender, instance, **kwargs):
+    schedule_sub_issues_count([instance.parent_id])
+
+
+# Tombstones for the delta sync of the issue lists
+@receiver(post_delete, sender=Issue)
+def log_deleted_issue(sender, instance, **kwargs):
+    DeletedIssue.objects.create(
+        issue_id=instance.id,
+        project_id=instance.project_id,
+        workspace_id=instance.workspace_id,
+    )
@@ -1,9 +1,13 @@
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import ProjectBaseModel
+from plane.utils.issue_stats import ISSUE_STAT_FIELDS, schedule_issue_stats
+from plane.utils.sync import schedule_issue_touch
 
 
 class Module(ProjectBaseModel):
@@ -39,6 +43,15 @@ class Module(ProjectBaseModel):
         through="ModuleMember",
         through_fields=("module", "member"),
     )
+    # Per state group issue counters kept up to date by plane.utils.issue_stats
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    # Only the recount writes the counters, regular saves leave them alone
+    maintained_fields = ISSUE_STAT_FIELDS
 
     class Meta:
         unique_together = ["name", "project"]
@@ -80,10 +93,31 @@ class ModuleIssue(ProjectBaseModel):
         db_table = "module_issues"
         ordering = ("-created_at",)
 
+    # Keep the loaded module to recount it when the issue moves
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_module_id = instance.__dict__.get("module_id")
+        return instance
+
     def __str__(self):
         return f"{self.module.name} {self.issue.name}"
 
 
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_delete, sender=ModuleIssue)
+def refresh_module_issue_stats(sender, instance, **kwargs):
+    schedule_issue_stats(
+        Module,
+        ModuleIssue,
+        "module",
+        [instance.module_id, getattr(instance, "_loaded_module_id", None)],
+    )
+    instance._loaded_module_id = instance.module_id
+    # The module of an issue is synced with the issue
+    schedule_issue_touch([instance.issue_id])
+
+
 class ModuleLink(ProjectBaseModel):
     title = models.CharField(max_length=255, null=True)
     url = models.URLField()
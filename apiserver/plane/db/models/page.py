@@ -5,6 +5,7 @@ from django.conf import settings
 # Module imports
 from . import ProjectBaseModel
 from plane.utils.html_processor import strip_tags
+from plane.utils.rank import append_rank
 
 
 class Page(ProjectBaseModel):
@@ -49,11 +50,7 @@ class PageBlock(ProjectBaseModel):
 
     def save(self, *args, **kwargs):
         if self._state.adding:
-            largest_sort_order = PageBlock.objects.filter(
-                project=self.project, page=self.page
-            ).aggregate(largest=models.Max("sort_order"))["largest"]
-            if largest_sort_order is not None:
-                self.sort_order = largest_sort_order + 10000
+            self.sort_order = append_rank()
 
         # Strip the html tags using html parser
         self.description_stripped = (
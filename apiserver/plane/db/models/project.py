@@ -2,11 +2,12 @@
 from django.db import models
 from django.conf import settings
 from django.template.defaultfilters import slugify
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 # Modeule imports
 from plane.db.mixins import AuditModel
+from plane.utils.membership import invalidate_memberships
 
 # Module imports
 from . import BaseModel
@@ -145,6 +146,12 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_memberships(sender, instance, **kwargs):
+    invalidate_memberships(instance.member_id)
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey(
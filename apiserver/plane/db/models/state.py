@@ -1,9 +1,13 @@
 # Django imports
 from django.db import models
 from django.template.defaultfilters import slugify
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from . import ProjectBaseModel
+from plane.utils.issue_stats import schedule_issue_stats
+from plane.utils.rank import append_rank
 
 
 class State(ProjectBaseModel):
@@ -25,6 +29,13 @@ class State(ProjectBaseModel):
     )
     default = models.BooleanField(default=False)
 
+    # Keep the loaded group to recount stats when the state changes group
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_group = instance.__dict__.get("group")
+        return instance
+
     def __str__(self):
         """Return name of the state"""
         return f"{self.name} <{self.project.name}>"
@@ -39,12 +50,42 @@ class State(ProjectBaseModel):
     def save(self, *args, **kwargs):
         self.slug = slugify(self.name)
         if self._state.adding:
-            # Get the maximum sequence value from the database
-            last_id = State.objects.filter(project=self.project).aggregate(
-                largest=models.Max("sequence")
-            )["largest"]
-            # if last_id is not None
-            if last_id is not None:
-                self.sequence = last_id + 15000
+            # Append to the end of the project states without scanning them
+            self.sequence = append_rank()
 
         return super().save(*args, **kwargs)
+
+
+# A state moved to another group changes the counters of every cycle and
+# module holding one of its issues, and of every user assigned to one
+@receiver(post_save, sender=State)
+def refresh_state_group_stats(sender, instance, created, **kwargs):
+    if created or getattr(instance, "_loaded_group", None) == instance.group:
+        return
+    instance._loaded_group = instance.group
+
+    from plane.db.models import Cycle, CycleIssue, IssueAssignee, Module, ModuleIssue
+    from plane.utils.dashboard import schedule_user_issue_rollups
+
+    schedule_issue_stats(
+        Cycle,
+        CycleIssue,
+        "cycle",
+        CycleIssue.objects.filter(issue__state=instance)
+        .values_list("cycle_id", flat=True)
+        .distinct(),
+    )
+    schedule_issue_stats(
+        Module,
+        ModuleIssue,
+        "module",
+        ModuleIssue.objects.filter(issue__state=instance)
+        .values_list("module_id", flat=True)
+        .distinct(),
+    )
+    schedule_user_issue_rollups(
+        instance.workspace,
+        IssueAssignee.objects.filter(issue__state=instance)
+        .values_list("assignee_id", flat=True)
+        .distinct(),
+    )
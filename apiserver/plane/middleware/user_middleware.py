@@ -1,8 +1,6 @@
-import jwt
-import pytz
-from django.conf import settings
 from django.utils import timezone
-from plane.db.models import User
+from sentry_sdk import capture_exception
+from plane.bgtasks.user_activity_task import mark_user_active
 
 
 class UserMiddleware(object):
@@ -12,22 +10,17 @@ class UserMiddleware(object):
 
     def __call__(self, request):
 
+        response = self.get_response(request)
+
+        # DRF has authenticated the request by now, reuse its user and only
+        # buffer the timestamp, it is written to the database in bulk
         try:
-            if request.headers.get("Authorization"):
-                authorization_header = request.headers.get("Authorization")
-                access_token = authorization_header.split(" ")[1]
-                decoded = jwt.decode(
-                    access_token, settings.SECRET_KEY, algorithms=["HS256"]
-                )
-                id = decoded['user_id']
-                user = User.objects.get(id=id)
-                user.last_active = timezone.now()
-                user.token_updated_at = None
-                user.save()
-                timezone.activate(pytz.timezone(user.user_timezone))
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                mark_user_active(user.id)
         except Exception as e:
-            print(e)
-        
-        response = self.get_response(request)
+            capture_exception(e)
+
+        timezone.deactivate()
 
         return response
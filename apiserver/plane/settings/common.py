@@ -52,6 +52,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # 获取当前请求用户信息的中间件
     "crum.CurrentRequestUserMiddleware",
+    # 记录用户最后活跃时间（缓冲后批量写入）
+    "plane.middleware.user_middleware.UserMiddleware",
     # Gzip压缩中间件
     "django.middleware.gzip.GZipMiddleware",
 ]
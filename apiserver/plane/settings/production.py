@@ -219,7 +219,10 @@ else:
 RQ_QUEUES = {
     "default": {
         "USE_REDIS_CACHE": "default",
-    }
+    },
+    "webhooks": {
+        "USE_REDIS_CACHE": "default",
+    },
 }
 
 
@@ -1,4 +1,5 @@
 import redis
+from functools import lru_cache
 from django.conf import settings
 from urllib.parse import urlparse
 
@@ -20,4 +21,11 @@ def redis_instance():
                 ssl_cert_reqs=None,
             )
     
-    return ri
\ No newline at end of file
+    return ri
+
+
+# One client per process for the calls made on every request or job, its
+# connection pool is reused instead of connecting each time
+@lru_cache(maxsize=None)
+def shared_redis_instance():
+    return redis_instance()
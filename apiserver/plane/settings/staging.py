@@ -180,7 +180,10 @@ CACHES = {
 RQ_QUEUES = {
     "default": {
         "USE_REDIS_CACHE": "default",
-    }
+    },
+    "webhooks": {
+        "USE_REDIS_CACHE": "default",
+    },
 }
 
 
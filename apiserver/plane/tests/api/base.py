@@ -2,7 +2,15 @@
 from rest_framework.test import APITestCase, APIClient
 
 # Module imports
-from plane.db.models import User
+from plane.db.models import (
+    Issue,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
 from plane.api.views.authentication import get_tokens_for_user
 
 
@@ -32,3 +40,39 @@ class AuthenticatedAPITest(BaseAPITest):
 
         # Set Up Authentication Token
         self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access_token)
+
+
+class ProjectAPITest(AuthenticatedAPITest):
+    """Authenticated user administering a workspace and a project with a
+    default state"""
+
+    def setUp(self):
+        super().setUp()
+
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.user, role=20
+        )
+        self.state = State.objects.create(
+            name="Todo",
+            color="#000000",
+            group="unstarted",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+    def create_issue(self, **kwargs):
+        kwargs.setdefault("name", "Issue")
+        kwargs.setdefault("state", self.state)
+        return Issue.objects.create(
+            project=self.project, workspace=self.workspace, **kwargs
+        )
@@ -0,0 +1,53 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.bgtasks.issue_activites_task import bulk_issue_activity
+from plane.db.models import Cycle, CycleIssue, IssueActivity
+
+
+class BulkUpdateCycleTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            workspace=self.workspace,
+            owned_by=self.user,
+        )
+        self.issue = self.create_issue()
+        CycleIssue.objects.create(
+            issue=self.issue,
+            cycle=self.cycle,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.url = reverse(
+            "project-issues-bulk-update",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+    @mock.patch("plane.api.views.issue.bulk_issue_activity.delay")
+    def test_removing_the_cycle_is_tracked(self, delay):
+        response = self.client.patch(
+            self.url, {"issue_ids": [str(self.issue.id)], "cycle": None}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["issues"], [{"id": str(self.issue.id), "cycle_id": None}]
+        )
+        self.assertFalse(CycleIssue.objects.filter(issue=self.issue).exists())
+
+        bulk_issue_activity(delay.call_args.args[0])
+
+        activity = IssueActivity.objects.get(issue=self.issue, field="cycles")
+        self.assertEqual(activity.old_value, self.cycle.name)
+        self.assertEqual(activity.new_value, "")
+        self.assertEqual(activity.old_identifier, self.cycle.id)
@@ -0,0 +1,50 @@
+# Django imports
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import IssueAssignee, UserIssueRollup
+from plane.utils.dashboard import refresh_user_issue_rollups
+
+
+class UserIssueRollupTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.issues = [self.create_issue(name=f"Issue {index}") for index in range(3)]
+        for issue in self.issues:
+            IssueAssignee.objects.create(
+                issue=issue,
+                assignee=self.user,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        refresh_user_issue_rollups(self.workspace, [self.user.id])
+
+    def rollup(self):
+        return UserIssueRollup.objects.get(workspace=self.workspace, user=self.user)
+
+    def test_bulk_delete_recounts_the_assignees(self):
+        url = reverse(
+            "project-issues-bulk",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                url, {"issue_ids": [str(self.issues[0].id)]}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.rollup().total_issues, 2)
+        self.assertEqual(self.rollup().unstarted_issues, 2)
+
+    def test_state_group_change_recounts_the_assignees(self):
+        self.state.group = "completed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.state.save()
+
+        self.assertEqual(self.rollup().unstarted_issues, 0)
+        self.assertEqual(self.rollup().completed_issues, 3)
@@ -0,0 +1,74 @@
+# Django imports
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Issue, State
+from plane.utils.etag import bump_project_collections
+
+
+class CollectionETagTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse(
+            "project-states",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+    def test_unchanged_collection_is_not_modified(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        # gzip_page weakens the ETags the clients got
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_write_changes_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            State.objects.create(
+                name="Done",
+                color="#000000",
+                group="completed",
+                project=self.project,
+                workspace=self.workspace,
+            )
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_bump_waits_for_the_commit(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            bump_project_collections(State, self.project.id)
+        # Not dropped before the transaction commits
+        self.assertEqual(self.client.get(self.url)["ETag"], etag)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
+
+    def test_etag_depends_on_the_query_string(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, {"expand": "project"})
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_other_collections_are_left_alone(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_project_collections(Issue, self.project.id)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
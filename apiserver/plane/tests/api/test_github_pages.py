@@ -0,0 +1,49 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.integrations import github
+from plane.utils.integrations.github import (
+    GITHUB_RATE_LIMIT_RESERVE,
+    github_pages,
+    read_pages,
+)
+
+URL = "https://api.github.com/repos/plane/plane/collaborators"
+
+
+def page_response(page, remaining, next_page=True):
+    response = mock.Mock()
+    response.json.return_value = [{"login": f"user-{page}"}]
+    response.headers = {"X-RateLimit-Remaining": str(remaining)}
+    response.links = {"next": {"url": f"{URL}?page={page + 1}"}} if next_page else {}
+    return response
+
+
+class GithubPagesTests(SimpleTestCase):
+    def test_every_page(self):
+        responses = [page_response(1, 5000), page_response(2, 5000, next_page=False)]
+        with mock.patch.object(github, "request", side_effect=responses):
+            items, partial = read_pages(github_pages(URL, {}))
+
+        self.assertEqual(items, [{"login": "user-1"}, {"login": "user-2"}])
+        self.assertFalse(partial)
+
+    def test_rate_limit_marks_partial(self):
+        responses = [page_response(1, GITHUB_RATE_LIMIT_RESERVE)]
+        with mock.patch.object(github, "request", side_effect=responses):
+            items, partial = read_pages(github_pages(URL, {}))
+
+        self.assertEqual(items, [{"login": "user-1"}])
+        self.assertTrue(partial)
+
+    def test_items_are_streamed(self):
+        responses = [page_response(1, 5000), page_response(2, 5000, next_page=False)]
+        with mock.patch.object(github, "request", side_effect=responses) as request:
+            pages = github_pages(URL, {})
+            self.assertEqual(next(pages), {"login": "user-1"})
+            # The second page is only requested once the first is consumed
+            self.assertEqual(request.call_count, 1)
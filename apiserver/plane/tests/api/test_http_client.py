@@ -0,0 +1,40 @@
+# Python imports
+import time
+import urllib.request
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Third party imports
+from requests.cookies import create_cookie
+
+# Module imports
+from plane.utils.http_client import gather, session
+
+
+class GatherTests(SimpleTestCase):
+    def test_results_keep_call_order(self):
+        def delayed(value, delay):
+            time.sleep(delay)
+            return value
+
+        results = gather(
+            lambda: delayed(1, 0.05), lambda: delayed(2, 0), lambda: delayed(3, 0.02)
+        )
+        self.assertEqual(results, [1, 2, 3])
+
+    def test_exception_is_raised_again(self):
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            gather(lambda: 1, fail)
+
+
+class SharedSessionTests(SimpleTestCase):
+    def test_cookies_are_neither_stored_nor_sent(self):
+        cookie = create_cookie("session", "secret", domain="jira.example.com")
+        request = urllib.request.Request("https://jira.example.com/rest/api/3")
+        policy = session.cookies.get_policy()
+        self.assertFalse(policy.set_ok(cookie, request))
+        self.assertFalse(policy.return_ok(cookie, request))
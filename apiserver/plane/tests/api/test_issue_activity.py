@@ -0,0 +1,59 @@
+# Python imports
+from unittest import mock
+
+# Module imports
+from .base import ProjectAPITest
+from plane.bgtasks.issue_activites_task import (
+    coalesce_issue_activity,
+    flush_issue_activity,
+)
+from plane.db.models import IssueActivity
+from plane.settings.redis import shared_redis_instance
+
+
+class CoalesceIssueActivityTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.issue = self.create_issue(priority="low")
+        self.keys = [
+            f"issue_activity:{self.issue.id}:{self.user.id}:snapshot",
+            f"issue_activity:{self.issue.id}:{self.user.id}:updates",
+        ]
+        shared_redis_instance().delete(*self.keys)
+        self.addCleanup(shared_redis_instance().delete, *self.keys)
+
+    @mock.patch("plane.bgtasks.issue_activites_task.django_rq.get_queue")
+    def test_updates_of_one_window_are_merged(self, get_queue):
+        for priority in ["medium", "high"]:
+            coalesce_issue_activity(
+                self.issue.id, self.project.id, self.user.id, {"priority": priority}
+            )
+
+        # Only the update opening the window schedules a flush
+        self.assertEqual(get_queue.return_value.enqueue_in.call_count, 1)
+        self.assertEqual(shared_redis_instance().llen(self.keys[1]), 2)
+
+        flush_issue_activity(
+            str(self.issue.id), str(self.project.id), str(self.user.id)
+        )
+
+        activity = IssueActivity.objects.get(issue=self.issue, field="priority")
+        self.assertEqual(activity.old_value, "low")
+        self.assertEqual(activity.new_value, "high")
+        self.assertFalse(shared_redis_instance().exists(*self.keys))
+
+    @mock.patch("plane.bgtasks.issue_activites_task.django_rq.get_queue")
+    def test_update_after_a_flush_opens_a_new_window(self, get_queue):
+        coalesce_issue_activity(
+            self.issue.id, self.project.id, self.user.id, {"priority": "medium"}
+        )
+        flush_issue_activity(
+            str(self.issue.id), str(self.project.id), str(self.user.id)
+        )
+        coalesce_issue_activity(
+            self.issue.id, self.project.id, self.user.id, {"priority": "high"}
+        )
+
+        self.assertEqual(get_queue.return_value.enqueue_in.call_count, 2)
+        self.assertTrue(shared_redis_instance().exists(self.keys[0]))
+        self.assertEqual(shared_redis_instance().llen(self.keys[1]), 1)
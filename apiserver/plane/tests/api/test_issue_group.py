@@ -0,0 +1,67 @@
+# Django imports
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+
+
+class GroupedIssueListTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        for index in range(3):
+            self.create_issue(name=f"Issue {index}", priority="high")
+        self.create_issue(name="Urgent", priority="urgent")
+        self.url = reverse(
+            "project-issue",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+
+    def test_pages_through_one_group(self):
+        response = self.client.get(
+            self.url, {"group_by": "priority", "per_page": 2}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["high"]["count"], 3)
+        self.assertEqual(len(response.data["high"]["results"]), 2)
+        self.assertTrue(response.data["high"]["next_page_results"])
+
+        response = self.client.get(
+            self.url,
+            {
+                "group_by": "priority",
+                "per_page": 2,
+                "group": "high",
+                "cursor": response.data["high"]["next_cursor"],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), ["high"])
+        self.assertEqual(len(response.data["high"]["results"]), 1)
+
+    def test_cursor_without_group(self):
+        response = self.client.get(
+            self.url, {"group_by": "priority", "per_page": 2}, format="json"
+        )
+
+        response = self.client.get(
+            self.url,
+            {
+                "group_by": "priority",
+                "per_page": 2,
+                "cursor": response.data["high"]["next_cursor"],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            self.url,
+            {"group_by": "priority", "group": "high", "cursor": "not-a-cursor"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
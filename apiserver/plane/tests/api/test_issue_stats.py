@@ -0,0 +1,67 @@
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Cycle, CycleIssue, State
+
+
+class CycleIssueStatsTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            workspace=self.workspace,
+            owned_by=self.user,
+        )
+
+    def add_to_cycle(self, issue):
+        with self.captureOnCommitCallbacks(execute=True):
+            CycleIssue.objects.create(
+                issue=issue,
+                cycle=self.cycle,
+                project=self.project,
+                workspace=self.workspace,
+            )
+
+    def test_counters_follow_cycle_issues(self):
+        self.add_to_cycle(self.create_issue())
+        self.add_to_cycle(self.create_issue())
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_issues, 2)
+        self.assertEqual(self.cycle.unstarted_issues, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CycleIssue.objects.filter(cycle=self.cycle).first().delete()
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_issues, 1)
+
+    def test_counters_follow_state_changes(self):
+        issue = self.create_issue()
+        self.add_to_cycle(issue)
+        done = State.objects.create(
+            name="Done",
+            color="#000000",
+            group="completed",
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            issue.state = done
+            issue.save()
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.unstarted_issues, 0)
+        self.assertEqual(self.cycle.completed_issues, 1)
+
+    def test_saving_a_stale_cycle_keeps_the_counters(self):
+        stale = Cycle.objects.get(pk=self.cycle.pk)
+        self.add_to_cycle(self.create_issue())
+
+        stale.name = "Renamed"
+        stale.save()
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.name, "Renamed")
+        self.assertEqual(self.cycle.total_issues, 1)
@@ -0,0 +1,81 @@
+# Django imports
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Issue, Project, State
+
+
+class SubIssueTreeTests(ProjectAPITest):
+    def tree_url(self, issue):
+        return reverse(
+            "sub-issue-tree",
+            kwargs={
+                "slug": self.workspace.slug,
+                "project_id": self.project.id,
+                "issue_id": issue.id,
+            },
+        )
+
+    def test_tree_with_rollups(self):
+        root = self.create_issue(name="Root")
+        child = self.create_issue(name="Child", parent=root)
+        self.create_issue(name="Grandchild", parent=child)
+
+        response = self.client.get(self.tree_url(root))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        issues = {issue["name"]: issue for issue in response.data["issues"]}
+        self.assertEqual(issues["Root"]["depth"], 0)
+        self.assertEqual(issues["Root"]["descendants_count"], 2)
+        self.assertEqual(issues["Root"]["state_groups"], {"unstarted": 2})
+        self.assertEqual(issues["Grandchild"]["depth"], 2)
+
+    def test_tree_stays_in_the_project(self):
+        # A project the user is not a member of
+        other_project = Project.objects.create(
+            name="Other", identifier="OTH", workspace=self.workspace
+        )
+        other_state = State.objects.create(
+            name="Todo",
+            color="#000000",
+            group="unstarted",
+            project=other_project,
+            workspace=self.workspace,
+        )
+        root = self.create_issue(name="Root")
+        foreign = Issue.objects.create(
+            name="Foreign",
+            parent=root,
+            state=other_state,
+            project=other_project,
+            workspace=self.workspace,
+        )
+        Issue.objects.create(
+            name="Foreign child",
+            parent=foreign,
+            state=other_state,
+            project=other_project,
+            workspace=self.workspace,
+        )
+
+        response = self.client.get(self.tree_url(root))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([issue["name"] for issue in response.data["issues"]], ["Root"])
+        self.assertEqual(response.data["issues"][0]["descendants_count"], 0)
+
+    def test_missing_root(self):
+        other_project = Project.objects.create(
+            name="Other", identifier="OTH", workspace=self.workspace
+        )
+        issue = Issue.objects.create(
+            name="Foreign", project=other_project, workspace=self.workspace
+        )
+
+        response = self.client.get(self.tree_url(issue))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,79 @@
+# Python imports
+from datetime import date
+
+# Django imports
+from django.utils import timezone
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Issue
+from plane.utils.paginator import KeysetCursor, KeysetPaginator
+
+
+class KeysetPaginatorTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.issues = [self.create_issue(name=f"Issue {index}") for index in range(7)]
+        self.queryset = Issue.objects.filter(project=self.project)
+
+    def walk(self, paginator, limit):
+        """ids of every page following the next cursors, through their
+        string form as the clients send them"""
+        pages, cursor = [], None
+        while True:
+            result = paginator.get_result(limit=limit, cursor=cursor)
+            pages.append([issue.id for issue in result.results])
+            if not result.next.has_results:
+                return pages
+            cursor = KeysetCursor.from_string(str(result.next))
+
+    def test_pages_cover_every_row_once(self):
+        pages = self.walk(KeysetPaginator(self.queryset), limit=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        expected = self.queryset.order_by("-created_at", "-pk").values_list(
+            "id", flat=True
+        )
+        self.assertEqual(sum(pages, []), list(expected))
+
+    def test_ties_on_the_ordering_field(self):
+        # Rows sharing the ordering value are told apart by their id
+        self.queryset.update(created_at=timezone.now())
+        pages = self.walk(KeysetPaginator(self.queryset), limit=2)
+
+        ids = sum(pages, [])
+        self.assertEqual(len(ids), len(self.issues))
+        self.assertEqual(set(ids), {issue.id for issue in self.issues})
+
+    def test_null_values(self):
+        self.queryset.filter(pk__in=[issue.id for issue in self.issues[:4]]).update(
+            target_date=date(2023, 1, 1)
+        )
+
+        for order_by in ["target_date", "-target_date"]:
+            pages = self.walk(KeysetPaginator(self.queryset, order_by=order_by), 2)
+            ids = sum(pages, [])
+            self.assertEqual(len(ids), len(self.issues))
+            self.assertEqual(set(ids), {issue.id for issue in self.issues})
+
+    def test_prev_cursor_returns_the_previous_page(self):
+        paginator = KeysetPaginator(self.queryset)
+        first = paginator.get_result(limit=3)
+        second = paginator.get_result(
+            limit=3, cursor=KeysetCursor.from_string(str(first.next))
+        )
+        self.assertTrue(second.prev.has_results)
+
+        previous = paginator.get_result(
+            limit=3, cursor=KeysetCursor.from_string(str(second.prev))
+        )
+        self.assertEqual(
+            [issue.id for issue in previous.results],
+            [issue.id for issue in first.results],
+        )
+        self.assertFalse(previous.prev.has_results)
+
+    def test_invalid_cursor_string(self):
+        for value in ["not-a-cursor", "WzEsIDJd"]:
+            with self.assertRaises(ValueError):
+                KeysetCursor.from_string(value)
@@ -0,0 +1,143 @@
+# Django imports
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Issue, IssueSequenceCounter, Project, State
+from plane.utils.rank import (
+    RANK_STEP,
+    append_rank,
+    move_rank,
+    rank_between,
+    rebalance_ranks,
+)
+
+
+class RankBetweenTests(SimpleTestCase):
+    def test_between_neighbours(self):
+        self.assertEqual(rank_between(10, 20), 15)
+
+    def test_top_and_bottom(self):
+        self.assertEqual(rank_between(None, 20), 20 - RANK_STEP)
+        self.assertGreater(rank_between(10, None), 10)
+
+    def test_gap_used_up(self):
+        self.assertIsNone(rank_between(1.0, 1.0))
+
+    def test_append_rank_always_grows(self):
+        ranks = [append_rank() for _ in range(100)]
+        self.assertEqual(ranks, sorted(set(ranks)))
+
+
+class IssueRankTests(ProjectAPITest):
+    def test_new_issues_are_appended(self):
+        first = self.create_issue(name="First")
+        second = self.create_issue(name="Second")
+        self.assertGreater(second.sort_order, first.sort_order)
+
+    def test_allocated_blocks_never_overlap(self):
+        issue = self.create_issue()
+        first = IssueSequenceCounter.allocate_ranks(self.project.id, 50)
+        second = IssueSequenceCounter.allocate_ranks(self.project.id, 50)
+        self.assertGreater(first, issue.sort_order)
+        self.assertGreaterEqual(second, first + 50)
+
+    def test_move_between_neighbours(self):
+        first, second, third = [
+            self.create_issue(name=f"Issue {index}") for index in range(3)
+        ]
+        scope = {"project_id": self.project.id, "state_id": self.state.id}
+
+        rank = move_rank(
+            Issue, "sort_order", scope, third.id, before_id=first.id, after_id=second.id
+        )
+
+        self.assertGreater(rank, first.sort_order)
+        self.assertLess(rank, second.sort_order)
+
+    def test_rebalance_scope_without_state(self):
+        issues = [self.create_issue(name=f"Issue {index}") for index in range(3)]
+        Issue.objects.filter(pk__in=[issue.pk for issue in issues]).update(state=None)
+
+        rebalance_ranks(
+            Issue, "sort_order", {"project_id": self.project.id, "state_id": None}
+        )
+
+        ranks = list(
+            Issue.objects.filter(project=self.project)
+            .order_by("sort_order")
+            .values_list("id", "sort_order")
+        )
+        self.assertEqual([pk for pk, _ in ranks], [issue.id for issue in issues])
+        self.assertEqual(
+            [rank for _, rank in ranks], [RANK_STEP, 2 * RANK_STEP, 3 * RANK_STEP]
+        )
+
+    def test_move_rejects_state_of_another_project(self):
+        issue = self.create_issue()
+        other_project = Project.objects.create(
+            name="Other", identifier="OTH", workspace=self.workspace
+        )
+        other_state = State.objects.create(
+            name="Done",
+            color="#000000",
+            group="completed",
+            project=other_project,
+            workspace=self.workspace,
+        )
+
+        response = self.client.post(
+            reverse(
+                "issue-move",
+                kwargs={
+                    "slug": self.workspace.slug,
+                    "project_id": self.project.id,
+                    "issue_id": issue.id,
+                },
+            ),
+            {"state": str(other_state.id)},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        issue.refresh_from_db()
+        self.assertEqual(issue.state_id, self.state.id)
+
+    def test_move_rejects_neighbour_outside_the_scope(self):
+        issue, neighbour = self.create_issue(), self.create_issue()
+        other_state = State.objects.create(
+            name="Doing",
+            color="#000000",
+            group="started",
+            project=self.project,
+            workspace=self.workspace,
+        )
+        Issue.objects.filter(pk=neighbour.pk).update(state=other_state)
+        url = reverse(
+            "issue-move",
+            kwargs={
+                "slug": self.workspace.slug,
+                "project_id": self.project.id,
+                "issue_id": issue.id,
+            },
+        )
+
+        for before in [str(neighbour.id), "3fa85f64-5717-4562-b3fc-2c963f66afa6"]:
+            response = self.client.post(url, {"before": before}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        sort_order = issue.sort_order
+        issue.refresh_from_db()
+        self.assertEqual(issue.sort_order, sort_order)
+        with self.assertRaises(ValueError):
+            move_rank(
+                Issue,
+                "sort_order",
+                {"project_id": self.project.id, "state_id": self.state.id},
+                issue.id,
+                before_id=neighbour.id,
+            )
@@ -0,0 +1,34 @@
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import IssueSequence, IssueSequenceCounter
+
+
+class IssueSequenceCounterTests(ProjectAPITest):
+    def test_new_issues_get_consecutive_ids(self):
+        issues = [self.create_issue(name=f"Issue {index}") for index in range(3)]
+        self.assertEqual([issue.sequence_id for issue in issues], [1, 2, 3])
+
+    def test_blocks_are_reserved(self):
+        self.create_issue()
+        start = IssueSequenceCounter.allocate(self.project.id, 5)
+        self.assertEqual(start, 2)
+        self.assertEqual(self.create_issue().sequence_id, 7)
+
+    def test_deleted_ids_are_not_reused(self):
+        self.create_issue()
+        self.create_issue().delete()
+        self.assertEqual(self.create_issue().sequence_id, 3)
+
+    def test_first_allocation_continues_from_the_ids_in_use(self):
+        # Projects with issues from before the counter have no row yet
+        IssueSequence.objects.create(
+            sequence=41, project=self.project, workspace=self.workspace
+        )
+        self.assertFalse(
+            IssueSequenceCounter.objects.filter(project=self.project).exists()
+        )
+
+        self.assertEqual(self.create_issue().sequence_id, 42)
+        self.assertEqual(
+            IssueSequenceCounter.objects.get(project=self.project).last_sequence, 42
+        )
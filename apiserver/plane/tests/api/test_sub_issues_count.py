@@ -0,0 +1,83 @@
+# Python imports
+from io import StringIO
+
+# Django imports
+from django.core.management import call_command
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import Issue
+
+
+class SubIssuesCountTests(ProjectAPITest):
+    def create_sub_issue(self, parent, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.create_issue(parent=parent, **kwargs)
+
+    def count(self, issue):
+        return Issue.objects.values_list("sub_issues_count", flat=True).get(pk=issue.pk)
+
+    def test_count_follows_create_delete_and_parent_change(self):
+        parent = self.create_issue(name="Parent")
+        other = self.create_issue(name="Other")
+        child = self.create_sub_issue(parent)
+        self.create_sub_issue(parent)
+        self.assertEqual(self.count(parent), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            child.parent = other
+            child.save()
+        self.assertEqual(self.count(parent), 1)
+        self.assertEqual(self.count(other), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            child.delete()
+        self.assertEqual(self.count(other), 0)
+
+    def test_saving_a_stale_parent_keeps_the_count(self):
+        parent = self.create_issue(name="Parent")
+        stale = Issue.objects.get(pk=parent.pk)
+        self.create_sub_issue(parent)
+
+        stale.name = "Renamed"
+        stale.save()
+
+        self.assertEqual(self.count(parent), 1)
+
+    def test_bulk_sub_issue_assignment(self):
+        parent = self.create_issue(name="Parent")
+        previous = self.create_issue(name="Previous")
+        children = [self.create_sub_issue(previous) for _ in range(3)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse(
+                    "sub-issues",
+                    kwargs={
+                        "slug": self.workspace.slug,
+                        "project_id": self.project.id,
+                        "issue_id": parent.id,
+                    },
+                ),
+                {"sub_issue_ids": [str(child.id) for child in children]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.count(parent), 3)
+        self.assertEqual(self.count(previous), 0)
+
+    def test_reconcile_command(self):
+        parent = self.create_issue(name="Parent")
+        self.create_sub_issue(parent)
+        Issue.objects.filter(pk=parent.pk).update(sub_issues_count=7)
+
+        out = StringIO()
+        call_command("reconcile_sub_issues_count", stdout=out)
+
+        self.assertIn("1 issues reconciled", out.getvalue())
+        self.assertEqual(self.count(parent), 1)
@@ -0,0 +1,104 @@
+# Python imports
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.utils import timezone
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import CycleIssue, Cycle, DeletedIssue, Issue
+from plane.utils.sync import SyncToken, sync_changes
+
+
+class SyncTokenTests(ProjectAPITest):
+    def test_token_round_trip(self):
+        since = timezone.now()
+        token = SyncToken.from_string(
+            str(SyncToken(since, exact=True, last_id="0000-1"))
+        )
+        self.assertEqual(token.since, since)
+        self.assertTrue(token.exact)
+        self.assertEqual(token.last_id, "0000-1")
+
+    def test_invalid_token(self):
+        with self.assertRaises(ValueError):
+            SyncToken.from_string("not-a-token")
+
+    def test_overlap_of_final_token(self):
+        since = timezone.now()
+        self.assertLess(SyncToken(since).lower_bound, since)
+        self.assertEqual(SyncToken(since, exact=True).lower_bound, since)
+
+
+class SyncChangesTests(ProjectAPITest):
+    def sync_all(self, token):
+        synced = []
+        while True:
+            issues, _, token = sync_changes(
+                Issue.objects.filter(project=self.project),
+                DeletedIssue.objects.filter(project_id=self.project.id),
+                token,
+            )
+            synced.extend(issue.id for issue in issues)
+            if not token.exact:
+                return synced
+
+    @mock.patch("plane.utils.sync.SYNC_MAX_ISSUES", 2)
+    def test_issues_sharing_updated_at_across_pages(self):
+        issues = [self.create_issue(name=f"Issue {index}") for index in range(5)]
+        # One bulk update stamps every row with the same updated_at
+        stamp = timezone.now()
+        Issue.objects.filter(project=self.project).update(updated_at=stamp)
+
+        synced = self.sync_all(SyncToken(stamp - timedelta(minutes=1)))
+
+        self.assertEqual(len(synced), len(issues))
+        self.assertEqual(set(synced), {issue.id for issue in issues})
+
+    @mock.patch("plane.utils.sync.SYNC_MAX_ISSUES", 2)
+    def test_truncated_token_continues_after_last_issue(self):
+        for index in range(3):
+            self.create_issue(name=f"Issue {index}")
+        stamp = timezone.now()
+        Issue.objects.filter(project=self.project).update(updated_at=stamp)
+
+        first, _, token = sync_changes(
+            Issue.objects.filter(project=self.project),
+            DeletedIssue.objects.filter(project_id=self.project.id),
+            SyncToken(stamp - timedelta(minutes=1)),
+        )
+        self.assertTrue(token.exact)
+        self.assertEqual(token.since, stamp)
+        self.assertEqual(token.last_id, str(first[-1].id))
+
+        second, _, token = sync_changes(
+            Issue.objects.filter(project=self.project),
+            DeletedIssue.objects.filter(project_id=self.project.id),
+            SyncToken.from_string(str(token)),
+        )
+        self.assertEqual(len(second), 1)
+        self.assertNotIn(second[0].id, {issue.id for issue in first})
+
+    def test_cycle_change_touches_issue(self):
+        issue = self.create_issue()
+        stamp = timezone.now() - timedelta(hours=1)
+        Issue.objects.filter(pk=issue.pk).update(updated_at=stamp)
+        cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            workspace=self.workspace,
+            owned_by=self.user,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CycleIssue.objects.create(
+                issue=issue,
+                cycle=cycle,
+                project=self.project,
+                workspace=self.workspace,
+            )
+
+        issue.refresh_from_db()
+        self.assertGreater(issue.updated_at, stamp)
+        self.assertIn(issue.id, self.sync_all(SyncToken(stamp + timedelta(minutes=1))))
@@ -0,0 +1,107 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.urls import reverse
+from django.utils import timezone
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from .base import ProjectAPITest
+from plane.db.models import IssueActivity, IssueComment
+from plane.utils.paginator import KeysetCursor, UnionKeysetPaginator
+
+
+class UnionKeysetPaginatorTests(ProjectAPITest):
+    def setUp(self):
+        super().setUp()
+        self.issue = self.create_issue()
+        start = timezone.now()
+
+        # Activities and comments alternate in time
+        self.expected = []
+        for index in range(6):
+            if index % 2:
+                row = IssueComment.objects.create(
+                    issue=self.issue,
+                    actor=self.user,
+                    comment_html=f"<p>{index}</p>",
+                    project=self.project,
+                    workspace=self.workspace,
+                )
+                kind, model = "comment", IssueComment
+            else:
+                row = IssueActivity.objects.create(
+                    issue=self.issue,
+                    actor=self.user,
+                    verb="updated",
+                    field="priority",
+                    project=self.project,
+                    workspace=self.workspace,
+                )
+                kind, model = "activity", IssueActivity
+            model.objects.filter(pk=row.pk).update(
+                created_at=start + timedelta(minutes=index)
+            )
+            self.expected.append((kind, row.id))
+
+        self.paginator = UnionKeysetPaginator(
+            {
+                "activity": IssueActivity.objects.filter(issue=self.issue),
+                "comment": IssueComment.objects.filter(issue=self.issue),
+            },
+            order_by="-created_at",
+        )
+
+    def test_pages_merge_both_models_in_order(self):
+        pages, cursor = [], None
+        while True:
+            result = self.paginator.get_result(limit=4, cursor=cursor)
+            pages.append([(kind, instance.id) for kind, instance in result.results])
+            if not result.next.has_results:
+                break
+            cursor = KeysetCursor.from_string(str(result.next))
+
+        self.assertEqual([len(page) for page in pages], [4, 2])
+        self.assertEqual(sum(pages, []), self.expected[::-1])
+
+    def test_prev_cursor_returns_the_previous_page(self):
+        first = self.paginator.get_result(limit=2)
+        second = self.paginator.get_result(
+            limit=2, cursor=KeysetCursor.from_string(str(first.next))
+        )
+        previous = self.paginator.get_result(
+            limit=2, cursor=KeysetCursor.from_string(str(second.prev))
+        )
+
+        self.assertEqual(
+            [(kind, instance.id) for kind, instance in previous.results],
+            self.expected[::-1][:2],
+        )
+        self.assertFalse(previous.prev.has_results)
+
+    def test_history_endpoint_pages_newest_first(self):
+        url = reverse(
+            "project-issue-history",
+            kwargs={
+                "slug": self.workspace.slug,
+                "project_id": self.project.id,
+                "issue_id": self.issue.id,
+            },
+        )
+
+        response = self.client.get(url, {"per_page": 4}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [str(pk) for _, pk in self.expected[::-1][:4]],
+        )
+        self.assertTrue(response.data["next_page_results"])
+
+        # Without paging the whole history comes oldest first
+        response = self.client.get(url, format="json")
+        self.assertEqual(
+            [row["id"] for row in response.data], [str(pk) for _, pk in self.expected]
+        )
@@ -0,0 +1,135 @@
+# Python imports
+import threading
+from collections import Counter
+
+# Django imports
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import IssueAssignee, UserActivityRollup, UserIssueRollup
+from plane.utils.issue_stats import STATE_GROUP_COUNTERS, ISSUE_STAT_FIELDS
+
+# Rollups are refreshed by the activity pipeline, the timeout bounds staleness
+# of the date relative parts (overdue, due this week) and of writes that skip it
+DASHBOARD_CACHE_TIMEOUT = 300
+DASHBOARD_MONTHS = [str(month) for month in range(1, 13)]
+
+_pending = threading.local()
+
+
+def dashboard_cache_key(slug, user_id, month):
+    return f"dashboard:{slug}:{str(user_id)}:{month}"
+
+
+def invalidate_dashboard(slug, *user_ids):
+    cache.delete_many(
+        [
+            dashboard_cache_key(slug, user_id, month)
+            for user_id in user_ids
+            if user_id is not None
+            for month in DASHBOARD_MONTHS
+        ]
+    )
+
+
+def record_user_activity(workspace, issue_activities):
+    """add the created issue activities to the daily activity rollups
+
+    Args:
+        workspace (Workspace): workspace the activities belong to
+        issue_activities (list): IssueActivity instances already saved
+    """
+    # Days are in UTC, the connection time zone, so they match the backfill
+    # and the graph before the rollups, both cast created_at to a date
+    counts = Counter(
+        (
+            issue_activity.actor_id,
+            (issue_activity.created_at or timezone.now())
+            .astimezone(timezone.utc)
+            .date(),
+        )
+        for issue_activity in issue_activities
+        if issue_activity.actor_id is not None
+    )
+
+    for (user_id, day), count in counts.items():
+        rollup = UserActivityRollup.objects.filter(
+            workspace_id=workspace.id, user_id=user_id, date=day
+        )
+        if rollup.update(activity_count=F("activity_count") + count):
+            continue
+        try:
+            with transaction.atomic():
+                UserActivityRollup.objects.create(
+                    workspace_id=workspace.id,
+                    user_id=user_id,
+                    date=day,
+                    activity_count=count,
+                )
+        except IntegrityError:
+            # Created by a concurrent job in the meantime
+            rollup.update(activity_count=F("activity_count") + count)
+
+    invalidate_dashboard(workspace.slug, *{user_id for user_id, _ in counts})
+
+
+def refresh_user_issue_rollups(workspace, user_ids):
+    """recount the issues assigned to the users in the workspace by state group
+
+    Args:
+        workspace (Workspace): workspace to recount
+        user_ids (list): ids of the assignees to recount
+    """
+    user_ids = {str(user_id) for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+
+    annotations = {"total_issues": Count("id")}
+    for counter, group in STATE_GROUP_COUNTERS.items():
+        annotations[counter] = Count("id", filter=Q(issue__state__group=group))
+
+    stats = {
+        str(row["assignee_id"]): row
+        for row in IssueAssignee.objects.filter(
+            workspace_id=workspace.id, assignee_id__in=user_ids
+        )
+        .order_by()
+        .values("assignee_id")
+        .annotate(**annotations)
+    }
+
+    for user_id in user_ids:
+        row = stats.get(user_id, {})
+        counters = {counter: row.get(counter, 0) for counter in ISSUE_STAT_FIELDS}
+        try:
+            with transaction.atomic():
+                UserIssueRollup.objects.update_or_create(
+                    workspace_id=workspace.id, user_id=user_id, defaults=counters
+                )
+        except IntegrityError:
+            # Created by a concurrent job in the meantime
+            UserIssueRollup.objects.filter(
+                workspace_id=workspace.id, user_id=user_id
+            ).update(**counters)
+
+    invalidate_dashboard(workspace.slug, *user_ids)
+
+
+def schedule_user_issue_rollups(workspace, user_ids):
+    """recount the users once the current transaction commits, for the
+    writes that emit no activity, like the cycle and module stats"""
+    if not hasattr(_pending, "rollups"):
+        _pending.rollups = {}
+
+    _, pending_ids = _pending.rollups.setdefault(workspace.id, (workspace, set()))
+    pending_ids.update(str(user_id) for user_id in user_ids if user_id is not None)
+    transaction.on_commit(flush_user_issue_rollups)
+
+
+def flush_user_issue_rollups():
+    rollups, _pending.rollups = getattr(_pending, "rollups", {}), {}
+    for workspace, user_ids in rollups.values():
+        refresh_user_issue_rollups(workspace, user_ids)
@@ -0,0 +1,164 @@
+# Python imports
+import hashlib
+import threading
+import uuid
+from functools import wraps
+
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from django.utils.http import parse_etags
+
+# Third party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Versions are dropped on every write of the collection, the timeout only
+# bounds staleness for writes that skip signals and are not bumped by hand
+COLLECTION_VERSION_TIMEOUT = 3600
+
+# Collections versioned per project, model -> collections its rows show up in
+PROJECT_COLLECTIONS = {
+    "db.Issue": ["issues"],
+    "db.IssueAssignee": ["issues"],
+    "db.IssueLabel": ["issues"],
+    "db.CycleIssue": ["issues"],
+    "db.ModuleIssue": ["issues"],
+    "db.State": ["issues", "states"],
+    "db.Label": ["issues", "labels"],
+    "db.Cycle": ["cycles"],
+    "db.CycleFavorite": ["cycles"],
+}
+# Collections versioned per workspace slug
+WORKSPACE_COLLECTIONS = {
+    "db.Project": ["projects"],
+    "db.ProjectMember": ["projects"],
+    "db.ProjectFavorite": ["projects"],
+}
+
+_pending = threading.local()
+
+
+def collection_version_key(collection, scope_id):
+    return f"collection_version:{collection}:{str(scope_id)}"
+
+
+def collection_version(collection, scope_id):
+    """opaque version of a collection, replaced whenever it is written"""
+    return cache.get_or_set(
+        collection_version_key(collection, scope_id),
+        lambda: uuid.uuid4().hex,
+        COLLECTION_VERSION_TIMEOUT,
+    )
+
+
+def bump_collection_version(collection, *scope_ids):
+    """drop the versions once the current transaction commits, so the next
+    read hands out a new ETag and never one for uncommitted data"""
+    if not hasattr(_pending, "keys"):
+        _pending.keys = set()
+
+    _pending.keys.update(
+        collection_version_key(collection, scope_id)
+        for scope_id in scope_ids
+        if scope_id is not None
+    )
+    transaction.on_commit(flush_collection_versions)
+
+
+def flush_collection_versions():
+    keys, _pending.keys = getattr(_pending, "keys", set()), set()
+    if keys:
+        cache.delete_many(list(keys))
+
+
+def bump_project_collections(model, *project_ids):
+    """bump the project collections holding rows of the model, used by the
+    bulk writes that skip signals"""
+    for collection in PROJECT_COLLECTIONS.get(model._meta.label, []):
+        bump_collection_version(collection, *project_ids)
+
+
+def bump_workspace_collections(model, *slugs):
+    for collection in WORKSPACE_COLLECTIONS.get(model._meta.label, []):
+        bump_collection_version(collection, *slugs)
+
+
+def bump_instance_collections(sender, instance, **kwargs):
+    if sender._meta.label in PROJECT_COLLECTIONS:
+        bump_project_collections(sender, instance.project_id)
+
+    if sender._meta.label in WORKSPACE_COLLECTIONS:
+        from plane.db.models import Workspace
+
+        bump_workspace_collections(
+            sender,
+            *Workspace.objects.filter(pk=instance.workspace_id).values_list(
+                "slug", flat=True
+            ),
+        )
+
+
+def connect_collection_signals():
+    for label in [*PROJECT_COLLECTIONS, *WORKSPACE_COLLECTIONS]:
+        for signal in (post_save, post_delete):
+            signal.connect(
+                bump_instance_collections,
+                sender=label,
+                dispatch_uid=f"collection_version:{label}",
+            )
+
+
+def collection_etag_value(request, collection, scope_id):
+    # The same collection renders differently per user, timezone, renderer
+    # and query string
+    fingerprint = ":".join(
+        [
+            collection_version(collection, scope_id),
+            str(request.user.id),
+            timezone.get_current_timezone_name(),
+            getattr(request.accepted_renderer, "format", ""),
+            request.get_full_path(),
+        ]
+    )
+    return f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+
+
+def etag_matches(etag, if_none_match):
+    # If-None-Match uses the weak comparison, gzip_page weakens the ETags
+    for tag in parse_etags(if_none_match):
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def collection_etag(collection, scope="project_id"):
+    """answer a list request with 304 Not Modified while its collection is
+    unchanged, before the view runs any query
+
+    Args:
+        collection (string): collection the view lists
+        scope (string): url kwarg holding the id the collection is versioned by
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(self, request, *args, **kwargs):
+            etag = collection_etag_value(request, collection, kwargs.get(scope))
+
+            if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+            if if_none_match and etag_matches(etag, if_none_match):
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+            response = view_func(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                response["ETag"] = etag
+            return response
+
+        return wrapper
+
+    return decorator
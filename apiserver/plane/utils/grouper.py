@@ -1,3 +1,13 @@
+# Django imports
+from django.db.models import Count
+
+# Third party imports
+from rest_framework.exceptions import ParseError
+
+# Module imports
+from plane.utils.paginator import KeysetCursor, KeysetPaginator
+
+
 def resolve_keys(group_keys, value):
     """resolve keys to a key which will be used for
     grouping
@@ -60,3 +70,104 @@ def group_results(results_data, group_by):
                 response_dict[str(group_attribute)].append(value)
 
     return response_dict
+
+
+# group_by option -> issue field grouped on in the database
+GROUP_BY_FIELDS = {
+    "state": "state",
+    "priority": "priority",
+    "labels": "labels",
+    "assignees": "assignees",
+    "created_by": "created_by",
+}
+
+
+def group_cursor(request):
+    """the cursor of the group paged by the request, for group_queryset
+
+    Args:
+        request (Request): request with the cursor and group query params
+
+    Returns:
+        KeysetCursor: the parsed cursor, None without one
+
+    Raises:
+        ParseError: the cursor is invalid or comes without a group
+    """
+    cursor = request.GET.get("cursor", None)
+    if not cursor:
+        return None
+    try:
+        cursor = KeysetCursor.from_string(cursor)
+    except ValueError:
+        raise ParseError("Invalid cursor parameter")
+    if request.GET.get("group", None) is None:
+        raise ParseError("group is required with a cursor")
+    return cursor
+
+
+def group_queryset(
+    queryset, group_by, order_by, limit, on_results=None, group=None, cursor=None
+):
+    """group an issue queryset in the database, returning the count and the
+    first page of every group along with a cursor to load more of it
+
+    Args:
+        queryset (QuerySet): filtered issue queryset
+        group_by (string): one of GROUP_BY_FIELDS
+        order_by (string): ordering inside each group
+        limit (int): page size per group
+        on_results (func): serializer for the page rows
+        group (string): only page through this group
+        cursor (KeysetCursor): cursor of the group being paged, requires group
+
+    Returns:
+        obj: grouped results
+    """
+    # A cursor points into one group, applied to every group it would skip
+    # the first rows of the others
+    if cursor is not None and group is None:
+        raise ValueError("group is required with a cursor")
+
+    field = GROUP_BY_FIELDS[group_by]
+
+    counts = {
+        str(row[field]): (row[field], row["count"])
+        for row in queryset.order_by()
+        .values(field)
+        .annotate(count=Count("id", distinct=True))
+    }
+
+    response_dict = dict()
+    if group_by == "priority" and group is None:
+        response_dict = {
+            key: {
+                "count": 0,
+                "results": [],
+                "next_cursor": None,
+                "next_page_results": False,
+            }
+            for key in ["urgent", "high", "medium", "low", "None"]
+        }
+
+    for key, (value, count) in counts.items():
+        if group is not None and key != group:
+            continue
+
+        rows = (
+            queryset.filter(**{f"{field}__isnull": True})
+            if value is None
+            else queryset.filter(**{field: value})
+        )
+        cursor_result = KeysetPaginator(
+            rows, order_by=order_by, on_results=on_results
+        ).get_result(limit=limit, cursor=cursor)
+
+        response_dict[key] = {
+            "count": count,
+            "results": cursor_result.results,
+            "next_cursor": str(cursor_result.next),
+            "next_page_results": cursor_result.next.has_results,
+        }
+
+    return response_dict
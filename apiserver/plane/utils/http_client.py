@@ -0,0 +1,66 @@
+# Python imports
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookiePolicy
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) timeout in seconds of the outbound calls
+HTTP_TIMEOUT = (3, 15)
+# Calls running at once per gather
+HTTP_MAX_WORKERS = 8
+# Connections kept per host, a gathered call may gather once more itself
+# (the GitHub repository details page through the collaborators)
+HTTP_POOL_SIZE = 2 * HTTP_MAX_WORKERS
+
+
+class BlockAllCookies(CookiePolicy):
+    """Neither store nor send cookies"""
+
+    return_ok = set_ok = domain_return_ok = path_return_ok = (
+        lambda self, *args, **kwargs: False
+    )
+    netscape = True
+    rfc2965 = hide_cookie2 = False
+
+
+# One pooled session per process so connections to the importer and
+# integration apis are kept alive between calls. It is shared by every
+# workspace, so it must not keep cookies one set of credentials got
+session = requests.Session()
+session.cookies.set_policy(BlockAllCookies())
+session.mount(
+    "http://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE),
+)
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE),
+)
+
+
+def request(method, url, **kwargs):
+    """requests.request over the pooled session, with a timeout"""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return session.request(method, url, **kwargs)
+
+
+def gather(*calls):
+    """run independent calls at once, so they take one round trip instead
+    of one each
+
+    Args:
+        calls (callable): functions without arguments, e.g. lambdas around
+            request
+
+    Returns:
+        list: results of the calls in the given order, the first exception
+        raised by a call is raised again
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), HTTP_MAX_WORKERS)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
@@ -0,0 +1,214 @@
+# Python imports
+import json
+
+# Module imports
+from plane.db.models import (
+    State,
+    Issue,
+    IssueSequence,
+    IssueSequenceCounter,
+    IssueActivity,
+    IssueComment,
+    IssueLink,
+    IssueLabel,
+    IssueAssignee,
+)
+from plane.utils.html_processor import strip_tags
+from plane.utils.dashboard import record_user_activity
+from plane.utils.etag import bump_project_collections
+
+# Issues written per transaction by the import job
+BULK_IMPORT_CHUNK_SIZE = 500
+
+
+def read_issues_data(file):
+    """yield the issues of a newline delimited json file one at a time"""
+    for line in file:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def chunked(rows, size=BULK_IMPORT_CHUNK_SIZE):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def default_import_state(project_id):
+    default_state = State.objects.filter(project_id=project_id, default=True).first()
+    # if there is no default state assign any random state
+    if default_state is None:
+        default_state = State.objects.filter(project_id=project_id).first()
+    return default_state
+
+
+def import_issues(project, issues_data, actor, service, default_state):
+    """create one chunk of imported issues with their relations
+
+    Args:
+        project (Project): project the issues are imported into
+        issues_data (list): issue payloads of the chunk
+        actor (User): user running the import
+        service (string): service the issues are imported from
+        default_state (State): state of the issues without one
+
+    Returns:
+        tuple: the created issues and the ids of their assignees
+    """
+    # Reserve one contiguous block of sequence ids for the chunk
+    last_id = IssueSequenceCounter.allocate(project.id, len(issues_data))
+
+    # Reserve a block of ranks after every issue of the project, so chunks
+    # and concurrent creates never interleave
+    sort_order = IssueSequenceCounter.allocate_ranks(project.id, len(issues_data))
+
+    # Issues
+    bulk_issues = []
+    for issue_data in issues_data:
+        bulk_issues.append(
+            Issue(
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                state_id=issue_data.get("state")
+                if issue_data.get("state", False)
+                else default_state.id,
+                name=issue_data.get("name", "Issue Created through Bulk"),
+                description_html=issue_data.get("description_html", "<p></p>"),
+                description_stripped=(
+                    None
+                    if (
+                        issue_data.get("description_html") == ""
+                        or issue_data.get("description_html") is None
+                    )
+                    else strip_tags(issue_data.get("description_html"))
+                ),
+                sequence_id=last_id,
+                sort_order=sort_order,
+                start_date=issue_data.get("start_date", None),
+                target_date=issue_data.get("target_date", None),
+                priority=issue_data.get("priority", None),
+            )
+        )
+
+        sort_order = sort_order + 1
+        last_id = last_id + 1
+
+    issues = Issue.objects.bulk_create(
+        bulk_issues,
+        batch_size=100,
+        ignore_conflicts=True,
+    )
+
+    # Sequences
+    _ = IssueSequence.objects.bulk_create(
+        [
+            IssueSequence(
+                issue=issue,
+                sequence=issue.sequence_id,
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+            )
+            for issue in issues
+        ],
+        batch_size=100,
+    )
+
+    # Attach Labels
+    _ = IssueLabel.objects.bulk_create(
+        [
+            IssueLabel(
+                issue=issue,
+                label_id=label_id,
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                created_by=actor,
+                updated_by=actor,
+            )
+            for issue, issue_data in zip(issues, issues_data)
+            for label_id in issue_data.get("labels_list", [])
+        ],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
+
+    # Attach Assignees
+    bulk_issue_assignees = [
+        IssueAssignee(
+            issue=issue,
+            assignee_id=assignee_id,
+            project_id=project.id,
+            workspace_id=project.workspace_id,
+            created_by=actor,
+            updated_by=actor,
+        )
+        for issue, issue_data in zip(issues, issues_data)
+        for assignee_id in issue_data.get("assignees_list", [])
+    ]
+    _ = IssueAssignee.objects.bulk_create(
+        bulk_issue_assignees, batch_size=100, ignore_conflicts=True
+    )
+
+    # Track the issue activities
+    issue_activities = IssueActivity.objects.bulk_create(
+        [
+            IssueActivity(
+                issue=issue,
+                actor=actor,
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                comment=f"{actor.email} importer the issue from {service}",
+                verb="created",
+            )
+            for issue in issues
+        ],
+        batch_size=100,
+    )
+    record_user_activity(project.workspace, issue_activities)
+
+    # Create Comments
+    _ = IssueComment.objects.bulk_create(
+        [
+            IssueComment(
+                issue=issue,
+                comment_html=comment.get("comment_html", "<p></p>"),
+                actor=actor,
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                created_by=actor,
+                updated_by=actor,
+            )
+            for issue, issue_data in zip(issues, issues_data)
+            for comment in issue_data.get("comments_list", [])
+        ],
+        batch_size=100,
+    )
+
+    # Attach Links
+    _ = IssueLink.objects.bulk_create(
+        [
+            IssueLink(
+                issue=issue,
+                url=issue_data.get("link", {}).get("url", "https://github.com"),
+                title=issue_data.get("link", {}).get("title", "Original Issue"),
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                created_by=actor,
+                updated_by=actor,
+            )
+            for issue, issue_data in zip(issues, issues_data)
+        ],
+        batch_size=100,
+    )
+
+    # Bulk writes skip the signals bumping the issue list version
+    bump_project_collections(Issue, project.id)
+
+    return issues, [
+        issue_assignee.assignee_id for issue_assignee in bulk_issue_assignees
+    ]
@@ -1,44 +1,43 @@
-import requests
 from requests.auth import HTTPBasicAuth
 from sentry_sdk import capture_exception
 
+from plane.utils.http_client import gather, request
 
-def jira_project_issue_summary(email, api_token, project_name, hostname):
+
+def jira_project_issue_summary(
+    email, api_token, project_name, hostname, scheme="https"
+):
     try:
         auth = HTTPBasicAuth(email, api_token)
         headers = {"Accept": "application/json"}
-
-        issue_url = f"https://{hostname}/rest/api/3/search?jql=project={project_name} AND issuetype=Story"
-        issue_response = requests.request(
-            "GET", issue_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        module_url = f"https://{hostname}/rest/api/3/search?jql=project={project_name} AND issuetype=Epic"
-        module_response = requests.request(
-            "GET", module_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        status_url = f"https://{hostname}/rest/api/3/status/?jql=project={project_name}"
-        status_response = requests.request(
-            "GET", status_url, headers=headers, auth=auth
-        ).json()
-
-        labels_url = f"https://{hostname}/rest/api/3/label/?jql=project={project_name}"
-        labels_response = requests.request(
-            "GET", labels_url, headers=headers, auth=auth
-        ).json()["total"]
-
-        users_url = (
-            f"https://{hostname}/rest/api/3/users/search?jql=project={project_name}"
+        base_url = f"{scheme}://{hostname}/rest/api/3"
+
+        def get_json(url):
+            return request("GET", url, headers=headers, auth=auth).json()
+
+        # The five calls are independent, fetch them at once
+        (
+            issue_response,
+            module_response,
+            status_response,
+            labels_response,
+            users_response,
+        ) = gather(
+            lambda: get_json(
+                f"{base_url}/search?jql=project={project_name} AND issuetype=Story"
+            ),
+            lambda: get_json(
+                f"{base_url}/search?jql=project={project_name} AND issuetype=Epic"
+            ),
+            lambda: get_json(f"{base_url}/status/?jql=project={project_name}"),
+            lambda: get_json(f"{base_url}/label/?jql=project={project_name}"),
+            lambda: get_json(f"{base_url}/users/search?jql=project={project_name}"),
         )
-        users_response = requests.request(
-            "GET", users_url, headers=headers, auth=auth
-        ).json()
 
         return {
-            "issues": issue_response,
-            "modules": module_response,
-            "labels": labels_response,
+            "issues": issue_response["total"],
+            "modules": module_response["total"],
+            "labels": labels_response["total"],
             "states": len(status_response),
             "users": (
                 [
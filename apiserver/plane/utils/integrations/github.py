@@ -1,13 +1,33 @@
 import os
 import jwt
-import requests
-from urllib.parse import urlparse, parse_qs
+import hashlib
+from urllib.parse import urlencode, urlparse, urlunparse, parse_qs
 from datetime import datetime, timedelta
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from cryptography.hazmat.backends import default_backend
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from plane.utils.http_client import HTTP_MAX_WORKERS, gather, request
+
+# The app JWT is valid for 10 minutes, reuse it for 8
+GITHUB_JWT_TIMEOUT = 8 * 60
+# Installation tokens are dropped from the cache this long before they expire
+GITHUB_TOKEN_EXPIRY_MARGIN = 5 * 60
+# Largest page size of the GitHub list apis
+GITHUB_PAGE_SIZE = 100
+# Requests of the rate limit left to the other GitHub calls of the installation
+GITHUB_RATE_LIMIT_RESERVE = 100
+# Seconds the repositories and repository details of an installation are cached
+GITHUB_CACHE_TIMEOUT = 5 * 60
 
 
 def get_jwt_token():
+    token = cache.get("github:app_jwt")
+    if token is not None:
+        return token
+
     app_id = os.environ.get("GITHUB_APP_ID", "")
     secret = bytes(os.environ.get("GITHUB_APP_PRIVATE_KEY", ""), encoding="utf8")
     current_timestamp = int(datetime.now().timestamp())
@@ -23,9 +43,127 @@ def get_jwt_token():
 
     priv_rsakey = load_pem_private_key(secret, None, default_backend())
     token = jwt.encode(payload, priv_rsakey, algorithm="RS256")
+    cache.set("github:app_jwt", token, GITHUB_JWT_TIMEOUT)
     return token
 
 
+def installation_key(prefix, access_tokens_url, *parts):
+    # The access tokens url is unique per installation
+    digest = hashlib.md5(access_tokens_url.encode()).hexdigest()
+    return ":".join(["github", prefix, digest, *[str(part) for part in parts]])
+
+
+def installation_token_key(access_tokens_url):
+    return installation_key("installation_token", access_tokens_url)
+
+
+def get_installation_token(access_tokens_url):
+    """installation access token, cached until shortly before it expires"""
+    key = installation_token_key(access_tokens_url)
+    token = cache.get(key)
+    if token is not None:
+        return token
+
+    headers = {
+        "Authorization": "Bearer " + str(get_jwt_token()),
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    oauth_response = request("POST", access_tokens_url, headers=headers).json()
+
+    token = oauth_response.get("token", "")
+    expires_at = parse_datetime(oauth_response.get("expires_at") or "")
+    if token and expires_at is not None:
+        timeout = (expires_at - timezone.now()).total_seconds()
+        if timeout > GITHUB_TOKEN_EXPIRY_MARGIN:
+            cache.set(key, token, timeout - GITHUB_TOKEN_EXPIRY_MARGIN)
+    return token
+
+
+def page_url(url, page):
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    query.update({"per_page": [GITHUB_PAGE_SIZE], "page": [page]})
+    return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+
+def rate_limit_budget(responses):
+    """requests left for paging, None when GitHub sent no rate limit"""
+    remaining = [
+        int(response.headers["X-RateLimit-Remaining"])
+        for response in responses
+        if "X-RateLimit-Remaining" in response.headers
+    ]
+    return min(remaining) - GITHUB_RATE_LIMIT_RESERVE if remaining else None
+
+
+def page_items(response, key):
+    response.raise_for_status()
+    data = response.json()
+    return data.get(key, []) if key is not None else data
+
+
+def github_pages(url, headers, key=None):
+    """every item of a GitHub list api, page by page
+
+    The pages after the first are read from its Link header and fetched a
+    batch at once, as long as the rate limit leaves room for them. Lists
+    without a last link are followed one next link at a time.
+
+    Args:
+        url (string): url of the list
+        headers (obj): headers of the requests
+        key (string): key of the items when the api wraps them in an object
+
+    Yields:
+        obj: the items in page order
+
+    Returns:
+        bool: whether the rate limit stopped the paging before the last
+        page, the value of the StopIteration, see read_pages
+    """
+    response = request("GET", page_url(url, 1), headers=headers)
+    yield from page_items(response, key)
+    budget = rate_limit_budget([response])
+
+    last = response.links.get("last")
+    if last is None:
+        while "next" in response.links and (budget is None or budget > 0):
+            response = request("GET", response.links["next"]["url"], headers=headers)
+            yield from page_items(response, key)
+            budget = rate_limit_budget([response])
+        return "next" in response.links
+
+    pages = list(range(2, int(parse_qs(urlparse(last["url"]).query)["page"][0]) + 1))
+    while pages and (budget is None or budget > 0):
+        size = HTTP_MAX_WORKERS if budget is None else min(HTTP_MAX_WORKERS, budget)
+        batch, pages = pages[:size], pages[size:]
+        responses = gather(
+            *[
+                lambda page=page: request("GET", page_url(url, page), headers=headers)
+                for page in batch
+            ]
+        )
+        for response in responses:
+            yield from page_items(response, key)
+        budget = rate_limit_budget(responses)
+    return bool(pages)
+
+
+def read_pages(pages):
+    """every item of a github_pages generator
+
+    Returns:
+        tuple: the items and whether the list is partial
+    """
+    items = []
+    while True:
+        try:
+            items.append(next(pages))
+        except StopIteration as stop:
+            return items, stop.value
+
+
 def get_github_metadata(installation_id):
     token = get_jwt_token()
 
@@ -34,33 +172,47 @@ def get_github_metadata(installation_id):
         "Authorization": "Bearer " + str(token),
         "Accept": "application/vnd.github+json",
     }
-    response = requests.get(url, headers=headers).json()
+    response = request("GET", url, headers=headers).json()
     return response
 
 
 def get_github_repos(access_tokens_url, repositories_url):
-    token = get_jwt_token()
-
+    oauth_token = get_installation_token(access_tokens_url)
     headers = {
-        "Authorization": "Bearer " + str(token),
+        "Authorization": "Bearer " + str(oauth_token),
         "Accept": "application/vnd.github+json",
     }
+    response = request("GET", repositories_url, headers=headers).json()
+    return response
+
+
+def get_all_github_repos(access_tokens_url, repositories_url):
+    """every repository of the installation, cached for a few minutes
 
-    oauth_response = requests.post(
-        access_tokens_url,
-        headers=headers,
-    ).json()
+    The list is partial when the rate limit ran out while paging, it is
+    then not cached so the next call reads it again
+    """
+    key = installation_key("repositories", access_tokens_url)
+    repositories = cache.get(key)
+    if repositories is not None:
+        return repositories
 
-    oauth_token = oauth_response.get("token", "")
+    oauth_token = get_installation_token(access_tokens_url)
     headers = {
         "Authorization": "Bearer " + str(oauth_token),
         "Accept": "application/vnd.github+json",
     }
-    response = requests.get(
-        repositories_url,
-        headers=headers,
-    ).json()
-    return response
+    repositories, partial = read_pages(
+        github_pages(repositories_url, headers, key="repositories")
+    )
+    repositories = {
+        "total_count": len(repositories),
+        "repositories": repositories,
+        "partial": partial,
+    }
+    if not partial:
+        cache.set(key, repositories, GITHUB_CACHE_TIMEOUT)
+    return repositories
 
 
 def delete_github_installation(installation_id):
@@ -71,60 +223,67 @@ def delete_github_installation(installation_id):
         "Authorization": "Bearer " + str(token),
         "Accept": "application/vnd.github+json",
     }
-    response = requests.delete(url, headers=headers)
+    response = request("DELETE", url, headers=headers)
+    # The tokens of the installation are revoked with it
+    access_tokens_url = f"{url}/access_tokens"
+    cache.delete_many(
+        [
+            installation_token_key(access_tokens_url),
+            installation_key("repositories", access_tokens_url),
+        ]
+    )
     return response
 
 
 def get_github_repo_details(access_tokens_url, owner, repo):
-    token = get_jwt_token()
-
-    headers = {
-        "Authorization": "Bearer " + str(token),
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-
-    oauth_response = requests.post(
-        access_tokens_url,
-        headers=headers,
-    ).json()
+    key = installation_key("repository", access_tokens_url, owner, repo)
+    details = cache.get(key)
+    if details is not None:
+        return details
 
-    oauth_token = oauth_response.get("token")
+    oauth_token = get_installation_token(access_tokens_url)
     headers = {
         "Authorization": "Bearer " + oauth_token,
         "Accept": "application/vnd.github+json",
     }
-    open_issues = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}",
-        headers=headers,
-    ).json()["open_issues_count"]
-
-    total_labels = 0
 
-    labels_response = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}/labels?per_page=100&page=1",
-        headers=headers,
+    # The repository, the first label page and the collaborators at once
+    repository, labels_response, (collaborators, partial) = gather(
+        lambda: request(
+            "GET", f"https://api.github.com/repos/{owner}/{repo}", headers=headers
+        ).json(),
+        lambda: request(
+            "GET",
+            f"https://api.github.com/repos/{owner}/{repo}/labels?per_page=100&page=1",
+            headers=headers,
+        ),
+        # Every page of the collaborators
+        lambda: read_pages(
+            github_pages(
+                f"https://api.github.com/repos/{owner}/{repo}/collaborators", headers
+            )
+        ),
     )
+    open_issues = repository["open_issues_count"]
+
+    total_labels = 0
 
     # Check if there are more pages
     if len(labels_response.links.keys()):
         # get the query parameter of last
         last_url = labels_response.links.get("last").get("url")
         parsed_url = urlparse(last_url)
-        last_page_value = parse_qs(parsed_url.query)["page"][0]
+        last_page_value = int(parse_qs(parsed_url.query)["page"][0])
         total_labels = total_labels + 100 * (last_page_value - 1)
 
         # Get labels in last page
-        last_page_labels = requests.get(last_url, headers=headers).json()
+        last_page_labels = request("GET", last_url, headers=headers).json()
         total_labels = total_labels + len(last_page_labels)
     else:
         total_labels = len(labels_response.json())
 
-    # Currently only supporting upto 100 collaborators
-    # TODO: Update this function to fetch all collaborators
-    collaborators = requests.get(
-        f"https://api.github.com/repos/{owner}/{repo}/collaborators?per_page=100&page=1",
-        headers=headers,
-    ).json()
-
-    return open_issues, total_labels, collaborators
+    # Collaborators cut short by the rate limit are read again next time
+    details = (open_issues, total_labels, collaborators, partial)
+    if not partial:
+        cache.set(key, details, GITHUB_CACHE_TIMEOUT)
+    return details
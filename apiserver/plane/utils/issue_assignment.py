@@ -0,0 +1,94 @@
+# Django imports
+from django.db import connection
+
+# Module imports
+from plane.utils.sync import schedule_issue_touch
+
+# Rows written per upsert statement
+ASSIGNMENT_BATCH_SIZE = 1000
+
+
+def upsert_issue_rows(through, field, rows):
+    """insert the rows, an issue already in another cycle or module has its
+    row pointed at the new one instead, since an issue is in one at a time
+
+    Args:
+        through (Model): CycleIssue or ModuleIssue
+        field (string): foreign key of the through model to the cycle or module
+        rows (list): unsaved through model rows
+    """
+    if not rows:
+        return
+
+    fields = through._meta.concrete_fields
+    table = through._meta.db_table
+    columns = ", ".join(model_field.column for model_field in fields)
+    target = through._meta.get_field(field).column
+    updated_by = through._meta.get_field("updated_by").column
+    row_sql = "(" + ", ".join(["%s"] * len(fields)) + ")"
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), ASSIGNMENT_BATCH_SIZE):
+            batch = rows[start : start + ASSIGNMENT_BATCH_SIZE]
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES "
+                f"{', '.join([row_sql] * len(batch))} "
+                f"ON CONFLICT (issue_id) DO UPDATE SET "
+                f"{target} = EXCLUDED.{target}, "
+                f"updated_at = EXCLUDED.updated_at, "
+                f"{updated_by} = EXCLUDED.{updated_by}",
+                [
+                    model_field.get_db_prep_save(
+                        model_field.pre_save(row, True), connection
+                    )
+                    for row in batch
+                    for model_field in fields
+                ],
+            )
+
+
+def assign_issues(through, field, target, issue_ids, actor):
+    """put issues into a cycle or module, moving them out of the one they
+    are in, with one read and one upsert per batch
+
+    Args:
+        through (Model): CycleIssue or ModuleIssue
+        field (string): foreign key of the through model to the cycle or module
+        target (Cycle | Module): cycle or module the issues go to
+        issue_ids (list): issues to assign
+        actor (User): user assigning the issues
+
+    Returns:
+        tuple: the rows created for issues in none before and the issue
+        id -> previous cycle or module id of the moved issues
+    """
+    issue_ids = list(dict.fromkeys(str(pk) for pk in issue_ids if pk is not None))
+    current = {
+        str(issue_id): str(target_id)
+        for issue_id, target_id in through.objects.filter(
+            issue_id__in=issue_ids
+        ).values_list("issue_id", f"{field}_id")
+    }
+
+    rows = [
+        through(
+            issue_id=issue_id,
+            project_id=target.project_id,
+            workspace_id=target.workspace_id,
+            created_by=actor,
+            updated_by=actor,
+            **{field: target},
+        )
+        for issue_id in issue_ids
+        if current.get(issue_id) != str(target.id)
+    ]
+    upsert_issue_rows(through, field, rows)
+    schedule_issue_touch(row.issue_id for row in rows)
+
+    created = [row for row in rows if str(row.issue_id) not in current]
+    moved = {
+        str(row.issue_id): current[str(row.issue_id)]
+        for row in rows
+        if str(row.issue_id) in current
+    }
+    return created, moved
@@ -0,0 +1,224 @@
+# Python imports
+from collections import defaultdict
+
+# Django imports
+from django.db import models
+from django.db.models import QuerySet
+from django.utils import timezone
+
+# Module imports
+from plane.utils.grouper import group_results
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Project,
+    State,
+    Workspace,
+)
+
+
+def format_datetime(value):
+    # Same output as the DRF DateTimeField
+    value = timezone.localtime(value).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def format_date(value):
+    return value.isoformat()
+
+
+def column_formatter(field):
+    if isinstance(field, models.DateTimeField):
+        return format_datetime
+    if isinstance(field, models.DateField):
+        return format_date
+    return None
+
+
+ISSUE_FIELDS = [field.attname for field in Issue._meta.concrete_fields]
+# (output key, row key, formatter) of every issue column but the id
+ISSUE_COLUMNS = [
+    (field.name, field.attname, column_formatter(field))
+    for field in Issue._meta.concrete_fields
+    if not field.primary_key
+]
+# Annotations of the list querysets, only serialized when the queryset has them
+ISSUE_ANNOTATIONS = ["cycle_id", "module_id", "bridge_id"]
+
+
+def issue_rows(issues):
+    if isinstance(issues, QuerySet):
+        annotations = [
+            name for name in ISSUE_ANNOTATIONS if name in issues.query.annotations
+        ]
+        rows = list(issues.prefetch_related(None).values(*ISSUE_FIELDS, *annotations))
+    else:
+        rows = [issue.__dict__ for issue in issues]
+        annotations = [name for name in ISSUE_ANNOTATIONS if rows and name in rows[0]]
+    return rows, annotations
+
+
+def issue_lookups(rows):
+    """load the workspaces, projects, states, labels and assignees of the
+    issue rows with one query each"""
+    issue_ids = {row["id"] for row in rows}
+
+    workspaces = {
+        workspace["id"]: workspace
+        for workspace in Workspace.objects.filter(
+            pk__in={row["workspace_id"] for row in rows}
+        ).values("name", "slug", "id")
+    }
+    projects = {
+        project["id"]: project
+        for project in Project.objects.filter(
+            pk__in={row["project_id"] for row in rows}
+        ).values("id", "identifier", "name")
+    }
+    states = {
+        state["id"]: state
+        for state in State.objects.filter(
+            pk__in={row["state_id"] for row in rows}
+        ).values("id", "name", "color", "group")
+    }
+
+    # Same ordering as the labels and assignees managers
+    labels = {}
+    issue_labels = defaultdict(list)
+    for issue_id, label_id, name, color in (
+        IssueLabel.objects.filter(issue_id__in=issue_ids)
+        .order_by("-label__created_at")
+        .values_list("issue_id", "label_id", "label__name", "label__color")
+    ):
+        if label_id not in labels:
+            labels[label_id] = {"id": label_id, "name": name, "color": color}
+        issue_labels[issue_id].append(labels[label_id])
+
+    users = {}
+    issue_assignees = defaultdict(list)
+    for (
+        issue_id,
+        assignee_id,
+        first_name,
+        last_name,
+        email,
+        avatar,
+        is_bot,
+    ) in (
+        IssueAssignee.objects.filter(issue_id__in=issue_ids)
+        .order_by("-assignee__created_at")
+        .values_list(
+            "issue_id",
+            "assignee_id",
+            "assignee__first_name",
+            "assignee__last_name",
+            "assignee__email",
+            "assignee__avatar",
+            "assignee__is_bot",
+        )
+    ):
+        if assignee_id not in users:
+            users[assignee_id] = {
+                "id": assignee_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "avatar": avatar,
+                "is_bot": is_bot,
+            }
+        issue_assignees[issue_id].append(users[assignee_id])
+
+    return {
+        "workspaces": workspaces,
+        "projects": projects,
+        "states": states,
+        "labels": labels,
+        "users": users,
+        "issue_labels": issue_labels,
+        "issue_assignees": issue_assignees,
+    }
+
+
+def flat_issue(row, annotations, lookups):
+    """the issue with foreign key ids only"""
+    issue = {"id": row["id"]}
+    for name in ("cycle_id", "module_id", "bridge_id"):
+        if name in annotations:
+            issue[name] = None if row[name] is None else str(row[name])
+
+    for key, attname, formatter in ISSUE_COLUMNS:
+        value = row[attname]
+        issue[key] = value if formatter is None or value is None else formatter(value)
+    issue["assignees"] = [user["id"] for user in lookups["issue_assignees"][row["id"]]]
+    issue["labels"] = [label["id"] for label in lookups["issue_labels"][row["id"]]]
+    return issue
+
+
+def serialize_issues(issues):
+    """serialize issues to the IssueLiteSerializer output without DRF
+
+    Args:
+        issues (QuerySet | list): issue queryset, read with values(), or
+            issues already fetched by a paginator
+
+    Returns:
+        list: issues with the same keys and values as IssueLiteSerializer
+    """
+    rows, annotations = issue_rows(issues)
+    if not rows:
+        return []
+
+    lookups = issue_lookups(rows)
+    results = []
+    for row in rows:
+        issue = {
+            "id": row["id"],
+            "workspace_detail": lookups["workspaces"].get(row["workspace_id"]),
+            "project_detail": lookups["projects"].get(row["project_id"]),
+            "state_detail": lookups["states"].get(row["state_id"]),
+            "label_details": lookups["issue_labels"][row["id"]],
+            "assignee_details": lookups["issue_assignees"][row["id"]],
+        }
+        issue.update(flat_issue(row, annotations, lookups))
+        results.append(issue)
+
+    return results
+
+
+def normalize_issues(issues, group_by=None):
+    """serialize issues with foreign key ids only, along with lookup tables
+    of their states, labels, users and projects keyed by id
+
+    Args:
+        issues (QuerySet | list): issue queryset or issues already fetched
+        group_by (string): group the issues like group_results
+
+    Returns:
+        obj: the issues and the lookup tables
+    """
+    rows, annotations = issue_rows(issues)
+    lookups = issue_lookups(rows) if rows else defaultdict(dict)
+    results = [flat_issue(row, annotations, lookups) for row in rows]
+
+    return {
+        "issues": group_results(results, group_by) if group_by else results,
+        "states": {str(pk): state for pk, state in lookups["states"].items()},
+        "labels": {str(pk): label for pk, label in lookups["labels"].items()},
+        "users": {str(pk): user for pk, user in lookups["users"].items()},
+        "projects": {str(pk): project for pk, project in lookups["projects"].items()},
+    }
+
+
+def normalize_groups(groups):
+    """normalize the pages of group_queryset with one set of lookup tables"""
+    issues = [issue for group in groups.values() for issue in group["results"]]
+    normalized = normalize_issues(issues)
+
+    results = iter(normalized["issues"])
+    for group in groups.values():
+        group["results"] = [next(results) for _ in group["results"]]
+    normalized["issues"] = groups
+    return normalized
@@ -0,0 +1,138 @@
+# Python imports
+import threading
+
+# Django imports
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+# Module imports
+from plane.utils.etag import PROJECT_COLLECTIONS, bump_project_collections
+
+# Counter column -> state group it counts, total_issues counts every issue
+STATE_GROUP_COUNTERS = {
+    "backlog_issues": "backlog",
+    "unstarted_issues": "unstarted",
+    "started_issues": "started",
+    "completed_issues": "completed",
+    "cancelled_issues": "cancelled",
+}
+ISSUE_STAT_FIELDS = ["total_issues"] + list(STATE_GROUP_COUNTERS.keys())
+
+_pending = threading.local()
+
+
+def refresh_issue_stats(model, through, field, ids):
+    """recount the per state group issue counters of cycles or modules
+
+    Args:
+        model (Model): Cycle or Module holding the counter columns
+        through (Model): CycleIssue or ModuleIssue
+        field (string): foreign key of the through model to the model
+        ids (list): ids of the cycles or modules to recount
+    """
+    ids = {str(pk) for pk in ids if pk is not None}
+    if not ids:
+        return
+
+    annotations = {"total_issues": Count("id")}
+    for counter, group in STATE_GROUP_COUNTERS.items():
+        annotations[counter] = Count("id", filter=Q(issue__state__group=group))
+
+    stats = {
+        str(row[f"{field}_id"]): row
+        for row in through.objects.filter(**{f"{field}_id__in": ids})
+        .order_by()
+        .values(f"{field}_id")
+        .annotate(**annotations)
+    }
+
+    for pk in ids:
+        row = stats.get(pk, {})
+        model.objects.filter(pk=pk).update(
+            **{counter: row.get(counter, 0) for counter in ISSUE_STAT_FIELDS}
+        )
+
+    # The counters are listed with the cycles
+    if model._meta.label in PROJECT_COLLECTIONS:
+        bump_project_collections(
+            model,
+            *model.objects.filter(pk__in=ids)
+            .values_list("project_id", flat=True)
+            .distinct(),
+        )
+
+
+def schedule_issue_stats(model, through, field, ids):
+    """recount once the current transaction commits, so deleting or moving
+    many issues in one transaction recounts every cycle or module once"""
+    if not hasattr(_pending, "stats"):
+        _pending.stats = {}
+
+    _pending.stats.setdefault((model, through, field), set()).update(
+        str(pk) for pk in ids if pk is not None
+    )
+    # The first flush after commit recounts everything pending, the later
+    # ones find nothing left. Outside of a transaction it runs right away
+    transaction.on_commit(flush_issue_stats)
+
+
+def flush_issue_stats():
+    stats, _pending.stats = getattr(_pending, "stats", {}), {}
+    for (model, through, field), ids in stats.items():
+        refresh_issue_stats(model, through, field, ids)
+
+
+def sub_issues_count_subquery(model):
+    """number of sub issues of the outer issue row"""
+    return Coalesce(
+        Subquery(
+            model.objects.filter(parent=OuterRef("pk"))
+            .order_by()
+            .values("parent")
+            .annotate(count=Count("id"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def refresh_sub_issues_count(ids):
+    """recount the sub_issues_count column of the given issues
+
+    Args:
+        ids (list): ids of the parent issues to recount
+    """
+    from plane.db.models import Issue
+
+    ids = {str(pk) for pk in ids if pk is not None}
+    if not ids:
+        return
+
+    Issue.objects.filter(pk__in=ids).update(
+        sub_issues_count=sub_issues_count_subquery(Issue)
+    )
+
+    # The count is listed with the issues
+    bump_project_collections(
+        Issue,
+        *Issue.objects.filter(pk__in=ids)
+        .values_list("project_id", flat=True)
+        .distinct(),
+    )
+
+
+def schedule_sub_issues_count(ids):
+    """recount the sub issues of the parents once the current transaction
+    commits, like the cycle and module stats"""
+    if not hasattr(_pending, "parents"):
+        _pending.parents = set()
+
+    _pending.parents.update(str(pk) for pk in ids if pk is not None)
+    transaction.on_commit(flush_sub_issues_count)
+
+
+def flush_sub_issues_count():
+    parents, _pending.parents = getattr(_pending, "parents", set()), set()
+    refresh_sub_issues_count(parents)
@@ -0,0 +1,81 @@
+# Django imports
+from django.db import connection
+
+# Module imports
+from plane.db.models import Issue, State
+
+# Deepest level returned by the sub-issue tree
+MAX_TREE_DEPTH = 20
+
+
+def issue_subtree(issue_id, project_id, max_depth=MAX_TREE_DEPTH):
+    """the issue and its descendants in the project with one recursive query
+
+    Args:
+        issue_id (uuid): root of the subtree
+        project_id (uuid): project the walk stays in, sub issues of other
+            projects and their subtrees are left out
+        max_depth (int): deepest level to walk down to, the root is level 0
+
+    Returns:
+        list: (id, parent id, depth, state group) of every node, parents
+        before their children
+    """
+    issues = Issue._meta.db_table
+    states = State._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH RECURSIVE tree AS (
+                SELECT id, parent_id, state_id, 0 AS depth, ARRAY[id] AS path
+                FROM {issues}
+                WHERE id = %s AND project_id = %s
+                UNION ALL
+                SELECT child.id, child.parent_id, child.state_id, tree.depth + 1,
+                    tree.path || child.id
+                FROM {issues} child
+                JOIN tree ON child.parent_id = tree.id
+                WHERE tree.depth < %s
+                    AND child.project_id = %s
+                    AND NOT child.id = ANY(tree.path)
+            )
+            SELECT tree.id, tree.parent_id, tree.depth, {states}."group"
+            FROM tree
+            LEFT JOIN {states} ON {states}.id = tree.state_id
+            ORDER BY tree.depth, tree.path
+            """,
+            [issue_id, project_id, max_depth, project_id],
+        )
+        return cursor.fetchall()
+
+
+def subtree_rollups(nodes):
+    """descendant counts and state group counts of the descendants of every
+    node, added up from the leaves in one pass
+
+    Args:
+        nodes (list): rows of issue_subtree
+
+    Returns:
+        obj: issue id -> descendants_count and state_groups
+    """
+    rollups = {
+        str(pk): {"descendants_count": 0, "state_groups": {}} for pk, _, _, _ in nodes
+    }
+    groups = {str(pk): group for pk, _, _, group in nodes}
+
+    # Children come after their parents, walking backwards every subtree is
+    # complete before it is added to its parent
+    for pk, parent_id, _, _ in reversed(nodes):
+        parent = rollups.get(str(parent_id)) if parent_id is not None else None
+        if parent is None or str(pk) == str(nodes[0][0]):
+            continue
+        rollup = rollups[str(pk)]
+        parent["descendants_count"] += rollup["descendants_count"] + 1
+        for group, count in rollup["state_groups"].items():
+            parent["state_groups"][group] = parent["state_groups"].get(group, 0) + count
+        if groups[str(pk)] is not None:
+            parent["state_groups"][groups[str(pk)]] = (
+                parent["state_groups"].get(groups[str(pk)], 0) + 1
+            )
+    return rollups
@@ -0,0 +1,83 @@
+# Django imports
+from django.core.cache import cache
+
+# Cached memberships are dropped on every membership write, the timeout only
+# bounds staleness for writes that skip signals (bulk_create, update)
+MEMBERSHIP_CACHE_TIMEOUT = 300
+
+
+def membership_cache_key(user_id):
+    return f"memberships:{str(user_id)}"
+
+
+def load_memberships(user_id):
+    """load the workspace and project roles of a user
+
+    Args:
+        user_id (uuid): user whose memberships are loaded
+
+    Returns:
+        obj: workspace slug -> role and project id -> workspace slug and role
+    """
+    from plane.db.models import WorkspaceMember, ProjectMember
+
+    workspaces = {
+        slug: role
+        for slug, role in WorkspaceMember.objects.filter(member_id=user_id).values_list(
+            "workspace__slug", "role"
+        )
+    }
+    projects = {
+        str(project_id): {"workspace": slug, "role": role}
+        for project_id, slug, role in ProjectMember.objects.filter(
+            member_id=user_id
+        ).values_list("project_id", "workspace__slug", "role")
+    }
+    return {"workspaces": workspaces, "projects": projects}
+
+
+def get_memberships(request):
+    """memberships of the requesting user, read once per request from the cache"""
+    memberships = getattr(request, "_plane_memberships", None)
+    if memberships is None:
+        key = membership_cache_key(request.user.id)
+        memberships = cache.get(key)
+        if memberships is None:
+            memberships = load_memberships(request.user.id)
+            cache.set(key, memberships, MEMBERSHIP_CACHE_TIMEOUT)
+        request._plane_memberships = memberships
+    return memberships
+
+
+def invalidate_memberships(*user_ids):
+    cache.delete_many(
+        [membership_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    )
+
+
+def workspace_role(request, slug):
+    return get_memberships(request)["workspaces"].get(slug)
+
+
+def project_role(request, slug, project_id):
+    project = get_memberships(request)["projects"].get(str(project_id))
+    if project is None or project["workspace"] != slug:
+        return None
+    return project["role"]
+
+
+def is_project_member_in_workspace(request, slug):
+    return any(
+        project["workspace"] == slug
+        for project in get_memberships(request)["projects"].values()
+    )
+
+
+def member_project_ids(request, slug=None):
+    """ids of the projects the requesting user is a member of, used to scope
+    querysets instead of joining project members again"""
+    return [
+        project_id
+        for project_id, project in get_memberships(request)["projects"].items()
+        if slug is None or project["workspace"] == slug
+    ]
@@ -1,8 +1,13 @@
 from rest_framework.response import Response
 from rest_framework.exceptions import ParseError
 from collections.abc import Sequence
+import base64
+import json
 import math
 
+from django.db import connection
+from django.db.models import CharField, F, Q, Value
+
 
 class Cursor:
     def __init__(self, value, offset=0, is_prev=False, has_results=None):
@@ -44,6 +49,48 @@ class Cursor:
         return cls(*bits)
 
 
+class KeysetCursor:
+    """Opaque cursor holding the ordering value and id of a boundary row"""
+
+    def __init__(self, value, pk=None, is_prev=False, has_results=None):
+        self.value = value
+        self.pk = pk
+        self.is_prev = bool(is_prev)
+        self.has_results = has_results
+
+    def __str__(self):
+        # str keeps full microsecond precision for datetimes
+        payload = json.dumps([self.value, self.pk, int(self.is_prev)], default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def __eq__(self, other):
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in ("value", "pk", "is_prev", "has_results")
+        )
+
+    def __repr__(self):
+        return "<{}: value={} pk={} is_prev={}>".format(
+            type(self).__name__,
+            self.value,
+            self.pk,
+            int(self.is_prev),
+        )
+
+    def __bool__(self):
+        return bool(self.has_results)
+
+    @classmethod
+    def from_string(cls, value):
+        try:
+            bits = json.loads(base64.urlsafe_b64decode(value.encode()).decode())
+        except (TypeError, ValueError, UnicodeError):
+            raise ValueError
+        if not isinstance(bits, list) or len(bits) != 3 or bits[1] is None:
+            raise ValueError
+        return cls(bits[0], bits[1], bits[2])
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -141,6 +188,218 @@ class OffsetPaginator:
         )
 
 
+def estimate_count(queryset):
+    """Planner row estimate for the queryset, avoids a full COUNT(*) scan"""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPaginator:
+    """
+    The Keyset paginator seeks on (order_by field, id) instead of
+    using OFFSET, so every page costs the same regardless of depth
+    http://example.com/api/issues/?cursor=<opaque>&per_page=100
+    Use together with cursor_cls=KeysetCursor
+    """
+
+    def __init__(
+        self,
+        queryset,
+        order_by="-created_at",
+        max_limit=MAX_LIMIT,
+        count_estimate=False,
+        on_results=None,
+    ):
+        self.desc = order_by.startswith("-")
+        self.field = order_by.lstrip("-")
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.count_estimate = count_estimate
+        self.on_results = on_results
+
+    def _after(self, value, pk, desc):
+        # Rows strictly after (value, pk) in postgres ordering where
+        # nulls sort last ascending and first descending
+        field = self.field
+        if desc:
+            if value is None:
+                return Q(**{f"{field}__isnull": True, "pk__lt": pk}) | Q(
+                    **{f"{field}__isnull": False}
+                )
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+        if value is None:
+            return Q(**{f"{field}__isnull": True, "pk__gt": pk})
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{field: value, "pk__gt": pk})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    def _cursor(self, row, is_prev, has_results):
+        return KeysetCursor(row.keyset_value, str(row.pk), is_prev, has_results)
+
+    def get_result(self, limit=100, cursor=None):
+        limit = min(limit, self.max_limit)
+
+        # Walking backwards is walking forwards over the reversed ordering
+        desc = self.desc
+        if cursor is not None and cursor.is_prev:
+            desc = not desc
+
+        prefix = "-" if desc else ""
+        queryset = self.queryset.annotate(keyset_value=F(self.field)).order_by(
+            f"{prefix}{self.field}", f"{prefix}pk"
+        )
+        if cursor is not None:
+            if not isinstance(cursor, KeysetCursor):
+                raise BadPaginationError("Invalid cursor for keyset pagination")
+            queryset = queryset.filter(self._after(cursor.value, cursor.pk, desc))
+
+        results = list(queryset[: limit + 1])
+        has_more = len(results) > limit
+        results = results[:limit]
+
+        if cursor is not None and cursor.is_prev:
+            results.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None
+
+        if results:
+            next_cursor = self._cursor(results[-1], False, has_next)
+            prev_cursor = self._cursor(results[0], True, has_prev)
+        else:
+            next_cursor = KeysetCursor(None, None, False, False)
+            prev_cursor = KeysetCursor(None, None, True, False)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        max_hits = None
+        if self.count_estimate:
+            max_hits = math.ceil(estimate_count(self.queryset) / limit)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=None,
+            max_hits=max_hits,
+        )
+
+
+class UnionKeysetPaginator:
+    """
+    Keyset paginator over several querysets of different models merged in
+    the database with UNION ALL, pages seek on (order_by field, id) in every
+    branch so each page costs the same regardless of depth
+    Results are (kind, instance) tuples, use together with cursor_cls=KeysetCursor
+    """
+
+    def __init__(
+        self,
+        querysets,
+        order_by="-created_at",
+        max_limit=MAX_LIMIT,
+        on_results=None,
+    ):
+        # kind -> queryset, the querysets also load the rows of a page
+        self.querysets = querysets
+        self.desc = order_by.startswith("-")
+        self.field = order_by.lstrip("-")
+        self.max_limit = max_limit
+        self.on_results = on_results
+
+    def _after(self, value, pk, desc):
+        # The merged field is never null
+        field = self.field
+        if desc:
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+        return Q(**{f"{field}__gt": value}) | Q(**{field: value, "pk__gt": pk})
+
+    def get_rows(self, limit, cursor=None, desc=None):
+        """(id, order_by value, kind) of the next limit rows, merged and
+        ordered by one UNION ALL query"""
+        desc = self.desc if desc is None else desc
+        prefix = "-" if desc else ""
+        ordering = (f"{prefix}{self.field}", f"{prefix}id")
+
+        branches = []
+        for kind, queryset in self.querysets.items():
+            queryset = queryset.select_related(None).prefetch_related(None)
+            if cursor is not None:
+                queryset = queryset.filter(self._after(cursor.value, cursor.pk, desc))
+            branch = queryset.annotate(
+                keyset_kind=Value(kind, output_field=CharField())
+            ).values_list("id", self.field, "keyset_kind")
+            # Every branch stops at the page size before the rows are merged
+            if limit is not None:
+                branch = branch.order_by(*ordering)[:limit]
+            else:
+                branch = branch.order_by()
+            branches.append(branch)
+
+        rows = branches[0].union(*branches[1:], all=True).order_by(*ordering)
+        return list(rows if limit is None else rows[:limit])
+
+    def load(self, rows):
+        """the instances of the rows with one query per kind, in row order"""
+        ids = {}
+        for pk, _, kind in rows:
+            ids.setdefault(kind, []).append(pk)
+        instances = {
+            kind: self.querysets[kind].in_bulk(kind_ids)
+            for kind, kind_ids in ids.items()
+        }
+        return [
+            (kind, instances[kind][pk]) for pk, _, kind in rows if pk in instances[kind]
+        ]
+
+    def get_result(self, limit=100, cursor=None):
+        limit = min(limit, self.max_limit)
+        if cursor is not None and not isinstance(cursor, KeysetCursor):
+            raise BadPaginationError("Invalid cursor for keyset pagination")
+
+        # Walking backwards is walking forwards over the reversed ordering
+        desc = self.desc
+        if cursor is not None and cursor.is_prev:
+            desc = not desc
+
+        rows = self.get_rows(limit + 1, cursor, desc)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if cursor is not None and cursor.is_prev:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None
+
+        if rows:
+            next_cursor = KeysetCursor(rows[-1][1], str(rows[-1][0]), False, has_next)
+            prev_cursor = KeysetCursor(rows[0][1], str(rows[0][0]), True, has_prev)
+        else:
+            next_cursor = KeysetCursor(None, None, False, False)
+            prev_cursor = KeysetCursor(None, None, True, False)
+
+        results = self.load(rows)
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=None,
+            max_hits=None,
+        )
+
+
 class BasePaginator:
     """BasePaginator class can be inherited by any View to return a paginated view"""
 
@@ -0,0 +1,150 @@
+# Python imports
+import threading
+import time
+
+# Django imports
+from django.db import connection
+from django.utils import timezone
+
+# Module imports
+from plane.utils.etag import bump_project_collections
+
+# Spacing of the ranks after a rebalance and of a move to the top
+RANK_STEP = 10000
+# Gap between neighbours below which the scope is rebalanced in the background
+RANK_REBALANCE_GAP = 1e-3
+# Step between ranks appended in the same millisecond by one process
+APPEND_RANK_STEP = 1e-3
+
+_last_rank = {"value": 0.0}
+_last_rank_lock = threading.Lock()
+
+
+def append_rank():
+    """rank after every existing item of a scope
+
+    The current time in milliseconds only grows, so appending needs no
+    aggregate over the scope and stays above the legacy 65535 + 10000 * n
+    ranks as well as the ranks handed out by rebalancing. Appends of the same
+    millisecond in a process are kept apart. Issues take their ranks from
+    the project counter instead, see IssueSequenceCounter.allocate_ranks.
+    """
+    with _last_rank_lock:
+        rank = max(time.time() * 1000, _last_rank["value"] + APPEND_RANK_STEP)
+        _last_rank["value"] = rank
+    return rank
+
+
+def rank_between(before, after):
+    """rank strictly between two neighbours, None on either side stands for
+    the end of the scope. Returns None once the gap can not be split"""
+    if before is None and after is None:
+        return append_rank()
+    if after is None:
+        return max(append_rank(), before + 1)
+    if before is None:
+        return after - RANK_STEP
+
+    rank = (before + after) / 2
+    return rank if before < rank < after else None
+
+
+def rebalance_ranks(model, field, scope):
+    """respace the ranks of a scope RANK_STEP apart, keeping their order,
+    and mark the items updated
+
+    Args:
+        model (Model): model holding the rank
+        field (string): name of the rank field
+        scope (dict): field lookups selecting the items ranked together
+    """
+    table = model._meta.db_table
+    column = model._meta.get_field(field).column
+    # A scope value of None selects the items without one, e.g. issues
+    # without a state
+    where = " AND ".join(
+        (
+            f"{model._meta.get_field(name).column} IS NULL"
+            if value is None
+            else f"{model._meta.get_field(name).column} = %s"
+        )
+        for name, value in scope.items()
+    )
+    params = [value for value in scope.values() if value is not None]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET {column} = ranked.rank, updated_at = NOW() FROM ("
+            f"SELECT id, ROW_NUMBER() OVER (ORDER BY {column}, created_at) * %s AS rank "
+            f"FROM {table} WHERE {where}"
+            f") ranked WHERE {table}.id = ranked.id",
+            [RANK_STEP, *params],
+        )
+    bump_project_collections(model, scope.get("project_id"))
+
+
+def move_rank(model, field, scope, pk, before_id=None, after_id=None):
+    """place an item between two neighbours of its scope
+
+    Args:
+        model (Model): model holding the rank
+        field (string): name of the rank field
+        scope (dict): field lookups selecting the items ranked together
+        pk (uuid): item to move
+        before_id (uuid): item to place it after, None for the top
+        after_id (uuid): item to place it before, None for the bottom
+
+    Returns:
+        float: the new rank of the item
+
+    Raises:
+        ValueError: a given neighbour is not an item of the scope
+    """
+    neighbour_ids = [str(i) for i in (before_id, after_id) if i is not None]
+
+    def neighbour_ranks():
+        ranks = {
+            str(neighbour_id): rank
+            for neighbour_id, rank in model.objects.filter(
+                pk__in=neighbour_ids, **scope
+            ).values_list("id", field)
+        }
+        return (
+            ranks.get(str(before_id)) if before_id is not None else None,
+            ranks.get(str(after_id)) if after_id is not None else None,
+        )
+
+    before, after = neighbour_ranks()
+    # A missing neighbour would silently move the item to the top or bottom
+    if (before_id is not None and before is None) or (
+        after_id is not None and after is None
+    ):
+        raise ValueError("Neighbour is not in the scope")
+    rank = rank_between(before, after)
+    if rank is None:
+        # The gap is used up, respace the scope right away and retry
+        rebalance_ranks(model, field, scope)
+        before, after = neighbour_ranks()
+        rank = rank_between(before, after)
+
+    # updated_at lets delta syncs pick up the move
+    model.objects.filter(pk=pk).update(**{field: rank, "updated_at": timezone.now()})
+    bump_project_collections(model, scope.get("project_id"))
+
+    # Respace crowded scopes before the gaps run out
+    if (
+        before is not None
+        and after is not None
+        and min(rank - before, after - rank) < RANK_REBALANCE_GAP
+    ):
+        from plane.bgtasks.rank_task import rebalance_ranks_task
+
+        rebalance_ranks_task.delay(
+            model._meta.label,
+            field,
+            {
+                name: str(value) if value is not None else None
+                for name, value in scope.items()
+            },
+        )
+
+    return rank
@@ -0,0 +1,98 @@
+def diff_ids(requested_ids, current_ids):
+    """ids to add and to remove to turn the current ids into the requested
+    ones, duplicates dropped and the given order kept
+
+    Args:
+        requested_ids (list): ids the object should be related to
+        current_ids (list): ids the object is related to
+
+    Returns:
+        obj: the added and the removed ids as strings
+    """
+    requested = list(dict.fromkeys(str(pk) for pk in requested_ids if pk is not None))
+    current = list(dict.fromkeys(str(pk) for pk in current_ids if pk is not None))
+    requested_set, current_set = set(requested), set(current)
+    return {
+        "added": [pk for pk in requested if pk not in current_set],
+        "removed": [pk for pk in current if pk not in requested_set],
+    }
+
+
+def merge_diffs(diff, later):
+    """fold a later diff of the same relation into a diff, so a run of diffs
+    reads as one diff from the state before the first"""
+    added, removed = diff.setdefault("added", []), diff.setdefault("removed", [])
+    for pk in later.get("removed", []):
+        if pk in added:
+            added.remove(pk)
+        elif pk not in removed:
+            removed.append(pk)
+    for pk in later.get("added", []):
+        if pk in removed:
+            removed.remove(pk)
+        elif pk not in added:
+            added.append(pk)
+    return diff
+
+
+def sync_relation(queryset, field, requested_ids, build):
+    """write only the difference between the rows of a join table and the
+    requested ids, unchanged rows keep their created_at
+
+    Args:
+        queryset (QuerySet): join table rows of the object
+        field (string): column holding the related id, e.g. label_id
+        requested_ids (list): ids the object should be related to
+        build (callable): unsaved join table row for an added id
+
+    Returns:
+        obj: the added and the removed ids
+    """
+    diff = diff_ids(requested_ids, queryset.values_list(field, flat=True))
+    if diff["removed"]:
+        queryset.filter(**{f"{field}__in": diff["removed"]}).delete()
+    if diff["added"]:
+        queryset.model.objects.bulk_create(
+            [build(pk) for pk in diff["added"]], ignore_conflicts=True
+        )
+    return diff
+
+
+def sync_relations(queryset, key, field, object_ids, requested_ids, build):
+    """give many objects the same related ids, with one delete and one insert
+    for all of them
+
+    Args:
+        queryset (QuerySet): join table rows of the objects
+        key (string): column holding the object id, e.g. issue_id
+        field (string): column holding the related id, e.g. label_id
+        object_ids (list): ids of the objects
+        requested_ids (list): ids every object should be related to
+        build (callable): unsaved join table row for an object id and an
+            added id
+
+    Returns:
+        obj: object id -> the added and the removed ids
+    """
+    current = {str(object_id): [] for object_id in object_ids}
+    for object_id, pk in queryset.values_list(key, field):
+        current.setdefault(str(object_id), []).append(pk)
+    diffs = {
+        object_id: diff_ids(requested_ids, current_ids)
+        for object_id, current_ids in current.items()
+    }
+
+    if any(diff["removed"] for diff in diffs.values()):
+        queryset.exclude(
+            **{f"{field}__in": [str(pk) for pk in requested_ids if pk is not None]}
+        ).delete()
+    queryset.model.objects.bulk_create(
+        [
+            build(object_id, pk)
+            for object_id, diff in diffs.items()
+            for pk in diff["added"]
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    return diffs
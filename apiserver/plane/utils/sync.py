@@ -0,0 +1,138 @@
+# Python imports
+import base64
+import json
+import threading
+from datetime import timedelta
+
+# Django imports
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.utils.etag import bump_project_collections
+
+# Writes committing this long after their updated_at are still picked up
+SYNC_OVERLAP = timedelta(seconds=5)
+# Deleted issues are kept this long, older tokens need a full refetch
+SYNC_RETENTION = timedelta(days=30)
+# Changed issues returned per sync, the rest follow with the next token
+SYNC_MAX_ISSUES = 1000
+
+
+class SyncToken:
+    """Opaque token holding the point in time a client is synced up to
+
+    A token handed out at the end of a sync is issued slightly in the past
+    by the overlap. A token continuing a truncated sync is exact and holds
+    the (updated_at, id) of the last issue sent, so issues sharing that
+    updated_at are still sent with the next page.
+    """
+
+    def __init__(self, since, exact=False, last_id=None):
+        self.since = since
+        self.exact = bool(exact)
+        self.last_id = str(last_id) if last_id is not None else None
+
+    def __str__(self):
+        payload = json.dumps([self.since.isoformat(), int(self.exact), self.last_id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @property
+    def lower_bound(self):
+        return self.since if self.exact else self.since - SYNC_OVERLAP
+
+    def changed_filter(self):
+        """filter of the issues changed after the token"""
+        if self.exact and self.last_id is not None:
+            return Q(updated_at__gt=self.since) | Q(
+                updated_at=self.since, id__gt=self.last_id
+            )
+        return Q(updated_at__gt=self.lower_bound)
+
+    def is_expired(self):
+        return self.since < timezone.now() - SYNC_RETENTION
+
+    @classmethod
+    def now(cls):
+        return cls(timezone.now())
+
+    @classmethod
+    def from_string(cls, value):
+        try:
+            bits = json.loads(base64.urlsafe_b64decode(value.encode()).decode())
+            since = parse_datetime(bits[0])
+            last_id = bits[2] if len(bits) > 2 else None
+        except (TypeError, ValueError, IndexError, UnicodeError, AttributeError):
+            raise ValueError
+        if since is None or timezone.is_naive(since):
+            raise ValueError
+        if last_id is not None and not isinstance(last_id, str):
+            raise ValueError
+        return cls(since, bits[1], last_id)
+
+
+def sync_changes(queryset, deleted_queryset, token):
+    """issues changed and deleted since the token
+
+    Args:
+        queryset (QuerySet): issues of the synced collection
+        deleted_queryset (QuerySet): DeletedIssue log of the collection
+        token (SyncToken): point the client is synced up to
+
+    Returns:
+        tuple: the changed issues in updated_at order, the deleted issue
+        ids and the token to sync from next
+    """
+    # Taken before reading so nothing written during the sync is skipped
+    next_token = SyncToken.now()
+
+    issues = list(
+        queryset.filter(token.changed_filter()).order_by("updated_at", "id")[
+            : SYNC_MAX_ISSUES + 1
+        ]
+    )
+    if len(issues) > SYNC_MAX_ISSUES:
+        issues = issues[:SYNC_MAX_ISSUES]
+        next_token = SyncToken(issues[-1].updated_at, exact=True, last_id=issues[-1].id)
+
+    # Sending a deletion twice is harmless, the boundary is included
+    deleted = list(
+        deleted_queryset.filter(created_at__gte=token.lower_bound)
+        .order_by()
+        .values_list("issue_id", flat=True)
+        .distinct()
+    )
+    return issues, deleted, next_token
+
+
+_pending = threading.local()
+
+
+def schedule_issue_touch(ids):
+    """bump updated_at of the issues once the current transaction commits,
+    for changes the delta sync reads from the issue rows but that are
+    written to other tables, like the cycle and module of an issue"""
+    if not hasattr(_pending, "issues"):
+        _pending.issues = set()
+
+    _pending.issues.update(str(pk) for pk in ids if pk is not None)
+    transaction.on_commit(flush_issue_touch)
+
+
+def flush_issue_touch():
+    issue_ids, _pending.issues = getattr(_pending, "issues", set()), set()
+    if not issue_ids:
+        return
+
+    from plane.db.models import Issue
+
+    Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+    # updated_at is listed with the issues
+    bump_project_collections(
+        Issue,
+        *Issue.objects.filter(pk__in=issue_ids)
+        .values_list("project_id", flat=True)
+        .distinct(),
+    )